@@ -0,0 +1,15 @@
+"""
+Benchmarks des algorithmes de recherche
+=======================================
+generators: graphes synthétiques reproductibles (grilles, géométriques,
+            sans échelle, graphes d'attaque en couches)
+runner:     chronométrage des implémentations et export JSON des résultats
+"""
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+_SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+if _SRC not in sys.path:
+    sys.path.append(_SRC)
@@ -0,0 +1,118 @@
+"""
+Benchmark: noyaux spécialisés de SearchStrategy vs ancienne boucle unifiée
+=========================================================================
+Compare, sur de grandes grilles synthétiques, les noyaux par stratégie
+(SearchStrategy.bfs/dfs/ucs/a_star) à l'ancienne boucle _search qui testait
+`strategy` à chaque nœud et empilait des doublons (reproduite ici sans trace).
+
+Usage:
+    python bench_kernels.py [cote_grille] [repetitions]
+"""
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+from collections import deque
+import heapq
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.generators import grid_with_obstacles
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+# ============================================
+# Référence: ancienne boucle unifiée (sans Trace)
+# ============================================
+
+def recherche_unifiee(problem, strategy, heuristics=None):
+    """Copie de l'ancienne boucle SearchStrategy._search, traces retirées"""
+    if strategy in ["dfs", "bfs"]:
+        frontiere = deque([problem.initial_state])
+    elif strategy == "ucs":
+        frontiere = [(0, problem.initial_state)]
+    elif strategy == "a-star":
+        frontiere = [(heuristics[problem.initial_state], problem.initial_state)]
+
+    explore = set()
+    parents = {}
+    cout_cumule = {problem.initial_state: 0}
+
+    while frontiere:
+        if strategy == "dfs":
+            etat_actuel = frontiere.pop()
+        elif strategy == "bfs":
+            etat_actuel = frontiere.popleft()
+        elif strategy == "ucs":
+            cout_actuel, etat_actuel = heapq.heappop(frontiere)
+            if cout_actuel != cout_cumule[etat_actuel]:
+                continue
+        elif strategy == "a-star":
+            f_actuel, etat_actuel = heapq.heappop(frontiere)
+            g_actuel = cout_cumule[etat_actuel]
+            if f_actuel != g_actuel + heuristics[etat_actuel]:
+                continue
+
+        if problem.goal_test(etat_actuel):
+            return cout_cumule[etat_actuel]
+
+        if etat_actuel not in explore:
+            explore.add(etat_actuel)
+            successeurs = [(a, problem.graph[etat_actuel][a]) for a in problem.actions(etat_actuel)]
+            for successeur, cout in successeurs:
+                nouveau_cout = cout_cumule[etat_actuel] + cout
+                if strategy in ["dfs", "bfs"]:
+                    if successeur not in explore:
+                        parents[successeur] = etat_actuel
+                        cout_cumule[successeur] = nouveau_cout
+                        frontiere.append(successeur)
+                elif strategy == "ucs":
+                    if successeur not in cout_cumule or nouveau_cout < cout_cumule[successeur]:
+                        cout_cumule[successeur] = nouveau_cout
+                        parents[successeur] = etat_actuel
+                        heapq.heappush(frontiere, (nouveau_cout, successeur))
+                elif strategy == "a-star":
+                    if successeur not in cout_cumule or nouveau_cout < cout_cumule[successeur]:
+                        cout_cumule[successeur] = nouveau_cout
+                        parents[successeur] = etat_actuel
+                        heapq.heappush(frontiere, (nouveau_cout + heuristics[successeur], successeur))
+    return None
+
+
+def chrono(fonction, repetitions: int) -> float:
+    """Meilleur temps (secondes) sur plusieurs répétitions"""
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+if __name__ == "__main__":
+    cote = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    repetitions = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    # Grille pondérée sans obstacle, coûts entiers dans [1, 9]
+    bench = grid_with_obstacles(cote * cote, obstacle_ratio=0, seed=42, max_cost=9)
+    graphe, h = bench.graph, bench.heuristic
+    problem = NavigationProblem(bench.start, bench.goal, graphe)
+
+    print("=" * 70)
+    print(f"BENCHMARK NOYAUX - grille {cote}x{cote} ({len(graphe)} nœuds)")
+    print("=" * 70)
+    print(f"{'Stratégie':<10} {'Unifiée (s)':>12} {'Noyau (s)':>12} {'Accélération':>14}")
+    print("-" * 70)
+
+    cas = [
+        ("dfs", lambda: recherche_unifiee(problem, "dfs"), lambda: SearchStrategy.dfs(problem)),
+        ("bfs", lambda: recherche_unifiee(problem, "bfs"), lambda: SearchStrategy.bfs(problem)),
+        ("ucs", lambda: recherche_unifiee(problem, "ucs"), lambda: SearchStrategy.ucs(problem)),
+        ("a-star", lambda: recherche_unifiee(problem, "a-star", h), lambda: SearchStrategy.a_star(problem, h)),
+    ]
+    for nom, ancienne, nouvelle in cas:
+        t_ancien = chrono(ancienne, repetitions)
+        t_nouveau = chrono(nouvelle, repetitions)
+        print(f"{nom:<10} {t_ancien:>12.4f} {t_nouveau:>12.4f} {t_ancien / t_nouveau:>13.2f}x")
+    print("=" * 70)
@@ -0,0 +1,232 @@
+"""
+Générateurs de graphes synthétiques (reproductibles par graine)
+===============================================================
+Tous les générateurs retournent un BenchGraph: graphe dict-of-dicts
+{état: {voisin: coût}}, départ, but, coordonnées éventuelles et une
+heuristique admissible vers le but (utilisable par A*).
+"""
+# -*- coding: utf-8 -*-
+
+from collections import deque
+import math
+import random
+from typing import Any, Dict, Optional, Tuple
+
+
+class BenchGraph:
+    """Graphe de benchmark et sa requête (départ, but)"""
+
+    def __init__(self, family: str, graph: Dict[Any, Dict[Any, float]], start: Any, goal: Any,
+                 heuristic: Dict[Any, float], coords: Optional[Dict[Any, Tuple[float, float]]] = None,
+                 seed: int = 0):
+        self.family = family
+        self.graph = graph
+        self.start = start
+        self.goal = goal
+        self.heuristic = heuristic
+        self.coords = coords
+        self.seed = seed
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.graph)
+
+    @property
+    def num_edges(self) -> int:
+        return sum(len(voisins) for voisins in self.graph.values())
+
+    def __repr__(self) -> str:
+        return (f"BenchGraph({self.family}, nodes={self.num_nodes}, edges={self.num_edges}, "
+                f"{self.start!r} -> {self.goal!r})")
+
+
+def hop_heuristic(graph: Dict[Any, Dict[Any, float]], goal: Any) -> Dict[Any, float]:
+    """
+    Nombre minimal d'arêtes jusqu'au but multiplié par le plus petit coût d'arête:
+    admissible pour n'importe quel graphe (BFS sur le graphe inverse).
+    Les états qui n'atteignent pas le but reçoivent 0.
+    """
+    inverse: Dict[Any, list] = {}
+    cout_min = math.inf
+    for etat, voisins in graph.items():
+        for voisin, cout in voisins.items():
+            inverse.setdefault(voisin, []).append(etat)
+            cout_min = min(cout_min, cout)
+    if cout_min == math.inf:
+        cout_min = 0
+    sauts = {goal: 0}
+    file = deque([goal])
+    while file:
+        etat = file.popleft()
+        for predecesseur in inverse.get(etat, ()):
+            if predecesseur not in sauts:
+                sauts[predecesseur] = sauts[etat] + 1
+                file.append(predecesseur)
+    return {etat: sauts.get(etat, 0) * cout_min for etat in graph}
+
+
+# ============================================
+# Grille 2D avec obstacles
+# ============================================
+
+def grid_with_obstacles(n: int, obstacle_ratio: float = 0.2, seed: int = 0,
+                        max_cost: int = 1) -> BenchGraph:
+    """
+    Grille ~n cellules (côté √n), 4-connexe, une fraction de cellules
+    bloquées. Coût 1, ou entier aléatoire dans [1, max_cost] par arête.
+    Départ et but aux coins opposés (toujours libres).
+    Heuristique: distance de Manhattan (admissible: coût minimal 1).
+    """
+    rng = random.Random(seed)
+    cote = max(2, math.isqrt(n))
+    libre = [[rng.random() >= obstacle_ratio for _ in range(cote)] for _ in range(cote)]
+    libre[0][0] = libre[cote - 1][cote - 1] = True
+
+    graphe: Dict[str, Dict[str, float]] = {}
+    coords = {}
+    for x in range(cote):
+        for y in range(cote):
+            if not libre[x][y]:
+                continue
+            nom = f"{x},{y}"
+            coords[nom] = (x, y)
+            voisins = {}
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < cote and 0 <= ny < cote and libre[nx][ny]:
+                    voisins[f"{nx},{ny}"] = rng.randint(1, max_cost) if max_cost > 1 else 1
+            graphe[nom] = voisins
+
+    but = f"{cote - 1},{cote - 1}"
+    h = {nom: abs(x - (cote - 1)) + abs(y - (cote - 1)) for nom, (x, y) in coords.items()}
+    return BenchGraph("grid", graphe, "0,0", but, h, coords, seed)
+
+
+# ============================================
+# Graphe géométrique aléatoire (type réseau routier)
+# ============================================
+
+def random_geometric(n: int, degree: float = 6.0, seed: int = 0) -> BenchGraph:
+    """
+    n points uniformes dans le carré unité, reliés (dans les deux sens) s'ils
+    sont à distance < r, r choisi pour un degré moyen ≈ `degree`. Coût d'une
+    arête = longueur euclidienne × facteur de détour dans [1, 1.5].
+    Heuristique: distance euclidienne (admissible). Départ et but: états de la
+    plus grande composante les plus proches de (0, 0) et de (1, 1).
+    """
+    rng = random.Random(seed)
+    rayon = math.sqrt(degree / (math.pi * max(n, 1)))
+    points = [(rng.random(), rng.random()) for _ in range(n)]
+
+    # Grille de seaux de côté r: seuls les seaux voisins sont comparés
+    seaux: Dict[Tuple[int, int], list] = {}
+    for i, (x, y) in enumerate(points):
+        seaux.setdefault((int(x / rayon), int(y / rayon)), []).append(i)
+
+    graphe: Dict[int, Dict[int, float]] = {i: {} for i in range(n)}
+    for (bx, by), membres in seaux.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for j in seaux.get((bx + dx, by + dy), ()):
+                    xj, yj = points[j]
+                    for i in membres:
+                        if i < j:
+                            d = math.hypot(points[i][0] - xj, points[i][1] - yj)
+                            if d < rayon:
+                                cout = d * rng.uniform(1.0, 1.5)
+                                graphe[i][j] = cout
+                                graphe[j][i] = cout
+
+    # Départ et but dans la plus grande composante (petits graphes parfois non connexes)
+    composante, vus = set(), set()
+    for racine in range(n):
+        if racine in vus:
+            continue
+        courante = {racine}
+        file = deque([racine])
+        while file:
+            for voisin in graphe[file.popleft()]:
+                if voisin not in courante:
+                    courante.add(voisin)
+                    file.append(voisin)
+        vus |= courante
+        if len(courante) > len(composante):
+            composante = courante
+    depart = min(composante, key=lambda i: points[i][0] + points[i][1])
+    but = max(composante, key=lambda i: points[i][0] + points[i][1])
+    gx, gy = points[but]
+    h = {i: math.hypot(x - gx, y - gy) for i, (x, y) in enumerate(points)}
+    coords = dict(enumerate(points))
+    return BenchGraph("geometric", graphe, depart, but, h, coords, seed)
+
+
+# ============================================
+# Graphe sans échelle (Barabási–Albert)
+# ============================================
+
+def scale_free(n: int, m: int = 3, seed: int = 0) -> BenchGraph:
+    """
+    Attachement préférentiel: chaque nouvel état se relie à m états existants
+    choisis proportionnellement à leur degré (arêtes dans les deux sens,
+    coûts entiers dans [1, 9]). Départ: dernier état ajouté; but: le premier.
+    """
+    rng = random.Random(seed)
+    m = max(1, min(m, n - 1))
+    graphe: Dict[int, Dict[int, float]] = {i: {} for i in range(n)}
+    # Chaque extrémité d'arête apparaît une fois: tirage uniforme = tirage au prorata du degré
+    extremites = list(range(m))
+    for nouveau in range(m, n):
+        cibles = set()
+        while len(cibles) < m:
+            cibles.add(rng.choice(extremites))
+        for cible in cibles:
+            cout = rng.randint(1, 9)
+            graphe[nouveau][cible] = cout
+            graphe[cible][nouveau] = cout
+            extremites.extend((nouveau, cible))
+    depart, but = n - 1, 0
+    return BenchGraph("scale-free", graphe, depart, but, hop_heuristic(graphe, but), None, seed)
+
+
+# ============================================
+# Graphe d'attaque en couches (cf. tp_cybersecurity.py)
+# ============================================
+
+def layered_attack_graph(n: int, fanout: int = 3, seed: int = 0) -> BenchGraph:
+    """
+    Graphe orienté acyclique External → couches d'états de compromission →
+    RootAccess, profond (≈ √n couches de ≈ √n états). Chaque état mène à
+    `fanout` états de la couche suivante; coûts entiers dans [1, 5].
+    """
+    rng = random.Random(seed)
+    couches = max(2, math.isqrt(n))
+    largeur = max(1, n // couches)
+    nom = "L{}_N{}".format
+
+    graphe: Dict[str, Dict[str, float]] = {"External": {}, "RootAccess": {}}
+    for j in rng.sample(range(largeur), min(fanout, largeur)):
+        graphe["External"][nom(0, j)] = rng.randint(1, 5)
+    for couche in range(couches):
+        for i in range(largeur):
+            if couche + 1 < couches:
+                suivants = rng.sample(range(largeur), min(fanout, largeur))
+                graphe[nom(couche, i)] = {nom(couche + 1, j): rng.randint(1, 5) for j in suivants}
+            else:
+                graphe[nom(couche, i)] = {"RootAccess": rng.randint(1, 5)}
+    return BenchGraph("attack", graphe, "External", "RootAccess",
+                      hop_heuristic(graphe, "RootAccess"), None, seed)
+
+
+GENERATORS = {
+    "grid": grid_with_obstacles,
+    "geometric": random_geometric,
+    "scale-free": scale_free,
+    "attack": layered_attack_graph,
+}
+
+
+def generate(family: str, n: int, seed: int = 0) -> BenchGraph:
+    """Graphe de la famille demandée avec ≈ n états"""
+    if family not in GENERATORS:
+        raise ValueError(f"Famille inconnue: {family} (choix: {', '.join(GENERATORS)})")
+    return GENERATORS[family](n, seed=seed)
@@ -0,0 +1,239 @@
+"""
+Runner de benchmarks des algorithmes de recherche
+=================================================
+Chronomètre, pour chaque famille de graphes et chaque taille:
+  - SearchStrategy.bfs/dfs/ucs/a_star            (src/problem_solving_agent.py)
+  - VillesMarocSearchStrategy.bfs/dfs/ucs/a_star (notebooks/tp_villes_maroc.py)
+  - BFS/DFS/UCS/A_star de l'agent de sécurité    (notebooks/security-agent-python.py)
+et écrit les résultats en JSON (un enregistrement par mesure) pour comparer
+les commits entre eux.
+
+Usage:
+    python benchmarks/runner.py --families grid geometric --sizes 1000 10000 \\
+        --repetitions 3 --output resultats.json
+"""
+# -*- coding: utf-8 -*-
+
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from benchmarks.generators import GENERATORS, BenchGraph, generate
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+NOTEBOOKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'notebooks')
+
+# (chemin, coût, nœuds développés ou None)
+Mesure = Tuple[Optional[List[Any]], float, Optional[int]]
+
+
+# ============================================
+# Implémentations chronométrées
+# ============================================
+
+_MODULES: Dict[str, Dict[str, Any]] = {}
+
+
+def _notebook(fichier: str) -> Dict[str, Any]:
+    """Exécute une seule fois un script de notebooks/ (sorties masquées) et retourne ses globales"""
+    if fichier not in _MODULES:
+        with contextlib.redirect_stdout(io.StringIO()):
+            _MODULES[fichier] = runpy.run_path(os.path.join(NOTEBOOKS, fichier), run_name="benchmark")
+    return _MODULES[fichier]
+
+
+def _cout_chemin(graphe, chemin) -> float:
+    if chemin is None:
+        return float("inf")
+    return sum(graphe[a][b] for a, b in zip(chemin, chemin[1:]))
+
+
+def _search_strategy(methode: str):
+    def preparer(bench: BenchGraph) -> Callable[[], Mesure]:
+        probleme = NavigationProblem(bench.start, bench.goal, bench.graph)
+        recherche = getattr(SearchStrategy, methode)
+
+        def lancer() -> Mesure:
+            r = recherche(probleme, bench.heuristic) if methode == "a_star" else recherche(probleme)
+            return r.path, r.cost, r.nodes_expanded
+        return lancer
+    return preparer
+
+
+def _villes_maroc(methode: str):
+    def preparer(bench: BenchGraph) -> Callable[[], Mesure]:
+        strategie = _notebook("tp_villes_maroc.py")["VillesMarocSearchStrategy"]
+        probleme = NavigationProblem(bench.start, bench.goal, bench.graph)
+        recherche = getattr(strategie, methode)
+
+        def lancer() -> Mesure:
+            if methode == "a_star":
+                chemin = recherche(probleme, bench.heuristic, verbose=False)
+            else:
+                chemin = recherche(probleme, verbose=False)
+            return chemin, _cout_chemin(bench.graph, chemin), None
+        return lancer
+    return preparer
+
+
+def _security_agent(fonction: str):
+    def preparer(bench: BenchGraph) -> Callable[[], Mesure]:
+        module = _notebook("security-agent-python.py")
+        # Ce script représente le graphe par des listes de (voisin, coût)
+        graphe = {etat: list(voisins.items()) for etat, voisins in bench.graph.items()}
+        probleme = module["ProblemeSurveillance"](bench.start, bench.goal, graphe)
+        recherche = module[fonction]
+
+        def lancer() -> Mesure:
+            if fonction == "A_star":
+                noeud, explores = recherche(probleme, bench.heuristic)
+            else:
+                noeud, explores = recherche(probleme)
+            if noeud is None:
+                return None, float("inf"), explores
+            return noeud.chemin(), noeud.cout, explores
+        return lancer
+    return preparer
+
+
+# nom -> (préparation, taille maximale raisonnable en nombre d'états)
+IMPLEMENTATIONS: Dict[str, Tuple[Callable[[BenchGraph], Callable[[], Mesure]], int]] = {
+    "search_strategy.bfs": (_search_strategy("bfs"), 10 ** 7),
+    "search_strategy.dfs": (_search_strategy("dfs"), 10 ** 7),
+    "search_strategy.ucs": (_search_strategy("ucs"), 10 ** 7),
+    "search_strategy.a_star": (_search_strategy("a_star"), 10 ** 7),
+    "villes_maroc.bfs": (_villes_maroc("bfs"), 10 ** 6),
+    "villes_maroc.dfs": (_villes_maroc("dfs"), 10 ** 6),
+    "villes_maroc.ucs": (_villes_maroc("ucs"), 10 ** 6),
+    "villes_maroc.a_star": (_villes_maroc("a_star"), 10 ** 6),
+    # Ce BFS n'élimine jamais les doublons de la frontière (`enfant not in frontiere`
+    # compare des Noeud par identité): explosion combinatoire dès qu'il y a des cycles
+    "security_agent.BFS": (_security_agent("BFS"), 64),
+    "security_agent.DFS": (_security_agent("DFS"), 10 ** 6),
+    "security_agent.UCS": (_security_agent("UCS"), 10 ** 6),
+    "security_agent.A_star": (_security_agent("A_star"), 10 ** 6),
+}
+
+
+# ============================================
+# Exécution
+# ============================================
+
+def _chrono(lancer: Callable[[], Mesure], repetitions: int) -> Tuple[List[float], Mesure]:
+    temps, mesure = [], None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        mesure = lancer()
+        temps.append(time.perf_counter() - debut)
+    return temps, mesure
+
+
+def run(families: List[str], sizes: List[int], implementations: List[str],
+        repetitions: int = 3, seed: int = 0, budget_s: float = 10.0,
+        verbose: bool = True) -> List[Dict[str, Any]]:
+    """
+    Chronomètre chaque implémentation sur chaque (famille, taille); retourne les enregistrements.
+    Une implémentation qui dépasse `budget_s` secondes n'est plus mesurée
+    sur les tailles suivantes de la même famille (statut "over-budget").
+    """
+    resultats = []
+    for famille in families:
+        hors_budget = set()
+        for taille in sorted(sizes):
+            bench = generate(famille, taille, seed)
+            if verbose:
+                print(f"\n▶ {bench}")
+            for nom in implementations:
+                preparer, taille_max = IMPLEMENTATIONS[nom]
+                enregistrement = {
+                    "family": famille, "size": taille, "seed": seed,
+                    "nodes": bench.num_nodes, "edges": bench.num_edges,
+                    "implementation": nom, "repetitions": repetitions,
+                }
+                if bench.num_nodes > taille_max:
+                    enregistrement["status"] = "skipped"
+                elif nom in hors_budget:
+                    enregistrement["status"] = "over-budget"
+                else:
+                    temps, (chemin, cout, developpes) = _chrono(preparer(bench), repetitions)
+                    enregistrement.update(
+                        status="ok", best_s=min(temps), mean_s=sum(temps) / len(temps),
+                        found=chemin is not None, cost=cout if chemin is not None else None,
+                        path_length=len(chemin) if chemin is not None else None,
+                        expanded=developpes)
+                    if min(temps) > budget_s:
+                        hors_budget.add(nom)
+                resultats.append(enregistrement)
+                if verbose:
+                    _afficher(enregistrement)
+    return resultats
+
+
+def _afficher(e: Dict[str, Any]) -> None:
+    if e["status"] != "ok":
+        print(f"   {e['implementation']:<26} {e['status']}")
+        return
+    cout = f"{e['cost']:.2f}" if e["found"] else "—"
+    print(f"   {e['implementation']:<26} {e['best_s'] * 1000:>10.2f} ms   coût {cout:>10}   "
+          f"développés {e['expanded'] if e['expanded'] is not None else '—'}")
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(resultats: List[Dict[str, Any]], path: str) -> None:
+    """Écrit les résultats et le contexte d'exécution (commit, Python, machine) en JSON"""
+    document = {
+        "meta": {
+            "commit": _commit(),
+            "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+        },
+        "results": resultats,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+
+
+def _selection(motifs: List[str]) -> List[str]:
+    noms = [nom for nom in IMPLEMENTATIONS if any(fnmatch.fnmatch(nom, m) for m in motifs)]
+    if not noms:
+        raise SystemExit(f"Aucune implémentation ne correspond à {motifs}")
+    return noms
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark des algorithmes de recherche")
+    parser.add_argument("--families", nargs="+", default=list(GENERATORS), choices=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[1_000, 10_000])
+    parser.add_argument("--impls", nargs="+", default=["*"],
+                        help="motifs de noms, ex: 'search_strategy.*' 'security_agent.UCS'")
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=10.0,
+                        help="secondes au-delà desquelles une implémentation saute les tailles suivantes")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    resultats = run(args.families, args.sizes, _selection(args.impls), args.repetitions,
+                    args.seed, args.budget)
+    write_results(resultats, args.output)
+    print(f"\n✅ {len(resultats)} mesures écrites dans {args.output}")
@@ -17,7 +17,7 @@ Description:
 import sys
 sys.path.append('../src')
 
-from problem_solving_agent import bfs, dfs, ucs, astar
+from problem_solving_agent import bfs, dfs, ucs, astar, Trace
 
 # ============================================
 # EXERCICE 1 - CONSTRUCTION DU GRAPHE
@@ -62,19 +62,19 @@ print("="*60)
 print("\n" + "-"*60)
 print("🔍 BFS - Breadth First Search (Recherche en Largeur)")
 print("-"*60)
-chemin_bfs = bfs(graphe, etat_initial, etat_but)
+chemin_bfs = bfs(graphe, etat_initial, etat_but, observer=Trace())
 
 # --- DFS ---
 print("\n" + "-"*60)
 print("🔍 DFS - Depth First Search (Recherche en Profondeur)")
 print("-"*60)
-chemin_dfs = dfs(graphe, etat_initial, etat_but)
+chemin_dfs = dfs(graphe, etat_initial, etat_but, observer=Trace())
 
 # --- UCS ---
 print("\n" + "-"*60)
 print("🔍 UCS - Uniform Cost Search (Recherche à Coût Uniforme)")
 print("-"*60)
-chemin_ucs = ucs(graphe, etat_initial, etat_but)
+chemin_ucs = ucs(graphe, etat_initial, etat_but, observer=Trace())
 
 # ============================================
 # EXERCICE 3 - HEURISTIQUE ET A*
@@ -106,7 +106,7 @@ for etat, h in heuristique.items():
 print("\n" + "-"*60)
 print("🔍 A* Search (Recherche A*)")
 print("-"*60)
-chemin_astar = astar(graphe, etat_initial, etat_but, heuristique)
+chemin_astar = astar(graphe, etat_initial, etat_but, heuristique, observer=Trace())
 
 # ============================================
 # EXERCICE 4 - COMPARAISON DES RÉSULTATS
@@ -115,16 +115,7 @@ print("\n\n" + "="*60)
 print("EXERCICE 4 - COMPARAISON DES ALGORITHMES")
 print("="*60)
 
-def calculer_cout(chemin, graphe):
-    """Calcule le coût total d'un chemin"""
-    if not chemin:
-        return float('inf')
-    cout = 0
-    for i in range(len(chemin) - 1):
-        cout += graphe[chemin[i]][chemin[i+1]]
-    return cout
-
-# Stocker les résultats
+# Stocker les résultats (chaque SearchResult porte déjà son coût et ses statistiques)
 resultats = {
     "BFS": chemin_bfs,
     "DFS": chemin_dfs,
@@ -133,17 +124,16 @@ resultats = {
 }
 
 # Affichage comparatif
-print(f"\n{'Algorithme':<12} | {'Chemin':<55} | {'Coût':<6} | {'Nœuds':<6}")
-print("-"*90)
+print(f"\n{'Algorithme':<12} | {'Chemin':<55} | {'Coût':<6} | {'Nœuds':<6} | {'Explorés':<8}")
+print("-"*101)
 
 for algo, chemin in resultats.items():
     if chemin:
         chemin_str = " → ".join(chemin)
-        cout = calculer_cout(chemin, graphe)
         nb_noeuds = len(chemin)
-        print(f"{algo:<12} | {chemin_str:<55} | {cout:<6} | {nb_noeuds:<6}")
+        print(f"{algo:<12} | {chemin_str:<55} | {chemin.cost:<6} | {nb_noeuds:<6} | {chemin.nodes_expanded:<8}")
     else:
-        print(f"{algo:<12} | {'Aucun chemin trouvé':<55} | {'-':<6} | {'-':<6}")
+        print(f"{algo:<12} | {'Aucun chemin trouvé':<55} | {'-':<6} | {'-':<6} | {'-':<8}")
 
 # ============================================
 # CONCLUSION
@@ -17,7 +17,7 @@ import sys
 sys.path.append('../src')
 
 # Importation des fonctions depuis src/problem_solving_agent.py
-from problem_solving_agent import bfs, dfs, ucs, astar
+from problem_solving_agent import bfs, dfs, ucs, astar, Trace
 
 # ============================================
 # EXERCICE 1 - CONSTRUCTION DU GRAPHE
@@ -80,19 +80,19 @@ print("="*70)
 print("\n" + "-"*60)
 print("🔍 BFS - Breadth First Search (Recherche en Largeur)")
 print("-"*60)
-chemin_bfs = bfs(graphe, etat_initial, etat_but)
+chemin_bfs = bfs(graphe, etat_initial, etat_but, observer=Trace())
 
 # --- DFS ---
 print("\n" + "-"*60)
 print("🔍 DFS - Depth First Search (Recherche en Profondeur)")
 print("-"*60)
-chemin_dfs = dfs(graphe, etat_initial, etat_but)
+chemin_dfs = dfs(graphe, etat_initial, etat_but, observer=Trace())
 
 # --- UCS ---
 print("\n" + "-"*60)
 print("🔍 UCS - Uniform Cost Search (Recherche à Coût Uniforme)")
 print("-"*60)
-chemin_ucs = ucs(graphe, etat_initial, etat_but)
+chemin_ucs = ucs(graphe, etat_initial, etat_but, observer=Trace())
 
 # ============================================
 # EXERCICE 4 - HEURISTIQUE ET A*
@@ -127,7 +127,7 @@ for zone, h in heuristique.items():
 print("\n" + "-"*60)
 print("🔍 A* Search (Recherche A*)")
 print("-"*60)
-chemin_astar = astar(graphe, etat_initial, etat_but, heuristique)
+chemin_astar = astar(graphe, etat_initial, etat_but, heuristique, observer=Trace())
 
 # ============================================
 # EXERCICE 5 - COMPARAISON DES RÉSULTATS
@@ -136,16 +136,7 @@ print("\n\n" + "="*70)
 print("EXERCICE 5 - COMPARAISON DES ALGORITHMES")
 print("="*70)
 
-def calculer_cout(chemin, graphe):
-    """Calcule le coût total d'un chemin (temps en minutes)"""
-    if not chemin:
-        return float('inf')
-    cout = 0
-    for i in range(len(chemin) - 1):
-        cout += graphe[chemin[i]][chemin[i+1]]
-    return cout
-
-# Stocker les résultats
+# Stocker les résultats (chaque SearchResult porte déjà son coût et ses statistiques)
 resultats = {
     "BFS": chemin_bfs,
     "DFS": chemin_dfs,
@@ -160,7 +151,7 @@ print("-"*80)
 for algo, chemin in resultats.items():
     if chemin:
         chemin_str = " → ".join(chemin)
-        cout = calculer_cout(chemin, graphe)
+        cout = chemin.cost
         print(f"{algo:<12} | {chemin_str:<50} | {cout:<10}")
     else:
         print(f"{algo:<12} | {'Aucun chemin trouvé':<50} | {'-':<10}")
@@ -174,7 +165,7 @@ print("="*70)
 
 # Utiliser le meilleur chemin (A* ou UCS)
 meilleur_chemin = chemin_astar if chemin_astar else chemin_ucs
-meilleur_cout = calculer_cout(meilleur_chemin, graphe)
+meilleur_cout = meilleur_chemin.cost
 
 print(f"\n🤖 AGENT DE SÉCURITÉ - MISSION DE SURVEILLANCE")
 print("-"*50)
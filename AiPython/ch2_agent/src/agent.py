@@ -1,4 +1,10 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
+import copy
+import io
+import sys
+import threading
 from typing import Dict, List, Optional, Tuple
 
 # Types de base
@@ -10,9 +16,14 @@ Action = str
 # Agent abstrait
 # ----------------------------
 class Agent(ABC):
-    def __init__(self, name: str):
+    # Attributs partagés avec l'environnement (problème, graphe, ...): en pas
+    # parallèle "process", ils ne sont jamais recopiés depuis le processus de travail
+    shared_state: Tuple[str, ...] = ()
+
+    def __init__(self, name: str, history=None):
         self.name = name
-        self.history: List[Tuple[Percept, Action]] = []
+        # Liste par défaut; voir history.make_history pour un historique borné ou en colonnes
+        self.history: List[Tuple[Percept, Action]] = history if history is not None else []
         self.performance = 0.0
     
     @abstractmethod
@@ -29,6 +40,8 @@ class Agent(ABC):
 class Environment(ABC):
     def __init__(self):
         self.agents = []
+        self.executor: Optional[Executor] = None  # pas parallèle désactivé par défaut
+        self._process_pool = False
     
     @abstractmethod
     def get_percepts(self, agent: Agent) -> Percept:
@@ -40,14 +53,73 @@ class Environment(ABC):
         """Applique l'action d'un agent à l'environnement"""
         pass
     
+    def set_parallel(self, mode: Optional[str] = "thread", workers: Optional[int] = None) -> None:
+        """
+        Active le pas parallèle ("thread" ou "process") ou le désactive (None).
+
+        En mode parallèle, step() calcule d'abord les percepts de tous les
+        agents, évalue tous les programmes dans le pool, puis applique les
+        actions (et réécrit les sorties console) dans l'ordre de self.agents.
+        Le résultat est identique à la boucle séquentielle tant que les
+        percepts d'un agent ne dépendent pas des actions des agents qui le
+        précèdent dans le même pas (agents sur des cartes indépendantes,
+        environnement qui ne change qu'à apply_action d'un autre pas, ...).
+
+        Mode "process": agents et percepts doivent être picklables. Chaque
+        agent est envoyé sans son historique; au retour, seuls ses attributs
+        propres sont recopiés (hors agent.shared_state: problème, graphe, ...,
+        qui restent les objets de l'environnement) et les nouvelles entrées
+        d'historique sont ajoutées à agent.history. Utile seulement si
+        program() est coûteux (recherche complète).
+        """
+        if self.executor is not None:
+            self.executor.shutdown()
+        if mode is None:
+            self.executor = None
+        elif mode == "thread":
+            self.executor = ThreadPoolExecutor(workers)
+        elif mode == "process":
+            self.executor = ProcessPoolExecutor(workers)
+        else:
+            raise ValueError(f"Mode parallèle inconnu: {mode}")
+        self._process_pool = mode == "process"
+
     def step(self) -> None:
         """Exécute un pas de simulation pour tous les agents"""
+        if self.executor is not None:
+            self._parallel_step()
+            return
         for agent in self.agents:
             percept = self.get_percepts(agent)
             action = agent.program(percept)
             if action is not None:
                 self.apply_action(agent, action)
     
+    def _parallel_step(self) -> None:
+        agents = list(self.agents)
+        percepts = [self.get_percepts(agent) for agent in agents]
+        if self._process_pool:
+            resultats = []
+            envois = [_without_history(agent) for agent in agents]
+            for agent, (action, etat, entrees, sortie) in zip(
+                    agents, self.executor.map(_program_in_process, envois, percepts)):
+                agent.__dict__.update(etat)
+                for entree in entrees:
+                    agent.history.append(entree)
+                resultats.append((action, sortie))
+        else:
+            console = _ThreadLocalStdout(sys.stdout)
+            sys.stdout = console
+            try:
+                resultats = list(self.executor.map(console.call, agents, percepts))
+            finally:
+                sys.stdout = console.original
+        # Application dans l'ordre séquentiel, sorties console comprises
+        for agent, (action, sortie) in zip(agents, resultats):
+            sys.stdout.write(sortie)
+            if action is not None:
+                self.apply_action(agent, action)
+
     def run(self, steps: int = 100) -> None:
         """Exécute la simulation pour un nombre donné d'étapes"""
         for _ in range(steps):
@@ -59,6 +131,55 @@ class Environment(ABC):
         """Détermine si la simulation est terminée"""
         return False
 
+    def action_duration(self, agent: Agent, percept: Percept, action: Action) -> float:
+        """Durée simulée d'une action (utilisée par EventScheduler, 1 par défaut)"""
+        return 1.0
+
+
+def _without_history(agent: Agent) -> Agent:
+    """Copie superficielle envoyée au processus de travail: historique vide (rien à sérialiser)"""
+    leger = copy.copy(agent)
+    leger.history = []
+    return leger
+
+
+def _program_in_process(agent: Agent, percept: Percept):
+    """
+    Exécuté dans un processus de travail: action, attributs propres de
+    l'agent (sans historique ni agent.shared_state), nouvelles entrées
+    d'historique et sortie console
+    """
+    sortie = io.StringIO()
+    with redirect_stdout(sortie):
+        action = agent.program(percept)
+    exclus = set(agent.shared_state)
+    exclus.add("history")
+    etat = {nom: valeur for nom, valeur in agent.__dict__.items() if nom not in exclus}
+    return action, etat, list(agent.history), sortie.getvalue()
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """sys.stdout temporaire: chaque thread de travail écrit dans son propre tampon"""
+
+    def __init__(self, original):
+        self.original = original
+        self._local = threading.local()
+
+    def write(self, texte: str) -> int:
+        tampon = getattr(self._local, "tampon", None)
+        return (tampon if tampon is not None else self.original).write(texte)
+
+    def flush(self) -> None:
+        self.original.flush()
+
+    def call(self, agent: Agent, percept: Percept):
+        self._local.tampon = io.StringIO()
+        try:
+            action = agent.program(percept)
+            return action, self._local.tampon.getvalue()
+        finally:
+            self._local.tampon = None
+
 
 
 # ----------------------------
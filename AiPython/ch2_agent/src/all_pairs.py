@@ -0,0 +1,182 @@
+import heapq
+import json
+import os
+import time
+from typing import Any, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: seul ce module en dépend
+    np = None
+
+from csr_graph import CSRGraph, name_from_json, name_to_json
+from problem_solving_agent import SearchResult
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("all_pairs nécessite NumPy (pip install numpy)")
+
+
+# ----------------------------
+# Plus courts chemins entre toutes les paires
+# ----------------------------
+class AllPairsShortestPaths:
+    """
+    Matrice dense des distances et matrice des prochains sauts pour les graphes
+    de taille petite ou moyenne (bâtiments, quartiers).
+
+    dist[i, j]  = coût du plus court chemin de i à j (inf si inaccessible)
+    next[i, j]  = premier état après i sur ce chemin (-1 si inaccessible)
+
+    distance() est en O(1), path() en O(longueur du chemin).
+    """
+
+    DIST_FILE = "dist.npy"
+    NEXT_FILE = "next.npy"
+    NAMES_FILE = "names.json"
+
+    def __init__(self, names: List[Any], dist, next_hop):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.dist = dist
+        self.next = next_hop
+
+    # ----------------------------
+    # Construction
+    # ----------------------------
+    @classmethod
+    def build(cls, graph, method: str = "auto", dense_threshold: float = 0.05,
+              verbose: bool = False) -> "AllPairsShortestPaths":
+        """
+        Construit les matrices depuis un graphe dict ou CSRGraph.
+        method: "floyd-warshall" (vectorisé, O(n³) mais en NumPy),
+                "dijkstra" (une recherche par source, adapté aux graphes peu denses),
+                "auto" (Floyd–Warshall si densité m / n² >= dense_threshold).
+        """
+        _require_numpy()
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = len(graph)
+        if method == "auto":
+            densite = graph.num_edges / (n * n) if n else 0.0
+            method = "floyd-warshall" if densite >= dense_threshold else "dijkstra"
+
+        debut = time.perf_counter()
+        if method == "floyd-warshall":
+            dist, next_hop = cls._floyd_warshall(graph)
+        elif method == "dijkstra":
+            dist, next_hop = cls._repeated_dijkstra(graph)
+        else:
+            raise ValueError(f"Méthode inconnue: {method}")
+        if verbose:
+            print(f"✅ Matrice {n}x{n} calculée par {method} en {time.perf_counter() - debut:.2f}s")
+        return cls(list(graph.names), dist, next_hop)
+
+    @staticmethod
+    def _initial_matrices(graph: CSRGraph):
+        n = len(graph)
+        dist = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+        offsets = np.asarray(graph.offsets, dtype=np.int64)
+        sources = np.repeat(np.arange(n), np.diff(offsets))
+        cibles = np.asarray(graph.targets, dtype=np.int64)
+        couts = np.asarray(graph.costs, dtype=np.float64)
+        # Arêtes parallèles: on garde la moins chère (ordre décroissant, la dernière écrite gagne)
+        ordre = np.argsort(-couts, kind="stable")
+        dist[sources[ordre], cibles[ordre]] = couts[ordre]
+        next_hop[sources, cibles] = cibles
+        diagonale = np.arange(n)
+        dist[diagonale, diagonale] = 0.0
+        next_hop[diagonale, diagonale] = diagonale
+        return dist, next_hop
+
+    @staticmethod
+    def _floyd_warshall(graph: CSRGraph):
+        dist, next_hop = AllPairsShortestPaths._initial_matrices(graph)
+        for k in range(len(graph)):
+            # Relaxation de toutes les paires (i, j) via k en une opération vectorisée
+            via_k = dist[:, k, None] + dist[None, k, :]
+            meilleur = via_k < dist
+            if meilleur.any():
+                np.copyto(dist, via_k, where=meilleur)
+                np.copyto(next_hop, np.broadcast_to(next_hop[:, k, None], next_hop.shape),
+                          where=meilleur)
+        return dist, next_hop
+
+    @staticmethod
+    def _repeated_dijkstra(graph: CSRGraph):
+        n = len(graph)
+        dist = np.full((n, n), np.inf)
+        next_hop = np.full((n, n), -1, dtype=np.int32)
+        offsets, targets, costs = graph.offsets, graph.targets, graph.costs
+        for source in range(n):
+            d = {source: 0}
+            # premier saut depuis la source pour chaque état atteint
+            saut = {source: source}
+            file = [(0, source)]
+            while file:
+                du, u = heapq.heappop(file)
+                if du > d[u]:
+                    continue
+                dist[source, u] = du
+                next_hop[source, u] = saut[u]
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    nd = du + costs[k]
+                    if nd < d.get(v, float("inf")):
+                        d[v] = nd
+                        saut[v] = v if u == source else saut[u]
+                        heapq.heappush(file, (nd, v))
+        return dist, next_hop
+
+    # ----------------------------
+    # Requêtes
+    # ----------------------------
+    def distance(self, start: Any, goal: Any) -> float:
+        """Coût du plus court chemin en O(1)"""
+        return float(self.dist[self.index[start], self.index[goal]])
+
+    def path(self, start: Any, goal: Any) -> Optional[List[Any]]:
+        """Plus court chemin en suivant les prochains sauts (None si inaccessible)"""
+        i, j = self.index[start], self.index[goal]
+        if self.next[i, j] < 0:
+            return None
+        chemin = [i]
+        while i != j:
+            i = int(self.next[i, j])
+            chemin.append(i)
+        return [self.names[k] for k in chemin]
+
+    def query(self, start: Any, goal: Any) -> SearchResult:
+        """Même interface de résultat que SearchStrategy"""
+        debut = time.perf_counter()
+        chemin = self.path(start, goal)
+        cout = self.distance(start, goal) if chemin is not None else float("inf")
+        return SearchResult(chemin, cout, 0, 0, 0, time.perf_counter() - debut, "all-pairs")
+
+    # ----------------------------
+    # Persistance (fichiers .npy projetables en mémoire)
+    # ----------------------------
+    def save(self, directory: str) -> None:
+        """
+        Écrit dist.npy, next.npy et names.json dans `directory`. Les tuples de
+        noms (états de grille) sont relus en tuples; les noms d'un type que
+        JSON ne restitue pas lèvent ValueError.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, self.DIST_FILE), self.dist)
+        np.save(os.path.join(directory, self.NEXT_FILE), self.next)
+        with open(os.path.join(directory, self.NAMES_FILE), "w", encoding="utf-8") as f:
+            json.dump([name_to_json(nom) for nom in self.names], f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "AllPairsShortestPaths":
+        """Relit les matrices; avec mmap=True elles sont projetées en mémoire sans copie"""
+        _require_numpy()
+        mode = "r" if mmap else None
+        dist = np.load(os.path.join(directory, cls.DIST_FILE), mmap_mode=mode)
+        next_hop = np.load(os.path.join(directory, cls.NEXT_FILE), mmap_mode=mode)
+        with open(os.path.join(directory, cls.NAMES_FILE), encoding="utf-8") as f:
+            names = [name_from_json(nom) for nom in json.load(f)]
+        return cls(names, dist, next_hop)
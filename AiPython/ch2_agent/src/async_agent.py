@@ -0,0 +1,223 @@
+from abc import ABC, abstractmethod
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from agent import Action, Actuator, Agent, Environment, Percept, Sensor
+
+
+# ----------------------------
+# Agent asynchrone
+# ----------------------------
+class AsyncAgent(Agent):
+    """Agent dont le programme est une coroutine (attente d'E/S, simulateur externe, ...)"""
+
+    # Délai maximal (secondes) de percept + décision; None = délai de l'environnement
+    timeout: Optional[float] = None
+
+    @abstractmethod
+    async def program_async(self, percept: Percept) -> Optional[Action]:
+        """Programme de l'agent - version asynchrone"""
+        pass
+
+    @property
+    def busy(self) -> bool:
+        """Vrai si une décision précédente est encore en cours (l'agent passe alors son tour)"""
+        return False
+
+    @property
+    def interruptible(self) -> bool:
+        """Vrai si asyncio.wait_for peut interrompre la décision (délai applicable)"""
+        return True
+
+    def program(self, percept: Percept) -> Optional[Action]:
+        """Utilisation synchrone (hors boucle asyncio)"""
+        return asyncio.run(self.program_async(percept))
+
+
+class SyncAgentAdapter(AsyncAgent):
+    """
+    Rend asynchrone un agent synchrone existant.
+    in_thread=True exécute program() dans un thread pour ne pas bloquer la boucle
+    (recherche coûteuse d'un ProblemSolvingAgent par exemple).
+
+    Un délai n'est applicable qu'avec in_thread=True: sans thread, program()
+    bloque la boucle et wait_for ne peut pas l'interrompre. Un thread ne peut
+    pas non plus être interrompu: après un dépassement il continue jusqu'au
+    bout, l'agent est `busy` et passe ses tours jusqu'à la fin de ce calcul,
+    dont l'action (périmée) est ignorée. Deux program() du même agent ne
+    s'exécutent donc jamais en même temps.
+    """
+
+    def __init__(self, agent: Agent, in_thread: bool = False, timeout: Optional[float] = None):
+        if timeout is not None and not in_thread:
+            raise ValueError("Un délai exige in_thread=True (program() bloquerait la boucle)")
+        # Pas d'appel à Agent.__init__: nom, historique et performance sont ceux de l'agent adapté
+        self.agent = agent
+        self.in_thread = in_thread
+        self.timeout = timeout
+        self._pending: Optional[asyncio.Future] = None
+
+    def __getattr__(self, nom: str) -> Any:
+        return getattr(self.__dict__["agent"], nom)
+
+    @property
+    def busy(self) -> bool:
+        return self._pending is not None and not self._pending.done()
+
+    @property
+    def interruptible(self) -> bool:
+        return self.in_thread
+
+    async def program_async(self, percept: Percept) -> Optional[Action]:
+        if not self.in_thread:
+            return self.agent.program(percept)
+        if self.busy:
+            raise RuntimeError(f"{self.agent.name}: décision précédente encore en cours")
+        boucle = asyncio.get_running_loop()
+        self._pending = boucle.run_in_executor(None, self.agent.program, percept)
+        # shield: une annulation (délai dépassé) laisse le futur suivre le thread,
+        # qui continue de tourner, au lieu de le marquer terminé
+        return await asyncio.shield(self._pending)
+
+
+# ----------------------------
+# Capteur et actionneur asynchrones
+# ----------------------------
+class AsyncSensor(ABC):
+    @abstractmethod
+    async def sense(self, env: "AsyncEnvironment", agent: Agent) -> Percept:
+        """Capture (de façon asynchrone) les informations de l'environnement pour l'agent"""
+        pass
+
+
+class AsyncActuator(ABC):
+    @abstractmethod
+    async def act(self, env: "AsyncEnvironment", agent: Agent, action: Action) -> None:
+        """Exécute (de façon asynchrone) l'action dans l'environnement"""
+        pass
+
+
+class SyncSensorAdapter(AsyncSensor):
+    def __init__(self, sensor: Sensor, in_thread: bool = False):
+        self.sensor = sensor
+        self.in_thread = in_thread
+
+    async def sense(self, env, agent: Agent) -> Percept:
+        if self.in_thread:
+            return await asyncio.to_thread(self.sensor.sense, env, agent)
+        return self.sensor.sense(env, agent)
+
+
+class SyncActuatorAdapter(AsyncActuator):
+    def __init__(self, actuator: Actuator, in_thread: bool = False):
+        self.actuator = actuator
+        self.in_thread = in_thread
+
+    async def act(self, env, agent: Agent, action: Action) -> None:
+        if self.in_thread:
+            await asyncio.to_thread(self.actuator.act, env, agent, action)
+        else:
+            self.actuator.act(env, agent, action)
+
+
+# ----------------------------
+# Environnement asynchrone
+# ----------------------------
+class AsyncEnvironment(ABC):
+    """
+    Environnement dont un pas rassemble en parallèle (asyncio.gather) les
+    percepts et décisions de tous les agents, puis leurs actions.
+
+    Chaque agent dispose d'un délai (agent.timeout ou `agent_timeout`) pour
+    percept + décision: au-delà, il passe son tour et timeouts[nom] est
+    incrémenté. Un agent dont la décision précédente tourne encore dans son
+    thread (`busy`) passe son tour sans percept et skipped[nom] est incrémenté.
+
+    Les agents synchrones (program) sont acceptés tels quels, mais sans délai:
+    pour les limiter, les envelopper dans SyncAgentAdapter(agent, in_thread=True).
+    Un délai sur un agent non interruptible lève ValueError.
+    """
+
+    def __init__(self, agent_timeout: Optional[float] = None):
+        self.agents: List[Agent] = []
+        self.agent_timeout = agent_timeout
+        self.timeouts: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+
+    @abstractmethod
+    async def get_percepts(self, agent: Agent) -> Percept:
+        """Retourne les percepts pour un agent donné"""
+        pass
+
+    @abstractmethod
+    async def apply_action(self, agent: Agent, action: Action) -> None:
+        """Applique l'action d'un agent à l'environnement"""
+        pass
+
+    def is_done(self) -> bool:
+        """Détermine si la simulation est terminée"""
+        return False
+
+    async def _decide(self, agent: Agent) -> Optional[Action]:
+        percept = await self.get_percepts(agent)
+        if isinstance(agent, AsyncAgent):
+            return await agent.program_async(percept)
+        return agent.program(percept)
+
+    async def _decide_within_timeout(self, agent: Agent) -> Optional[Action]:
+        delai = getattr(agent, "timeout", None)
+        if delai is None:
+            delai = self.agent_timeout
+        if getattr(agent, "busy", False):
+            self.skipped[agent.name] = self.skipped.get(agent.name, 0) + 1
+            return None
+        if delai is None:
+            return await self._decide(agent)
+        if not (isinstance(agent, AsyncAgent) and agent.interruptible):
+            raise ValueError(f"{agent.name}: délai impossible à appliquer à un agent synchrone, "
+                             "utiliser SyncAgentAdapter(agent, in_thread=True)")
+        try:
+            return await asyncio.wait_for(self._decide(agent), delai)
+        except asyncio.TimeoutError:
+            self.timeouts[agent.name] = self.timeouts.get(agent.name, 0) + 1
+            return None
+
+    async def step(self) -> None:
+        """Exécute un pas de simulation pour tous les agents"""
+        agents = list(self.agents)
+        actions = await asyncio.gather(*(self._decide_within_timeout(agent) for agent in agents))
+        await asyncio.gather(*(self.apply_action(agent, action)
+                               for agent, action in zip(agents, actions) if action is not None))
+
+    async def run(self, steps: int = 100) -> None:
+        """Exécute la simulation pour un nombre donné d'étapes"""
+        for _ in range(steps):
+            if self.is_done():
+                break
+            await self.step()
+
+    def run_sync(self, steps: int = 100) -> None:
+        """run() pour un appelant synchrone"""
+        asyncio.run(self.run(steps))
+
+
+class SyncEnvironmentAdapter(AsyncEnvironment):
+    """Fait tourner un Environment synchrone existant dans la boucle asynchrone"""
+
+    def __init__(self, env: Environment, agent_timeout: Optional[float] = None):
+        super().__init__(agent_timeout)
+        self.env = env
+        self.agents = env.agents
+
+    async def get_percepts(self, agent: Agent) -> Percept:
+        return self.env.get_percepts(_unwrap(agent))
+
+    async def apply_action(self, agent: Agent, action: Action) -> None:
+        self.env.apply_action(_unwrap(agent), action)
+
+    def is_done(self) -> bool:
+        return self.env.is_done()
+
+
+def _unwrap(agent: Agent) -> Agent:
+    return agent.agent if isinstance(agent, SyncAgentAdapter) else agent
@@ -0,0 +1,182 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+import os
+import tempfile
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from csr_graph import CSRGraph, RangeIndex
+from graph_file import MappedGraph, save_graph
+from problem_solving_agent import CSRNavigationProblem, SearchResult, SearchStrategy
+
+# Stratégies utilisables en lot (sans heuristique propre à chaque requête)
+BATCH_STRATEGIES = {
+    "bfs": SearchStrategy.bfs,
+    "dfs": SearchStrategy.dfs,
+    "ucs": SearchStrategy.ucs,
+    "bidirectional-ucs": SearchStrategy.bidirectional_ucs,
+}
+
+Query = Tuple[Any, Any]
+
+
+# ----------------------------
+# Côté processus de travail
+# ----------------------------
+# Graphe projeté en mémoire, ouvert une seule fois par processus (voir _init_worker)
+_WORKER = {}
+
+
+def _init_worker(path: str, strategy: str, names: Optional[List[Any]] = None) -> None:
+    graphe = _WORKER["map"] = MappedGraph(path)
+    if names is not None:
+        # Fichier écrit avec des noms 0..n-1: les vrais noms arrivent par pickle
+        graphe = CSRGraph(names, graphe.offsets, graphe.targets, graphe.costs)
+    _WORKER["graph"] = graphe
+    _WORKER["search"] = BATCH_STRATEGIES[strategy]
+
+
+def _solve_chunk(chunk: List[Query]) -> List[SearchResult]:
+    graphe, recherche = _WORKER["graph"], _WORKER["search"]
+    return [recherche(CSRNavigationProblem(depart, but, graphe)) for depart, but in chunk]
+
+
+# ----------------------------
+# Moteur de requêtes en lot
+# ----------------------------
+class BatchQueryEngine:
+    """
+    Résout de grands lots de requêtes (départ, but) sur un pool de processus.
+
+    Le graphe est écrit une seule fois au format binaire (graph_file) dans un
+    fichier temporaire que chaque processus projette en mémoire (un
+    MappedGraph est utilisé directement, sans fichier temporaire): aucune
+    copie du graphe n'accompagne les tâches, seuls les couples (départ, but)
+    et les SearchResult transitent. Si le format binaire ne peut pas stocker
+    les noms (tuples, types mélangés), seule la structure CSR est écrite et
+    la liste des noms est transmise une fois à chaque processus. Les requêtes sont lues paresseusement par
+    paquets de `chunksize`, avec au plus `max_pending` paquets en vol.
+
+        with BatchQueryEngine(graphe, "ucs", workers=4) as moteur:
+            for depart, but, resultat in moteur.run(paires):
+                ...
+    """
+
+    def __init__(self, graph, strategy: str = "ucs", workers: Optional[int] = None,
+                 chunksize: int = 256, max_pending: Optional[int] = None):
+        if strategy not in BATCH_STRATEGIES:
+            raise ValueError(f"Stratégie non disponible en lot: {strategy}")
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        self.graph = graph
+        self.strategy = strategy
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunksize = chunksize
+        self.max_pending = max_pending if max_pending is not None else 4 * self.workers
+        self.completed = 0  # nombre de requêtes résolues depuis la création
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._path: Optional[str] = None  # fichier temporaire à supprimer
+
+    # ----------------------------
+    # Cycle de vie
+    # ----------------------------
+    def __enter__(self) -> "BatchQueryEngine":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Arrête les processus et supprime le fichier temporaire du graphe"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._path is not None:
+            os.unlink(self._path)
+            self._path = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            noms = None
+            if isinstance(self.graph, MappedGraph):
+                path = self.graph.path
+            else:
+                descripteur, path = tempfile.mkstemp(prefix="batch_graph_", suffix=".agraph")
+                os.close(descripteur)
+                self._path = path
+                try:
+                    save_graph(self.graph, path)
+                except ValueError:
+                    # Noms non stockables: structure seule, noms passés à _init_worker
+                    graphe = self.graph
+                    n = len(graphe)
+                    save_graph(CSRGraph(range(n), graphe.offsets, graphe.targets, graphe.costs,
+                                        RangeIndex(0, n)), path)
+                    noms = list(graphe.names)
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(path, self.strategy, noms))
+        return self._executor
+
+    # ----------------------------
+    # Exécution
+    # ----------------------------
+    def run(self, queries: Iterable[Query], ordered: bool = True,
+            progress: Optional[Callable[[int], None]] = None) -> Iterator[Tuple[Any, Any, SearchResult]]:
+        """
+        Générateur de (départ, but, SearchResult).
+        ordered=True: dans l'ordre des requêtes; ordered=False: dès qu'un paquet
+        est terminé. `progress(completed)` est appelé après chaque paquet.
+        """
+        paquets = self._chunks(queries)
+        if self.workers <= 1:
+            recherche = BATCH_STRATEGIES[self.strategy]
+            for paquet in paquets:
+                resultats = [recherche(CSRNavigationProblem(d, b, self.graph)) for d, b in paquet]
+                yield from self._emit(paquet, resultats, progress)
+            return
+
+        pool = self._pool()
+        if ordered:
+            en_cours = deque()
+            for paquet in paquets:
+                en_cours.append((paquet, pool.submit(_solve_chunk, paquet)))
+                if len(en_cours) >= self.max_pending:
+                    paquet, futur = en_cours.popleft()
+                    yield from self._emit(paquet, futur.result(), progress)
+            while en_cours:
+                paquet, futur = en_cours.popleft()
+                yield from self._emit(paquet, futur.result(), progress)
+        else:
+            en_cours = {}
+            for paquet in paquets:
+                en_cours[pool.submit(_solve_chunk, paquet)] = paquet
+                if len(en_cours) >= self.max_pending:
+                    yield from self._drain(en_cours, progress)
+            while en_cours:
+                yield from self._drain(en_cours, progress)
+
+    def run_all(self, queries: Iterable[Query]) -> List[SearchResult]:
+        """Résout toutes les requêtes et retourne les résultats dans l'ordre"""
+        return [resultat for _, _, resultat in self.run(queries)]
+
+    def _drain(self, en_cours, progress):
+        termines, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+        for futur in termines:
+            paquet = en_cours.pop(futur)
+            yield from self._emit(paquet, futur.result(), progress)
+
+    def _emit(self, paquet, resultats, progress):
+        self.completed += len(paquet)
+        if progress is not None:
+            progress(self.completed)
+        for (depart, but), resultat in zip(paquet, resultats):
+            yield depart, but, resultat
+
+    def _chunks(self, queries: Iterable[Query]) -> Iterator[List[Query]]:
+        iterateur = iter(queries)
+        while True:
+            paquet = list(islice(iterateur, self.chunksize))
+            if not paquet:
+                return
+            yield paquet
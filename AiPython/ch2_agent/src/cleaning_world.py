@@ -0,0 +1,143 @@
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: seul ce module en dépend
+    np = None
+
+from agent import Action, Environment, Percept
+
+
+# ----------------------------
+# Monde de nettoyage vectorisé
+# ----------------------------
+class VectorCleaningWorld(Environment):
+    """
+    Grille 2D de cellules sales/propres parcourue par une flotte de robots,
+    stockée entièrement dans des tableaux NumPy:
+
+        dirt        (H*W,) bool   cellule sale
+        position    (k,)   int64  indice de cellule (ordre ligne par ligne)
+        energy      (k,)   int32  énergie 0..100
+        performance (k,)   float64
+
+    Règles (paramètre `rules`):
+        "simple": SimpleCleaningAgent  - énergie < 30 → sleep, sale → clean, sinon move
+        "robot":  RobotNettoyage       - sale → nettoyer, sinon avancer
+
+    Effets repris d'ActionneurSimple: nettoyer coûte 5 d'énergie et rapporte 10,
+    avancer coûte 2 et passe à la cellule suivante (retour au début après la
+    dernière). Dormir recharge `recharge` points d'énergie (plafonné à 100).
+    Un robot à 0 d'énergie ne fait plus rien.
+
+    Tous les robots perçoivent puis agissent simultanément; si plusieurs
+    nettoient la même cellule, seul le premier (plus petit indice) est récompensé.
+    Le nombre de cellules sales `dirty_left` est tenu à jour à chaque pas.
+    """
+
+    CLEAN_COST = 5
+    CLEAN_REWARD = 10
+    MOVE_COST = 2
+    LOW_ENERGY = 30
+    MAX_ENERGY = 100
+
+    def __init__(self, shape: Tuple[int, int], n_robots: int, dirt_ratio: float = 0.3,
+                 rules: str = "simple", recharge: int = 10, seed: Optional[int] = None,
+                 dirt=None):
+        if np is None:
+            raise ImportError("VectorCleaningWorld nécessite NumPy (pip install numpy)")
+        if rules not in ("simple", "robot"):
+            raise ValueError(f"Règles inconnues: {rules}")
+        super().__init__()
+        self.shape = shape
+        self.rules = rules
+        self.recharge = recharge
+        rng = np.random.default_rng(seed)
+        n_cells = shape[0] * shape[1]
+
+        if dirt is None:
+            self.dirt = rng.random(n_cells) < dirt_ratio
+        else:
+            self.dirt = np.asarray(dirt, dtype=bool).reshape(-1).copy()
+        self.position = rng.integers(0, n_cells, size=n_robots, dtype=np.int64)
+        self.energy = np.full(n_robots, self.MAX_ENERGY, dtype=np.int32)
+        self.performance = np.zeros(n_robots)
+        self.cleaned_count = np.zeros(n_robots, dtype=np.int64)
+        self.dirty_left = int(np.count_nonzero(self.dirt))
+        self.steps = 0
+
+    @property
+    def n_robots(self) -> int:
+        return len(self.position)
+
+    def grid(self):
+        """Vue 2D (sans copie) de la saleté"""
+        return self.dirt.reshape(self.shape)
+
+    def rows_cols(self):
+        return np.divmod(self.position, self.shape[1])
+
+    def add_dirt(self, cells) -> None:
+        """Salit les cellules (indices à plat) en tenant le compteur à jour"""
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        self.dirty_left += int(np.count_nonzero(~self.dirt[cells]))
+        self.dirt[cells] = True
+
+    # ----------------------------
+    # Interface Environment (un robot à la fois, pour inspection)
+    # ----------------------------
+    def get_percepts(self, agent: int) -> Percept:
+        position = int(self.position[agent])
+        sale = bool(self.dirt[position])
+        if self.rules == "simple":
+            return {"energy": int(self.energy[agent]), "is_dirty": sale}
+        return {"sale": sale, "position": position}
+
+    def apply_action(self, agent: int, action: Action) -> None:
+        masque = np.zeros(self.n_robots, dtype=bool)
+        masque[agent] = True
+        vide = np.zeros_like(masque)
+        self._apply(masque if action in ("clean", "nettoyer") else vide,
+                    masque if action in ("move", "avancer") else vide,
+                    masque if action == "sleep" else vide)
+
+    # ----------------------------
+    # Pas vectorisé
+    # ----------------------------
+    def decide(self):
+        """Masques (nettoyer, avancer, dormir) de tous les robots pour ce pas"""
+        actif = self.energy > 0
+        sale = self.dirt[self.position]
+        if self.rules == "simple":
+            dort = actif & (self.energy < self.LOW_ENERGY)
+            actif &= ~dort
+        else:
+            dort = np.zeros_like(actif)
+        return actif & sale, actif & ~sale, dort
+
+    def step(self) -> None:
+        self._apply(*self.decide())
+        self.steps += 1
+
+    def _apply(self, nettoie, bouge, dort) -> None:
+        if nettoie.any():
+            robots = np.flatnonzero(nettoie)
+            cellules, premiers = np.unique(self.position[robots], return_index=True)
+            # Seules les cellules encore sales comptent (appel isolé via apply_action)
+            encore_sales = self.dirt[cellules]
+            recompenses = robots[premiers[encore_sales]]
+            self.dirty_left -= int(np.count_nonzero(encore_sales))
+            self.dirt[cellules] = False
+            self.performance[recompenses] += self.CLEAN_REWARD
+            self.cleaned_count[recompenses] += 1
+            self.energy[robots] -= self.CLEAN_COST
+        if bouge.any():
+            self.position[bouge] = (self.position[bouge] + 1) % len(self.dirt)
+            self.energy[bouge] -= self.MOVE_COST
+        if dort.any():
+            self.energy[dort] = np.minimum(self.energy[dort] + self.recharge, self.MAX_ENERGY)
+        np.maximum(self.energy, 0, out=self.energy)
+
+    def is_done(self) -> bool:
+        """Fini quand tout est propre ou que plus aucun robot ne peut agir"""
+        return self.dirty_left == 0 or not self.energy.any()
@@ -0,0 +1,316 @@
+from array import array
+import heapq
+import json
+import math
+import random
+import struct
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from csr_graph import CSRGraph, name_from_json, name_to_json
+from problem_solving_agent import NavigationProblem, SearchResult, SearchStrategy
+
+
+# ----------------------------
+# Contraction Hierarchies
+# ----------------------------
+class ContractionHierarchy:
+    """
+    Hiérarchie de contraction d'un graphe routier statique.
+
+    Prétraitement: les nœuds sont contractés un par un (ordre par différence
+    d'arêtes), en ajoutant des raccourcis u -> w quand le chemin u -> v -> w
+    est le seul plus court chemin (recherche de témoin bornée).
+    Requête: Dijkstra bidirectionnel qui ne monte que vers des rangs
+    supérieurs, puis dépliage récursif des raccourcis.
+    """
+
+    MAGIC = b"CHGRAPH1"
+
+    def __init__(self, names: List[Any], rank, up, down, shortcuts: Dict[Tuple[int, int], int]):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.rank = rank
+        # up: arêtes u -> w avec rank[w] > rank[u]
+        # down: pour chaque w, arêtes entrantes u -> w avec rank[u] > rank[w]
+        self.up_offsets, self.up_targets, self.up_costs = up
+        self.down_offsets, self.down_sources, self.down_costs = down
+        self.shortcuts = shortcuts  # (u, w) -> nœud contracté milieu
+
+    # ----------------------------
+    # Prétraitement
+    # ----------------------------
+    @classmethod
+    def build(cls, graph, witness_limit: int = 64, verbose: bool = False) -> "ContractionHierarchy":
+        """Construit la hiérarchie depuis un graphe dict ou CSRGraph"""
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        debut = time.perf_counter()
+        n = len(graph)
+
+        # Graphe restant: sortants[u] = {w: coût}, entrants[w] = {u: coût}
+        sortants: List[Dict[int, float]] = [dict() for _ in range(n)]
+        entrants: List[Dict[int, float]] = [dict() for _ in range(n)]
+        for u in range(n):
+            for w, cout in graph.successors(u):
+                if u != w and cout < sortants[u].get(w, float("inf")):
+                    sortants[u][w] = cout
+                    entrants[w][u] = cout
+
+        contracte = [False] * n
+        voisins_contractes = [0] * n
+        shortcuts: Dict[Tuple[int, int], int] = {}
+        aretes_finales: List[Tuple[int, int, float]] = []
+        rank = array("i", [0] * n)
+
+        def temoin(source: int, exclu: int, limite: float) -> Dict[int, float]:
+            """Dijkstra borné depuis source dans le graphe restant, sans passer par exclu"""
+            dist = {source: 0}
+            file = [(0, source)]
+            regles = 0
+            while file and regles < witness_limit:
+                d, x = heapq.heappop(file)
+                if d > limite:
+                    break
+                if d > dist[x]:
+                    continue
+                regles += 1
+                for y, cout in sortants[x].items():
+                    if y == exclu:
+                        continue
+                    nd = d + cout
+                    if nd < dist.get(y, float("inf")):
+                        dist[y] = nd
+                        heapq.heappush(file, (nd, y))
+            return dist
+
+        def raccourcis(v: int) -> List[Tuple[int, int, float]]:
+            """Raccourcis nécessaires si v est contracté maintenant"""
+            resultat = []
+            for u, c_uv in entrants[v].items():
+                candidats = {w: c_uv + c_vw for w, c_vw in sortants[v].items() if w != u}
+                if not candidats:
+                    continue
+                dist = temoin(u, v, max(candidats.values()))
+                for w, c in candidats.items():
+                    if dist.get(w, float("inf")) > c:
+                        resultat.append((u, w, c))
+            return resultat
+
+        def priorite(v: int) -> int:
+            return (len(raccourcis(v)) - len(entrants[v]) - len(sortants[v])
+                    + voisins_contractes[v])
+
+        file = [(priorite(v), v) for v in range(n)]
+        heapq.heapify(file)
+        ordre = 0
+        while file:
+            _, v = heapq.heappop(file)
+            if contracte[v]:
+                continue
+            # Mise à jour paresseuse: on recalcule avant de contracter
+            p = priorite(v)
+            if file and p > file[0][0]:
+                heapq.heappush(file, (p, v))
+                continue
+
+            for u, w, c in raccourcis(v):
+                if c < sortants[u].get(w, float("inf")):
+                    sortants[u][w] = c
+                    entrants[w][u] = c
+                    shortcuts[(u, w)] = v
+
+            for w, c in sortants[v].items():
+                aretes_finales.append((v, w, c))
+                del entrants[w][v]
+                voisins_contractes[w] += 1
+            for u, c in entrants[v].items():
+                aretes_finales.append((u, v, c))
+                del sortants[u][v]
+                voisins_contractes[u] += 1
+            sortants[v].clear()
+            entrants[v].clear()
+            contracte[v] = True
+            rank[v] = ordre
+            ordre += 1
+
+        # Les raccourcis remplacés par une arête plus courte ne sont plus utilisés
+        gardees = {(u, w) for u, w, _ in aretes_finales}
+        shortcuts = {cle: m for cle, m in shortcuts.items() if cle in gardees}
+
+        up = cls._csr(n, [(u, w, c) for u, w, c in aretes_finales if rank[w] > rank[u]],
+                      graph.cost_typecode)
+        down = cls._csr(n, [(w, u, c) for u, w, c in aretes_finales if rank[u] > rank[w]],
+                        graph.cost_typecode)
+        ch = cls(list(graph.names), rank, up, down, shortcuts)
+        if verbose:
+            print(f"✅ Hiérarchie construite: {n} nœuds, {len(shortcuts)} raccourcis "
+                  f"en {time.perf_counter() - debut:.2f}s")
+        return ch
+
+    @staticmethod
+    def _csr(n: int, aretes: List[Tuple[int, int, float]], typecode: str) -> Tuple[array, array, array]:
+        """Tableaux (offsets, cibles, coûts du type du graphe d'origine) triés par origine"""
+        aretes.sort()
+        offsets = array("q", [0] * (n + 1))
+        cibles = array("i", [w for _, w, _ in aretes])
+        couts = array(typecode, [c for _, _, c in aretes])
+        for u, _, _ in aretes:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        return offsets, cibles, couts
+
+    # ----------------------------
+    # Requêtes
+    # ----------------------------
+    def _query(self, s: int, t: int):
+        """Dijkstra bidirectionnel ascendant: retourne (distance, rencontre, parents, expansés)"""
+        if s == t:
+            return 0, s, ({}, {}), 0
+        dist = ({s: 0}, {t: 0})
+        parents = ({}, {})
+        files = ([(0, s)], [(0, t)])
+        graphes = ((self.up_offsets, self.up_targets, self.up_costs),
+                   (self.down_offsets, self.down_sources, self.down_costs))
+        meilleur, rencontre = float("inf"), None
+        expanses = 0
+        heappop, heappush = heapq.heappop, heapq.heappush
+
+        while files[0] or files[1]:
+            # Chaque direction s'arrête dès que sa clé minimale dépasse le meilleur chemin
+            cote = 0 if files[0] and (not files[1] or files[0][0][0] <= files[1][0][0]) else 1
+            file = files[cote]
+            d, u = heappop(file)
+            if d >= meilleur:
+                file.clear()
+                continue
+            d_cote = dist[cote]
+            if d > d_cote[u]:
+                continue
+            expanses += 1
+            autre = dist[1 - cote].get(u)
+            if autre is not None and d + autre < meilleur:
+                meilleur, rencontre = d + autre, u
+            offsets, cibles, couts = graphes[cote]
+            p_cote = parents[cote]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = cibles[k]
+                nd = d + couts[k]
+                if nd < d_cote.get(v, float("inf")):
+                    d_cote[v] = nd
+                    p_cote[v] = u
+                    heappush(file, (nd, v))
+        return meilleur, rencontre, parents, expanses
+
+    def distance(self, start: Any, goal: Any) -> float:
+        """Distance du plus court chemin (inf si inaccessible)"""
+        return self._query(self.index[start], self.index[goal])[0]
+
+    def query(self, start: Any, goal: Any) -> SearchResult:
+        """Plus court chemin déplié (sans raccourcis) sous forme de SearchResult"""
+        debut = time.perf_counter()
+        s, t = self.index[start], self.index[goal]
+        meilleur, rencontre, (parents_avant, parents_arriere), expanses = self._query(s, t)
+        if rencontre is None:
+            resultat = SearchResult(None, float("inf"), expanses)
+        else:
+            # Chemin dans le graphe augmenté: s ... rencontre ... t
+            montee = [rencontre]
+            while montee[-1] != s:
+                montee.append(parents_avant[montee[-1]])
+            montee.reverse()
+            descente = [rencontre]
+            while descente[-1] != t:
+                descente.append(parents_arriere[descente[-1]])
+            augmente = montee + descente[1:]
+            chemin = [s]
+            for u, w in zip(augmente, augmente[1:]):
+                self._unpack(u, w, chemin)
+            resultat = SearchResult([self.names[i] for i in chemin], meilleur, expanses)
+        resultat.elapsed = time.perf_counter() - debut
+        resultat.strategy = "contraction-hierarchy"
+        return resultat
+
+    def _unpack(self, u: int, w: int, chemin: List[int]) -> None:
+        """Ajoute à chemin les nœuds de l'arête u -> w après u (raccourcis dépliés)"""
+        pile = [(u, w)]
+        while pile:
+            a, b = pile.pop()
+            milieu = self.shortcuts.get((a, b))
+            if milieu is None:
+                chemin.append(b)
+            else:
+                pile.append((milieu, b))
+                pile.append((a, milieu))
+
+    # ----------------------------
+    # Persistance
+    # ----------------------------
+    def save(self, path: str) -> None:
+        """
+        Écrit la hiérarchie: en-tête JSON (noms, tailles) puis tableaux binaires.
+        Les noms doivent être des str, int, float, bool, None ou des tuples de
+        ceux-ci (états de grille); tout autre type lève ValueError.
+        """
+        milieux = sorted(self.shortcuts.items())
+        tableaux = [
+            self.rank,
+            self.up_offsets, self.up_targets, self.up_costs,
+            self.down_offsets, self.down_sources, self.down_costs,
+            array("i", [u for (u, _), _ in milieux]),
+            array("i", [w for (_, w), _ in milieux]),
+            array("i", [m for _, m in milieux]),
+        ]
+        entete = json.dumps({
+            "names": [name_to_json(nom) for nom in self.names],
+            "arrays": [[t.typecode, len(t)] for t in tableaux],
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack("<Q", len(entete)))
+            f.write(entete)
+            for t in tableaux:
+                t.tofile(f)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """Relit une hiérarchie écrite par save()"""
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"{path}: pas un fichier de hiérarchie de contraction")
+            (taille,) = struct.unpack("<Q", f.read(8))
+            entete = json.loads(f.read(taille).decode("utf-8"))
+            tableaux = []
+            for typecode, longueur in entete["arrays"]:
+                t = array(typecode)
+                t.fromfile(f, longueur)
+                tableaux.append(t)
+        rank, uo, ut, uc, do, ds, dc, su, sw, sm = tableaux
+        shortcuts = {(u, w): m for u, w, m in zip(su, sw, sm)}
+        names = [name_from_json(nom) for nom in entete["names"]]
+        return cls(names, rank, (uo, ut, uc), (do, ds, dc), shortcuts)
+
+
+def verify_against_ucs(ch: ContractionHierarchy, graph: dict,
+                       pairs: Optional[Iterable[Tuple[Any, Any]]] = None,
+                       samples: int = 100, seed: int = 0) -> List[Tuple[Any, Any, float, float]]:
+    """
+    Compare les distances de la hiérarchie à SearchStrategy.ucs sur le même graphe.
+    Retourne la liste des écarts (départ, but, distance CH, distance UCS), vide si tout concorde.
+    Les coûts réels sont comparés à l'arrondi près: les raccourcis additionnent
+    les mêmes arêtes dans un autre ordre.
+    """
+    if pairs is None:
+        rng = random.Random(seed)
+        pairs = [(rng.choice(ch.names), rng.choice(ch.names)) for _ in range(samples)]
+    ecarts = []
+    for depart, but in pairs:
+        attendu = SearchStrategy.ucs(NavigationProblem(depart, but, graph)).cost
+        obtenu = ch.query(depart, but)
+        chemin_ok = (not obtenu or
+                     math.isclose(sum(graph[a][b] for a, b in zip(obtenu.path, obtenu.path[1:])),
+                                  obtenu.cost, rel_tol=1e-9))
+        if not math.isclose(obtenu.cost, attendu, rel_tol=1e-9) or not chemin_ok:
+            ecarts.append((depart, but, obtenu.cost, attendu))
+    return ecarts
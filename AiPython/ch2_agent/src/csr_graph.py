@@ -0,0 +1,201 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class RangeIndex:
+    """
+    Index nom -> identifiant pour des états nommés par des entiers consécutifs
+    first..first+n-1 (DIMACS: 1..n). Remplace le dict sans aucune allocation
+    par état, ce qui compte pour des dizaines de millions d'états.
+    """
+
+    __slots__ = ("first", "n")
+
+    def __init__(self, first: int, n: int):
+        self.first = first
+        self.n = n
+
+    def get(self, name: Any, default: Any = None) -> Any:
+        if type(name) is int and 0 <= name - self.first < self.n:
+            return name - self.first
+        return default
+
+    def __getitem__(self, name: Any) -> int:
+        i = self.get(name)
+        if i is None:
+            raise KeyError(name)
+        return i
+
+    def __contains__(self, name: Any) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.first, self.first + self.n))
+
+
+# ----------------------------
+# Graphe compact CSR
+# ----------------------------
+class CSRGraph:
+    """
+    Graphe compact au format CSR (Compressed Sparse Row).
+
+    Les états (villes, zones, ...) sont internés une seule fois en entiers
+    0..n-1. Les voisins de l'état i sont targets[offsets[i]:offsets[i+1]]
+    et les coûts correspondants costs[offsets[i]:offsets[i+1]].
+    """
+
+    def __init__(self, names: List[Any], offsets, targets, costs, index: Optional[Any] = None):
+        self.names = names
+        self.index = index if index is not None else {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.costs = costs
+
+    @classmethod
+    def from_dict(cls, graph: Dict[Any, Dict[Any, float]]) -> "CSRGraph":
+        """Construit le graphe CSR à partir d'un dict-of-dicts {état: {voisin: coût}}"""
+        names: List[Any] = []
+        index: Dict[Any, int] = {}
+
+        def intern(name):
+            i = index.get(name)
+            if i is None:
+                i = index[name] = len(names)
+                names.append(name)
+            return i
+
+        for state, voisins in graph.items():
+            intern(state)
+            for voisin in voisins:
+                intern(voisin)
+
+        entiers = all(isinstance(c, int) for voisins in graph.values() for c in voisins.values())
+        offsets = array("q", [0] * (len(names) + 1))
+        targets = array("i")
+        costs = array("q" if entiers else "d")
+
+        for i, name in enumerate(names):
+            for voisin, cout in graph.get(name, {}).items():
+                targets.append(index[voisin])
+                costs.append(cout)
+            offsets[i + 1] = len(targets)
+
+        return cls(names, offsets, targets, costs)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Any, Any, float]]) -> "CSRGraph":
+        """Construit le graphe CSR à partir d'une liste d'arêtes (source, cible, coût)"""
+        graph: Dict[Any, Dict[Any, float]] = {}
+        for source, cible, cout in edges:
+            graph.setdefault(source, {})[cible] = cout
+        return cls.from_dict(graph)
+
+    # Interning des états
+    def id_of(self, name: Any) -> int:
+        return self.index[name]
+
+    def name_of(self, state: int) -> Any:
+        return self.names[state]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: Any) -> bool:
+        return name in self.index
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    @property
+    def cost_typecode(self) -> str:
+        """"q" (coûts entiers) ou "d" (réels), que costs soit un array ou un memoryview"""
+        return getattr(self.costs, "typecode", None) or getattr(self.costs, "format", "d")
+
+    @property
+    def max_integer_cost(self) -> Optional[int]:
+        """Plus grand coût d'arête si les coûts sont entiers, None sinon (calculé une fois)"""
+        if self.cost_typecode != "q":
+            return None
+        maximum = getattr(self, "_max_cost", None)
+        if maximum is None:
+            maximum = self._max_cost = max(self.costs, default=0)
+        return maximum
+
+    # Accès au voisinage (états entiers)
+    def neighbors(self, state: int):
+        return self.targets[self.offsets[state]:self.offsets[state + 1]]
+
+    def successors(self, state: int) -> Iterable[Tuple[int, float]]:
+        debut, fin = self.offsets[state], self.offsets[state + 1]
+        return zip(self.targets[debut:fin], self.costs[debut:fin])
+
+    def cost(self, state1: int, state2: int) -> float:
+        debut, fin = self.offsets[state1], self.offsets[state1 + 1]
+        for k in range(debut, fin):
+            if self.targets[k] == state2:
+                return self.costs[k]
+        raise KeyError((self.name_of(state1), self.name_of(state2)))
+
+    def reverse(self) -> "CSRGraph":
+        """Graphe inverse (arêtes retournées), construit une seule fois puis mis en cache"""
+        inverse = getattr(self, "_reverse", None)
+        if inverse is None:
+            n = len(self)
+            degres = [0] * (n + 1)
+            for j in self.targets:
+                degres[j + 1] += 1
+            offsets = array("q", [0] * (n + 1))
+            for i in range(n):
+                offsets[i + 1] = offsets[i] + degres[i + 1]
+            position = list(offsets[:n])
+            targets = array("i", [0] * self.num_edges)
+            costs = array(self.cost_typecode,
+                          [0] * self.num_edges)
+            for i in range(n):
+                for k in range(self.offsets[i], self.offsets[i + 1]):
+                    j = self.targets[k]
+                    targets[position[j]] = i
+                    costs[position[j]] = self.costs[k]
+                    position[j] += 1
+            inverse = CSRGraph.__new__(CSRGraph)
+            inverse.names = self.names
+            inverse.index = self.index
+            inverse.offsets, inverse.targets, inverse.costs = offsets, targets, costs
+            inverse._reverse = self
+            self._reverse = inverse
+        return inverse
+
+    def to_dict(self) -> Dict[Any, Dict[Any, float]]:
+        """Reconstruit le dict-of-dicts équivalent (utile pour les petits graphes)"""
+        return {
+            self.name_of(i): {self.name_of(j): c for j, c in self.successors(i)}
+            for i in range(len(self))
+        }
+
+
+# ----------------------------
+# Noms d'états dans les en-têtes JSON (fichiers de hiérarchie, all-pairs)
+# ----------------------------
+# Un tuple est écrit {"tuple": [...]} pour être relu en tuple (JSON n'a que des listes)
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def name_to_json(name: Any) -> Any:
+    """Nom d'état écrivable en JSON et relu à l'identique par name_from_json; ValueError sinon"""
+    if type(name) in _JSON_SCALARS:
+        return name
+    if type(name) is tuple:
+        return {"tuple": [name_to_json(x) for x in name]}
+    raise ValueError(f"Nom d'état {name!r} ({type(name).__name__}) impossible à relire après écriture: "
+                     "utiliser des str, int, float, bool, None ou tuples de ceux-ci")
+
+
+def name_from_json(name: Any) -> Any:
+    if isinstance(name, dict):
+        return tuple(name_from_json(x) for x in name["tuple"])
+    return name
@@ -0,0 +1,103 @@
+import heapq
+from itertools import count
+from typing import Any, Callable, Dict, Optional
+
+from agent import Action, Agent, Environment, Percept
+
+INF = float("inf")
+
+
+# ----------------------------
+# Simulation à événements discrets
+# ----------------------------
+class EventScheduler:
+    """
+    Alternative à Environment.run: au lieu de faire agir tous les agents à
+    chaque pas, la simulation saute d'événement en événement.
+
+    Un événement « agent » réveille un agent à la date t: percept puis program.
+    L'action choisie dure d = env.action_duration(...) (ou la fonction
+    `duration` fournie): elle est appliquée à la date t + d, et l'agent décide
+    de sa prochaine action à ce même instant. Un agent dont le programme ne
+    retourne aucune action s'endort jusqu'à un wake() explicite (ou pendant
+    `idle_delay` s'il est fourni). Des événements d'environnement
+    (apparition de saleté, fermeture d'un couloir, ...) s'ajoutent avec at().
+
+    Le coût est proportionnel au nombre d'événements, pas à agents × pas.
+    À égalité de date, les événements sont traités dans leur ordre d'ajout.
+    """
+
+    def __init__(self, env: Environment,
+                 duration: Optional[Callable[[Agent, Percept, Action], float]] = None,
+                 idle_delay: Optional[float] = None, start: float = 0.0):
+        self.env = env
+        self.duration = duration if duration is not None else env.action_duration
+        self.idle_delay = idle_delay
+        self.now = start
+        self.events_processed = 0
+        self._queue = []
+        self._order = count()
+        # Dernier événement valide de chaque agent (suppression paresseuse)
+        self._pending: Dict[int, int] = {}
+        for agent in env.agents:
+            self.wake(agent, start)
+
+    def wake(self, agent: Agent, at: Optional[float] = None) -> None:
+        """(Re)programme le réveil d'un agent; remplace (et abandonne) son événement en attente"""
+        self._push(agent, self.now if at is None else at, None)
+
+    def _push(self, agent: Agent, time: float, action: Optional[Action]) -> None:
+        numero = next(self._order)
+        self._pending[id(agent)] = numero
+        heapq.heappush(self._queue, (time, numero, agent, action))
+
+    def at(self, time: float, callback: Callable[["EventScheduler"], Any]) -> None:
+        """Programme un événement d'environnement callback(scheduler) à la date `time`"""
+        heapq.heappush(self._queue, (time, next(self._order), None, callback))
+
+    def next_time(self) -> float:
+        self._skip_cancelled()
+        return self._queue[0][0] if self._queue else INF
+
+    def _skip_cancelled(self) -> None:
+        file = self._queue
+        while file and file[0][2] is not None and self._pending.get(id(file[0][2])) != file[0][1]:
+            heapq.heappop(file)
+
+    def run(self, until: float = INF, max_events: Optional[int] = None) -> int:
+        """Traite les événements jusqu'à la date `until`; retourne le nombre traité"""
+        env = self.env
+        traites = 0
+        while max_events is None or traites < max_events:
+            prochaine = self.next_time()
+            if prochaine == INF or prochaine > until or env.is_done():
+                break
+            date, numero, agent, donnee = heapq.heappop(self._queue)
+            self.now = env.now = date
+            traites += 1
+            if agent is None:
+                donnee(self)  # événement d'environnement
+                continue
+
+            del self._pending[id(agent)]
+            if donnee is not None:
+                env.apply_action(agent, donnee)  # fin de l'action en cours
+            percept = env.get_percepts(agent)
+            action = agent.program(percept)
+            if action is not None:
+                self._push(agent, date + self.duration(agent, percept, action), action)
+            elif self.idle_delay is not None:
+                self._push(agent, date + self.idle_delay, None)
+
+        self.events_processed += traites
+        return traites
+
+
+def navigation_duration(agent: Agent, percept: Percept, action: Action) -> float:
+    """Durée d'une action move_to_X d'un ProblemSolvingAgent = coût de l'arête parcourue"""
+    if isinstance(action, str) and action.startswith("move_to_"):
+        voisins = percept.get("neighbors") or {}
+        cout = voisins.get(action[len("move_to_"):])
+        if cout is not None:
+            return cout
+    return 1.0
@@ -0,0 +1,276 @@
+from array import array
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from csr_graph import CSRGraph, RangeIndex
+
+# ----------------------------
+# Format binaire de graphe (.agraph)
+# ----------------------------
+# En-tête (little-endian, 48 octets):
+#     magic "AGRAPH\0\0" | version u32 | flags u32 | type des noms u32 | réservé u32
+#     n u64 | m u64 | premier nom (RANGE_NAMES) i64
+# puis la table des sections: (position, taille en octets) u64 x 2 pour
+# chaque section de SECTIONS. Chaque section commence sur un multiple de 8.
+#
+#     offsets      int64 x (n+1)   adjacence CSR
+#     targets      int32 x m
+#     costs        int64 ou float64 x m (flag FLOAT_COSTS)
+#     name_offsets int64 x (n+1)   position de chaque nom dans name_data
+#     name_data    octets UTF-8 (noms str, ou entiers écrits en décimal)
+#     name_order   int32 x n       identifiants triés par nom (recherche dichotomique)
+#     coords       float64 x 2n    (x, y) de chaque état (flag COORDS)
+
+MAGIC = b"AGRAPH\0\0"
+FORMAT_VERSION = 1
+
+FLOAT_COSTS = 1
+COORDS = 2
+
+STR_NAMES = 0
+INT_NAMES = 1
+RANGE_NAMES = 2
+
+SECTIONS = ("offsets", "targets", "costs", "name_offsets", "name_data", "name_order", "coords")
+
+_HEADER = struct.Struct("<8sIIIIqqq")
+_SECTION = struct.Struct("<qq")
+_DATA_START = _HEADER.size + len(SECTIONS) * _SECTION.size
+
+Coordinates = Union[Dict[Any, Tuple[float, float]], Sequence[Tuple[float, float]]]
+
+
+def _align8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _buffer(typecode: str, valeurs):
+    """Valeurs écrivables telles quelles (array ou memoryview du bon type), sinon converties"""
+    if getattr(valeurs, "typecode", None) == typecode or getattr(valeurs, "format", None) == typecode:
+        return valeurs
+    return array(typecode, valeurs)
+
+
+def _names_kind(names) -> int:
+    if isinstance(names, range) and names.step == 1:
+        return RANGE_NAMES
+    if all(isinstance(nom, str) for nom in names):
+        return STR_NAMES
+    if all(type(nom) is int for nom in names):
+        return INT_NAMES
+    raise ValueError("Format binaire: les noms d'états doivent être tous str ou tous int")
+
+
+# ----------------------------
+# Écriture
+# ----------------------------
+def save_graph(graph: CSRGraph, path: str, coords: Optional[Coordinates] = None) -> None:
+    """
+    Écrit le graphe au format binaire. `coords`: dict {nom: (x, y)} ou
+    séquence indexée par identifiant. Le fichier est écrit à côté puis
+    renommé: les processus qui projettent l'ancienne version ne sont pas affectés.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_dict(graph)
+    n, m = len(graph), graph.num_edges
+    names = graph.names
+    kind = _names_kind(names)
+    flottants = graph.cost_typecode == "d"
+    cout_code = "d" if flottants else "q"
+
+    sections = {
+        "offsets": _buffer("q", graph.offsets),
+        "targets": _buffer("i", graph.targets),
+        "costs": _buffer(cout_code, graph.costs),
+    }
+    if kind != RANGE_NAMES:
+        encodes = [(nom if kind == STR_NAMES else str(nom)).encode() for nom in names]
+        positions = array("q", [0]) * (n + 1)
+        for i, octets in enumerate(encodes):
+            positions[i + 1] = positions[i] + len(octets)
+        cle = (lambda i: encodes[i]) if kind == STR_NAMES else (lambda i: names[i])
+        sections["name_offsets"] = positions
+        sections["name_data"] = b"".join(encodes)
+        sections["name_order"] = array("i", sorted(range(n), key=cle))
+        del encodes
+    if coords is not None:
+        xy = array("d", [0.0]) * (2 * n)
+        for i in range(n):
+            x, y = coords[names[i]] if isinstance(coords, dict) else coords[i]
+            xy[2 * i], xy[2 * i + 1] = x, y
+        sections["coords"] = xy
+
+    flags = (FLOAT_COSTS if flottants else 0) | (COORDS if coords is not None else 0)
+    premier = names.start if kind == RANGE_NAMES else 0
+    provisoire = path + ".tmp"
+    with open(provisoire, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, flags, kind, 0, n, m, premier))
+        table = []
+        position = _align8(_DATA_START)
+        for nom in SECTIONS:
+            donnees = sections.get(nom)
+            taille = memoryview(donnees).nbytes if donnees is not None else 0
+            table.append((position, taille))
+            position = _align8(position + taille)
+        for debut, taille in table:
+            f.write(_SECTION.pack(debut, taille))
+        for nom, (debut, taille) in zip(SECTIONS, table):
+            if taille:
+                f.write(b"\0" * (debut - f.tell()))
+                f.write(sections[nom])
+    os.replace(provisoire, path)
+
+
+# ----------------------------
+# Lecture par projection en mémoire
+# ----------------------------
+class _MappedNames:
+    """Noms d'états décodés à la demande depuis la projection (aucune liste de n objets)"""
+
+    def __init__(self, offsets: memoryview, data: memoryview, kind: int):
+        self._offsets = offsets
+        self._data = data
+        self._kind = kind
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> Any:
+        if i < 0:
+            i += len(self)
+        texte = str(self._data[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+        return texte if self._kind == STR_NAMES else int(texte)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def key(self, i: int) -> Any:
+        """Clé de tri du nom i (octets UTF-8 ou entier), comparable à celle de save_graph"""
+        if self._kind == STR_NAMES:
+            return bytes(self._data[self._offsets[i]:self._offsets[i + 1]])
+        return self[i]
+
+
+class _MappedIndex:
+    """Index nom -> identifiant par recherche dichotomique dans name_order"""
+
+    def __init__(self, names: _MappedNames, order: memoryview, kind: int):
+        self._names = names
+        self._order = order
+        self._kind = kind
+
+    def get(self, name: Any, default: Any = None) -> Any:
+        if self._kind == STR_NAMES:
+            if not isinstance(name, str):
+                return default
+            cle = name.encode()
+        elif type(name) is int:
+            cle = name
+        else:
+            return default
+        ordre, key = self._order, self._names.key
+        bas, haut = 0, len(ordre)
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if key(ordre[milieu]) < cle:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        if bas < len(ordre) and key(ordre[bas]) == cle:
+            return ordre[bas]
+        return default
+
+    def __getitem__(self, name: Any) -> int:
+        i = self.get(name)
+        if i is None:
+            raise KeyError(name)
+        return i
+
+    def __contains__(self, name: Any) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._names)
+
+
+class MappedGraph(CSRGraph):
+    """
+    CSRGraph lu directement dans un fichier écrit par save_graph, projeté en
+    mémoire en lecture seule: offsets, cibles, coûts, noms et coordonnées
+    sont des memoryview sur la projection, sans copie. L'ouverture ne lit
+    que l'en-tête, quelle que soit la taille du graphe, et tous les
+    processus qui ouvrent le même fichier partagent les mêmes pages du cache.
+
+        with MappedGraph("maroc.agraph") as graphe:
+            resultat = ucs(graphe, "Rabat", "Fès")
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.path = path
+        vue = self._view = memoryview(self._map)
+        if len(vue) < _DATA_START:
+            raise ValueError(f"{path}: fichier de graphe tronqué")
+        magic, version, flags, kind, _, n, m, premier = _HEADER.unpack_from(vue, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: pas un graphe binaire (magic {magic!r})")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: version {version} non supportée (attendue {FORMAT_VERSION})")
+        self.version = version
+
+        def section(rang: int, typecode: str) -> Optional[memoryview]:
+            debut, taille = _SECTION.unpack_from(vue, _HEADER.size + rang * _SECTION.size)
+            if debut + taille > len(vue):
+                raise ValueError(f"{path}: section {SECTIONS[rang]} hors du fichier")
+            return vue[debut:debut + taille].cast(typecode) if taille else None
+
+        offsets = section(0, "q")
+        targets = section(1, "i")
+        costs = section(2, "d" if flags & FLOAT_COSTS else "q")
+        if m == 0:
+            targets, costs = array("i"), array("d" if flags & FLOAT_COSTS else "q")
+        if kind == RANGE_NAMES:
+            names, index = range(premier, premier + n), RangeIndex(premier, n)
+        else:
+            names = _MappedNames(section(3, "q"), section(4, "B") or memoryview(b""), kind)
+            index = _MappedIndex(names, section(5, "i") or array("i"), kind)
+        CSRGraph.__init__(self, names, offsets, targets, costs, index)
+        self.coords = section(6, "d") if flags & COORDS else None
+
+    def coordinates(self, name: Any) -> Tuple[float, float]:
+        """(x, y) d'un état (ValueError si le fichier n'a pas de coordonnées)"""
+        if self.coords is None:
+            raise ValueError(f"{self.path}: aucune coordonnée enregistrée")
+        i = self.id_of(name)
+        return self.coords[2 * i], self.coords[2 * i + 1]
+
+    def close(self) -> None:
+        """Libère la projection (les vues du graphe deviennent inutilisables)"""
+        if self._map is None:
+            return
+        self.__dict__.pop("_reverse", None)
+        self.names = self.index = self.offsets = self.targets = self.costs = self.coords = None
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # vues encore référencées ailleurs: libérée par le ramasse-miettes
+        self._map = None
+
+    def __enter__(self) -> "MappedGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def load_graph_file(path: str) -> MappedGraph:
+    """Ouvre un graphe binaire écrit par save_graph (projection en mémoire, sans copie)"""
+    return MappedGraph(path)
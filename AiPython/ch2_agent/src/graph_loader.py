@@ -0,0 +1,427 @@
+from array import array
+import gzip
+from itertools import chain, islice, repeat
+from operator import methodcaller
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: accélère seulement la construction CSR
+    np = None
+
+from csr_graph import CSRGraph, RangeIndex
+
+# Taille des blocs lus sur le disque (octets)
+CHUNK_SIZE = 1 << 22
+
+
+# ----------------------------
+# Rapport de chargement
+# ----------------------------
+class LoadReport:
+    """Volume lu et débit d'un chargement (graph.load_report)"""
+
+    def __init__(self, path: str, fmt: str):
+        self.path = path
+        self.format = fmt
+        self.bytes_read = 0
+        self.lines = 0
+        self.edges = 0
+        self.nodes = 0
+        self.parse_time = 0.0
+        self.build_time = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return self.parse_time + self.build_time
+
+    @property
+    def edges_per_second(self) -> float:
+        return self.edges / self.parse_time if self.parse_time else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.bytes_read / 1e6 / self.parse_time if self.parse_time else 0.0
+
+    def __repr__(self) -> str:
+        return (f"LoadReport({self.format} {os.path.basename(self.path)}: {self.nodes} nœuds, "
+                f"{self.edges} arêtes, analyse {self.parse_time:.2f}s "
+                f"({self.edges_per_second:,.0f} arêtes/s, {self.megabytes_per_second:.1f} Mo/s), "
+                f"construction CSR {self.build_time:.2f}s)")
+
+
+# ----------------------------
+# Lecture par blocs
+# ----------------------------
+def _open(path: str):
+    return gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+
+
+def _blocks(path: str, chunk_size: int, report: LoadReport) -> Iterator[bytes]:
+    """
+    Blocs de lignes complètes du fichier (retours chariot retirés): seule la dernière ligne,
+    incomplète, d'un bloc lu est conservée pour le bloc suivant.
+    """
+    reste = b""
+    with _open(path) as f:
+        while True:
+            bloc = f.read(chunk_size)
+            if not bloc:
+                break
+            report.bytes_read += len(bloc)
+            bloc = reste + bloc
+            coupure = bloc.rfind(b"\n")
+            if coupure < 0:
+                reste = bloc
+                continue
+            reste = bloc[coupure + 1:]
+            bloc = bloc[:coupure]
+            yield bloc.replace(b"\r", b"") if b"\r" in bloc else bloc
+    if reste.strip():
+        yield reste.replace(b"\r", b"")
+
+
+def _build_csr(n: int, sources: array, cibles: array, couts: array):
+    """Tri par dénombrement des arêtes par source (stable): offsets, targets, costs"""
+    m = len(sources)
+    if np is not None and m:
+        src = np.frombuffer(sources, dtype=np.int32)
+        ordre = np.argsort(src, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        targets = array("i", np.frombuffer(cibles, dtype=np.int32)[ordre].tobytes())
+        dtype = np.int64 if couts.typecode == "q" else np.float64
+        costs = array(couts.typecode, np.frombuffer(couts, dtype=dtype)[ordre].tobytes())
+        return array("q", offsets.tobytes()), targets, costs
+
+    offsets = array("q", bytes(8 * (n + 1)))
+    for s in sources:
+        offsets[s + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    position = array("q", offsets[:n])
+    targets = array("i", bytes(4 * m))
+    costs = array(couts.typecode, bytes(couts.itemsize * m))
+    for s, t, c in zip(sources, cibles, couts):
+        k = position[s]
+        targets[k] = t
+        costs[k] = c
+        position[s] = k + 1
+    return offsets, targets, costs
+
+
+def _finish(report: LoadReport, debut: float, n: int, names, index, sources, cibles, couts,
+            verbose: bool) -> CSRGraph:
+    report.parse_time = time.perf_counter() - debut
+    report.nodes = n
+    report.edges = len(sources)
+    debut = time.perf_counter()
+    offsets, targets, costs = _build_csr(n, sources, cibles, couts)
+    del sources[:], cibles[:], couts[:]
+    graph = CSRGraph(names, offsets, targets, costs, index)
+    report.build_time = time.perf_counter() - debut
+    graph.load_report = report
+    if verbose:
+        print(f"✅ {report}")
+    return graph
+
+
+# ----------------------------
+# Listes d'arêtes CSV / TSV
+# ----------------------------
+def load_edge_list(path: str, delimiter: Optional[str] = None, columns: Sequence[int] = (0, 1, 2),
+                   header: Optional[bool] = None, undirected: bool = False, default_cost: float = 1,
+                   name_type: Callable[[str], Any] = str, comment: Optional[str] = "#",
+                   chunk_size: int = CHUNK_SIZE,
+                   progress: Optional[Callable[[LoadReport], None]] = None,
+                   verbose: bool = False) -> CSRGraph:
+    """
+    Charge une liste d'arêtes « source, cible[, coût] » (CSV, TSV ou espaces;
+    .gz accepté) en CSRGraph, utilisable tel quel par make_navigation_problem.
+
+    - delimiter: None = d'après l'extension (.csv: ",", .tsv: tabulation,
+      sinon espaces)
+    - columns: positions (source, cible, coût); sans colonne de coût, chaque
+      arête coûte `default_cost`
+    - header: None = détecté: première ligne dont le coût n'est pas un nombre,
+      dont la source ou la cible ne passe pas name_type, ou dont la source ou
+      la cible n'est pas un nombre alors que celles de la ligne suivante le sont
+    - undirected: ajoute aussi l'arête inverse
+    - name_type: conversion des noms (str par défaut, int pour des identifiants);
+      deux noms confondus par la conversion ("01" et "1" en int) lèvent ValueError
+    - comment: préfixe des lignes ignorées; None ou "" = aucun commentaire
+
+    Les arêtes multiples (même source et même cible) sont toutes conservées.
+
+    Le fichier est lu par blocs de `chunk_size` octets: hors du graphe
+    lui-même (tableaux compacts d'arêtes + un nom interné par état), la
+    mémoire ne dépend pas de la taille du fichier. Les coûts restent entiers
+    tant que toutes les valeurs le sont. `progress(report)` est appelé après
+    chaque bloc; le rapport final est dans graph.load_report.
+    """
+    if delimiter is None:
+        base = path[:-3] if path.endswith(".gz") else path
+        delimiter = {".csv": ",", ".tsv": "\t"}.get(os.path.splitext(base)[1].lower())
+    separateur = delimiter.encode() if delimiter is not None else None
+    commentaire = comment.encode() if comment else None
+    col_source, col_cible = columns[0], columns[1]
+    col_cout = columns[2] if len(columns) > 2 else None
+    largeur = max(columns) + 1
+
+    report = LoadReport(path, "edge-list")
+    debut = time.perf_counter()
+    # Interning: un nouveau nom reçoit len(index), l'ordre d'insertion donne les noms
+    index: Dict[bytes, int] = {}
+    intern = index.setdefault
+    sources, cibles = array("i"), array("i")
+    couts = array("q" if isinstance(default_cost, int) else "d")
+    premier_bloc = True
+
+    for bloc in _blocks(path, chunk_size, report):
+        nb_lignes = bloc.count(b"\n") + 1
+        report.lines += nb_lignes
+        colonnes = None
+        if not premier_bloc:
+            colonnes = _split_columns(bloc, nb_lignes, separateur, largeur, commentaire)
+        if colonnes is not None:
+            # Bloc régulier: conversions et interning colonne par colonne (boucles en C)
+            if col_cout is None:
+                valeurs = array(couts.typecode, [default_cost]) * nb_lignes
+            else:
+                valeurs = _parse_costs(colonnes[col_cout], couts.typecode)
+                if valeurs is None:
+                    colonnes = None
+                elif valeurs.typecode != couts.typecode:
+                    couts = array("d", couts)
+        if colonnes is not None:
+            ids_u = array("i", map(intern, colonnes[col_source], map(len, repeat(index, nb_lignes))))
+            ids_v = array("i", map(intern, colonnes[col_cible], map(len, repeat(index, nb_lignes))))
+            sources.extend(ids_u)
+            cibles.extend(ids_v)
+            couts.extend(valeurs)
+            if undirected:
+                sources.extend(ids_v)
+                cibles.extend(ids_u)
+                couts.extend(valeurs)
+        else:
+            couts = _parse_lines(path, bloc, separateur, largeur, commentaire, columns,
+                                 header if premier_bloc else False, default_cost,
+                                 undirected, index, sources, cibles, couts, name_type)
+        premier_bloc = False
+        report.edges = len(sources)
+        if progress is not None:
+            progress(report)
+
+    names = [name_type(nom.decode()) for nom in index]
+    if name_type is not str:
+        _check_distinct(path, names, index)
+    del index
+    return _finish(report, debut, len(names), names, None, sources, cibles, couts, verbose)
+
+
+def _check_distinct(path: str, names: List[Any], index: Dict[bytes, int]) -> None:
+    """Vérifie que la conversion des noms n'a pas confondu deux états distincts du fichier"""
+    if len(set(names)) == len(names):
+        return
+    vus: Dict[Any, bytes] = {}
+    for texte, nom in zip(index, names):
+        if nom in vus:
+            raise ValueError(f"{path}: les noms {vus[nom].decode()!r} et {texte.decode()!r} "
+                             f"deviennent tous deux {nom!r} après conversion")
+        vus[nom] = texte
+
+
+def _split_columns(bloc: bytes, nb_lignes: int, separateur: Optional[bytes], largeur: int,
+                   commentaire: bytes) -> Optional[List[List[bytes]]]:
+    """
+    Colonnes d'un bloc dont chaque ligne a le même nombre de champs que la
+    première (au moins `largeur`), sans commentaire ni ligne vide; None sinon
+    (le bloc est alors lu ligne à ligne). Le total des champs ne suffit pas:
+    une ligne trop courte compensée par une trop longue décalerait les colonnes.
+    """
+    if b"\n\n" in bloc:
+        return None
+    if commentaire is not None and (bloc.startswith(commentaire) or b"\n" + commentaire in bloc):
+        return None
+    fin = bloc.find(b"\n")
+    largeur_fichier = len(bloc[:fin if fin >= 0 else len(bloc)].split(separateur))
+    if largeur_fichier < largeur:
+        return None
+    if separateur is None:
+        champs = bloc.split()
+    else:
+        champs = bloc.replace(b"\n", separateur).split(separateur)
+    if len(champs) != nb_lignes * largeur_fichier:
+        return None
+    lignes = bloc.split(b"\n")
+    if separateur is None:
+        largeurs = set(map(len, map(bytes.split, lignes)))
+        if largeurs != {largeur_fichier}:
+            return None
+    elif set(map(methodcaller("count", separateur), lignes)) != {largeur_fichier - 1}:
+        return None
+    return [champs[k::largeur_fichier] for k in range(largeur)]
+
+
+def _parse_costs(textes: List[bytes], typecode: str) -> Optional[array]:
+    """Coûts d'une colonne: entiers tant que possible, sinon réels; None si invalide"""
+    if typecode == "q":
+        try:
+            return array("q", map(int, textes))
+        except ValueError:
+            pass
+    try:
+        return array("d", map(float, textes))
+    except ValueError:
+        return None
+
+
+def _is_number(texte: bytes) -> bool:
+    try:
+        float(texte)
+    except ValueError:
+        return False
+    return True
+
+
+def _detect_header(lignes: List[List[bytes]], columns: Sequence[int],
+                   name_type: Callable[[str], Any]) -> bool:
+    """La première des lignes de données (déjà découpées) est-elle un en-tête ?"""
+    premiere = lignes[0]
+    if len(columns) > 2 and not _is_number(premiere[columns[2]]):
+        return True
+    noms = [premiere[columns[0]], premiere[columns[1]]]
+    if name_type is not str:
+        try:
+            for nom in noms:
+                name_type(nom.decode())
+        except (ValueError, UnicodeDecodeError):
+            return True
+    if len(lignes) > 1 and not all(map(_is_number, noms)):
+        suivante = lignes[1]
+        return _is_number(suivante[columns[0]]) and _is_number(suivante[columns[1]])
+    return False
+
+
+def _parse_lines(path, bloc, separateur, largeur, commentaire, columns, header, default_cost,
+                 undirected, index, sources, cibles, couts, name_type=str) -> array:
+    """Lecture ligne à ligne (premier bloc, commentaires, lignes irrégulières); retourne couts"""
+    col_source, col_cible = columns[0], columns[1]
+    col_cout = columns[2] if len(columns) > 2 else None
+
+    def donnees(lignes):
+        for ligne in lignes:
+            if not ligne.strip() or (commentaire is not None and ligne.startswith(commentaire)):
+                continue
+            champs = ligne.split(separateur)
+            if len(champs) < largeur:
+                raise ValueError(f"{path}: ligne invalide {ligne[:80]!r}")
+            yield champs
+
+    lignes = donnees(bloc.split(b"\n"))
+    if header is not False:
+        # La ligne suivante sert de référence pour reconnaître un en-tête sans coût
+        premieres = list(islice(lignes, 2))
+        if premieres and (header or _detect_header(premieres, columns, name_type)):
+            premieres.pop(0)
+        lignes = chain(premieres, lignes)
+    for champs in lignes:
+        if col_cout is None:
+            cout = default_cost
+        else:
+            valeur = _parse_costs([champs[col_cout]], couts.typecode)
+            if valeur is None:
+                raise ValueError(f"{path}: coût invalide {champs[col_cout][:40]!r}")
+            if valeur.typecode != couts.typecode:
+                couts = array("d", couts)
+            cout = valeur[0]
+
+        i = index.setdefault(champs[col_source], len(index))
+        j = index.setdefault(champs[col_cible], len(index))
+        sources.append(i)
+        cibles.append(j)
+        couts.append(cout)
+        if undirected:
+            sources.append(j)
+            cibles.append(i)
+            couts.append(cout)
+    return couts
+
+
+# ----------------------------
+# Format DIMACS (9th DIMACS Implementation Challenge)
+# ----------------------------
+def load_dimacs(path: str, chunk_size: int = CHUNK_SIZE,
+                progress: Optional[Callable[[LoadReport], None]] = None,
+                verbose: bool = False) -> CSRGraph:
+    """
+    Charge un graphe DIMACS « .gr » (.gr.gz accepté):
+        c commentaire
+        p sp <n> <m>
+        a <u> <v> <coût>
+    Les états gardent leur numéro DIMACS (1..n) comme nom; l'index nom ->
+    identifiant est un RangeIndex, sans dict de n entrées. Un arc dont une
+    extrémité sort de 1..n lève ValueError.
+    """
+    report = LoadReport(path, "dimacs")
+    debut = time.perf_counter()
+    n = None
+    sources, cibles, couts = array("i"), array("i"), array("q")
+
+    for bloc in _blocks(path, chunk_size, report):
+        report.lines += bloc.count(b"\n") + 1
+        champs = bloc.split()
+        if champs[::4].count(b"a") * 4 == len(champs):
+            # Bloc composé uniquement de lignes « a u v w »
+            sources.extend(array("i", map(int, champs[1::4])))
+            cibles.extend(array("i", map(int, champs[2::4])))
+            couts.extend(array("q", map(int, champs[3::4])))
+        else:
+            for ligne in bloc.split(b"\n"):
+                if ligne[:1] == b"a":
+                    _, u, v, cout = ligne.split()
+                    sources.append(int(u))
+                    cibles.append(int(v))
+                    couts.append(int(cout))
+                elif ligne[:1] == b"p":
+                    n = int(ligne.split()[2])
+        report.edges = len(sources)
+        if progress is not None:
+            progress(report)
+
+    if n is None:
+        raise ValueError(f"{path}: ligne 'p sp <n> <m>' absente")
+    for extremites in (sources, cibles):
+        if len(extremites):
+            bas, haut = _bounds(extremites)
+            if bas < 1 or haut > n:
+                hors = bas if bas < 1 else haut
+                raise ValueError(f"{path}: arc vers le nœud {hors}, hors de 1..{n}")
+    # Numéros DIMACS 1..n -> identifiants 0..n-1
+    if np is not None and len(sources):
+        np.frombuffer(sources, dtype=np.int32)[:] -= 1
+        np.frombuffer(cibles, dtype=np.int32)[:] -= 1
+    else:
+        sources = array("i", [u - 1 for u in sources])
+        cibles = array("i", [v - 1 for v in cibles])
+    return _finish(report, debut, n, range(1, n + 1), RangeIndex(1, n),
+                   sources, cibles, couts, verbose)
+
+
+def _bounds(valeurs: array):
+    """(minimum, maximum) d'un array('i') non vide"""
+    if np is not None:
+        # La vue NumPy est libérée au retour: l'array reste redimensionnable
+        vue = np.frombuffer(valeurs, dtype=np.int32)
+        return int(vue.min()), int(vue.max())
+    return min(valeurs), max(valeurs)
+
+
+def load_graph(path: str, **options) -> CSRGraph:
+    """Choisit le chargeur d'après l'extension: .gr (DIMACS) ou liste d'arêtes"""
+    base = path[:-3] if path.endswith(".gz") else path
+    if base.endswith(".gr"):
+        return load_dimacs(path, **options)
+    return load_edge_list(path, **options)
@@ -0,0 +1,427 @@
+import heapq
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: seul GridMap.from_array l'utilise
+    np = None
+
+from problem_solving_agent import Problem, SearchResult, SearchStats, SearchStrategy, _clock, _since
+
+SQRT2 = math.sqrt(2)
+
+Cell = Tuple[int, int]
+
+# Octet -> 0 (bloqué) ou 1 (libre)
+_BINARY = bytes([0] + [1] * 255)
+
+
+def octile_distance(a: Cell, b: Cell) -> float:
+    """Distance sur une grille 8-connexe (coût 1 en ligne droite, √2 en diagonale)"""
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+# ----------------------------
+# Carte d'occupation
+# ----------------------------
+class GridMap:
+    """
+    Carte d'occupation 2D compacte: un octet par cellule (1 = libre, 0 = bloquée)
+    dans un bytearray entouré d'une bordure bloquée. Les voisins d'une cellule
+    s'obtiennent par simple addition d'indice, sans aucun test de bornes.
+    La cellule (x, y) a l'indice (y + 1) * stride + x + 1.
+
+        plan = GridMap.from_strings(["....#", ".##.#", "....."])
+        probleme = GridProblem(plan, (0, 0), (4, 2))
+    """
+
+    def __init__(self, width: int, height: int, cells: Optional[bytes] = None):
+        """cells: width * height octets ligne par ligne, non nul = libre (défaut: tout libre)"""
+        if cells is not None and len(cells) != width * height:
+            raise ValueError(f"{len(cells)} cellules pour une grille {width}x{height}")
+        self.width = width
+        self.height = height
+        self.stride = stride = width + 2
+        self.free = bytearray(stride * (height + 2))
+        cells = b"\1" * (width * height) if cells is None else bytes(cells).translate(_BINARY)
+        for y in range(height):
+            debut = (y + 1) * stride + 1
+            self.free[debut:debut + width] = cells[y * width:(y + 1) * width]
+
+    @classmethod
+    def from_strings(cls, lines: Iterable[str], blocked: str = "#@OTW") -> "GridMap":
+        """Carte ASCII (une chaîne par ligne); les caractères de `blocked` sont des obstacles"""
+        lines = [line.rstrip("\r\n") for line in lines]
+        width = max((len(line) for line in lines), default=0)
+        table = bytearray(_BINARY)
+        for c in blocked:
+            table[ord(c)] = 0
+        cells = b"".join(line.ljust(width, blocked[0]).encode("latin-1").translate(table)
+                         for line in lines)
+        return cls(width, len(lines), cells)
+
+    @classmethod
+    def from_array(cls, array: Any) -> "GridMap":
+        """Tableau 2D (hauteur x largeur) de booléens ou d'entiers, vrai = libre"""
+        if np is not None and hasattr(array, "shape"):
+            libre = np.ascontiguousarray(np.asarray(array) != 0, dtype=np.uint8)
+            height, width = libre.shape
+            return cls(width, height, libre.tobytes())
+        rows = [bytes(1 if v else 0 for v in row) for row in array]
+        width = len(rows[0]) if rows else 0
+        return cls(width, len(rows), b"".join(rows))
+
+    @classmethod
+    def load(cls, path: str) -> "GridMap":
+        """
+        Lit une carte ASCII: format .map des benchmarks de recherche sur grille
+        ("type octile / height / width / map" puis les lignes) ou lignes brutes.
+        """
+        with open(path, encoding="latin-1") as f:
+            lines = f.read().splitlines()
+        if lines and lines[0].startswith("type"):
+            debut = next(i for i, line in enumerate(lines) if line.strip() == "map") + 1
+            lines = lines[debut:]
+        return cls.from_strings([line for line in lines if line])
+
+    def index(self, cell: Cell) -> int:
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError(cell)
+        return (y + 1) * self.stride + x + 1
+
+    def cell(self, index: int) -> Cell:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def is_free(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.free[self.index((x, y))])
+
+    def set_free(self, x: int, y: int, free: bool = True) -> None:
+        self.free[self.index((x, y))] = 1 if free else 0
+
+    @property
+    def free_cells(self) -> int:
+        return self.free.count(1)
+
+    def __repr__(self) -> str:
+        return f"GridMap({self.width}x{self.height}, libres={self.free_cells})"
+
+
+class GridHeuristic:
+    """
+    Distance au but calculée à la demande (aucune table de n valeurs):
+    octile en 8-connexité, Manhattan en 4-connexité. Admissible et consistante.
+    """
+
+    __slots__ = ("stride", "gx", "gy", "diagonal", "integral")
+
+    def __init__(self, stride: int, goal: int, diagonal: bool):
+        self.stride = stride
+        self.gy, self.gx = divmod(goal, stride)
+        self.diagonal = diagonal
+        # Distances de Manhattan entières: permet les seaux de Dial à SearchStrategy
+        self.integral = not diagonal
+
+    def __getitem__(self, state: int) -> float:
+        y, x = divmod(state, self.stride)
+        dx = abs(x - self.gx)
+        dy = abs(y - self.gy)
+        if not self.diagonal:
+            return dx + dy
+        if dx < dy:
+            return dy + (SQRT2 - 1) * dx
+        return dx + (SQRT2 - 1) * dy
+
+
+# ----------------------------
+# Problème de navigation sur grille
+# ----------------------------
+class GridProblem(Problem):
+    """
+    Navigation sur une GridMap: 4-connexité (coût 1) ou 8-connexité (coût √2
+    en diagonale, sans couper les coins: les deux cellules adjacentes doivent
+    être libres). Les états de recherche sont les indices de cellules de la
+    grille; les chemins retournés sont des listes de (x, y).
+
+    Sans heuristique explicite, A* utilise la distance octile (ou Manhattan):
+        SearchStrategy.a_star(GridProblem(plan, depart, but))
+        jump_point_search(GridProblem(plan, depart, but))
+    """
+
+    def __init__(self, grid: GridMap, start: Cell, goal: Cell, diagonal: bool = True):
+        for nom, cellule in (("départ", start), ("but", goal)):
+            if not grid.is_free(*cellule):
+                raise ValueError(f"Cellule de {nom} {cellule} bloquée ou hors de la grille")
+        super().__init__(grid.index(start), grid.index(goal))
+        self.grid = grid
+        self.diagonal = diagonal
+        w = grid.stride
+        self._straight = (1, -1, w, -w)
+        # (décalage diagonal, les deux décalages orthogonaux qui doivent être libres)
+        self._diagonals = ((w + 1, 1, w), (w - 1, -1, w), (-w + 1, 1, -w), (-w - 1, -1, -w))
+        self.heuristic = GridHeuristic(w, self.goal_state, diagonal)
+
+    def actions(self, state: int) -> List[int]:
+        return [voisin for voisin, _ in self.get_successors(state)]
+
+    def result(self, state: int, action: int) -> int:
+        return action
+
+    def goal_test(self, state: int) -> bool:
+        return state == self.goal_state
+
+    def path_cost(self, cost_so_far: float, state1: int, action: int, state2: int) -> float:
+        return cost_so_far + (1 if abs(state2 - state1) in (1, self.grid.stride) else SQRT2)
+
+    def get_successors(self, state: int) -> List[Tuple[int, float]]:
+        libre = self.grid.free
+        successeurs = [(state + d, 1) for d in self._straight if libre[state + d]]
+        if self.diagonal:
+            for d, a, b in self._diagonals:
+                if libre[state + d] and libre[state + a] and libre[state + b]:
+                    successeurs.append((state + d, SQRT2))
+        return successeurs
+
+    def get_predecessors(self, state: int) -> List[Tuple[int, float]]:
+        return self.get_successors(state)   # grille non orientée
+
+    def decode_path(self, path: List[int]) -> List[Cell]:
+        cell = self.grid.cell
+        return [cell(state) for state in path]
+
+    def encode_heuristics(self, heuristics: Any) -> Any:
+        """None: distance octile/Manhattan au but; dict {(x, y): h} traduit en indices"""
+        if heuristics is None:
+            return self.heuristic
+        if isinstance(heuristics, dict):
+            index = self.grid.index
+            return {index(cellule): h for cellule, h in heuristics.items()}
+        return heuristics
+
+    def max_integer_cost(self) -> Optional[int]:
+        return None if self.diagonal else 1
+
+    # ----------------------------
+    # Jump Point Search
+    # ----------------------------
+    def jump_successors(self, state: int, parent: Optional[int]) -> List[Tuple[int, float]]:
+        """
+        Successeurs JPS (Harabor & Grastien): seules les directions naturelles
+        et forcées depuis la direction d'arrivée sont explorées, et chacune est
+        suivie jusqu'au prochain point de saut. Coût = distance octile (ou
+        Manhattan), exacte car chaque saut suit une seule direction.
+        """
+        libre = self.grid.free
+        w = self.grid.stride
+        but = self.goal_state
+        successeurs = []
+        for dx, dy in self._pruned_directions(state, parent):
+            if dx and dy:
+                point = _jump_diagonal(libre, state + dx + dy * w, dx, dy * w, w, but)
+            elif not self.diagonal and dy:
+                point = _jump_vertical4(libre, state + dy * w, dy * w, w, but)
+            elif dx:
+                point = _jump_straight(libre, state + dx, dx, w, but)
+            else:
+                point = _jump_straight(libre, state + dy * w, dy * w, 1, but)
+            if point is not None:
+                py, px = divmod(point, w)
+                sy, sx = divmod(state, w)
+                pas = max(abs(px - sx), abs(py - sy))
+                successeurs.append((point, pas * SQRT2 if dx and dy else pas))
+        return successeurs
+
+    def _pruned_directions(self, state: int, parent: Optional[int]) -> List[Tuple[int, int]]:
+        libre = self.grid.free
+        w = self.grid.stride
+        if parent is None:
+            directions = [(d, 0) for d in (1, -1)] + [(0, d) for d in (1, -1)]
+            if self.diagonal:
+                directions += [(dx, dy) for dx in (1, -1) for dy in (1, -1)
+                               if libre[state + dx + dy * w] and libre[state + dx] and libre[state + dy * w]]
+            return [(dx, dy) for dx, dy in directions if libre[state + dx + dy * w]]
+
+        sy, sx = divmod(state, w)
+        py, px = divmod(parent, w)
+        dx = (sx > px) - (sx < px)
+        dy = (sy > py) - (sy < py)
+        directions = []
+        if dx and dy:
+            # Diagonale: les deux composantes, puis la diagonale si aucun coin n'est coupé
+            horizontal, vertical = libre[state + dx], libre[state + dy * w]
+            if vertical:
+                directions.append((0, dy))
+            if horizontal:
+                directions.append((dx, 0))
+            if horizontal and vertical and libre[state + dx + dy * w]:
+                directions.append((dx, dy))
+        elif not self.diagonal:
+            # 4-connexité: tout droit et les deux perpendiculaires
+            if dx:
+                candidats = ((dx, 0), (0, 1), (0, -1))
+            else:
+                candidats = ((0, dy), (1, 0), (-1, 0))
+            directions = [(a, b) for a, b in candidats if libre[state + a + b * w]]
+        elif dx:
+            suivant = libre[state + dx]
+            for cote in (1, -1):
+                if libre[state + cote * w]:
+                    if suivant and libre[state + dx + cote * w]:
+                        directions.append((dx, cote))
+                    directions.append((0, cote))
+            if suivant:
+                directions.append((dx, 0))
+        else:
+            suivant = libre[state + dy * w]
+            for cote in (1, -1):
+                if libre[state + cote]:
+                    if suivant and libre[state + cote + dy * w]:
+                        directions.append((cote, dy))
+                    directions.append((cote, 0))
+            if suivant:
+                directions.append((0, dy))
+        return directions
+
+    def expand_path(self, jump_points: Sequence[int]) -> List[int]:
+        """Relie les points de saut successifs cellule par cellule"""
+        w = self.grid.stride
+        chemin = list(jump_points[:1])
+        for a, b in zip(jump_points, jump_points[1:]):
+            ay, ax = divmod(a, w)
+            by, bx = divmod(b, w)
+            pas = ((bx > ax) - (bx < ax)) + ((by > ay) - (by < ay)) * w
+            chemin.extend(range(a + pas, b + pas, pas))
+        return chemin
+
+
+# Sauts: `c` est la première cellule dans la direction; retournent le point
+# de saut atteint, ou None si un obstacle est rencontré avant.
+def _jump_straight(libre: bytearray, c: int, pas: int, cote: int, but: int) -> Optional[int]:
+    """Ligne droite (8-connexité, ou horizontale en 4-connexité): s'arrête sur un voisin forcé"""
+    while libre[c]:
+        if c == but:
+            return c
+        if (libre[c + cote] and not libre[c + cote - pas]) or (libre[c - cote] and not libre[c - cote - pas]):
+            return c
+        c += pas
+    return None
+
+
+def _jump_diagonal(libre: bytearray, c: int, dx: int, sy: int, w: int, but: int) -> Optional[int]:
+    """Diagonale: s'arrête dès qu'un saut horizontal ou vertical trouve un point de saut"""
+    while libre[c]:
+        if c == but:
+            return c
+        if (_jump_straight(libre, c + dx, dx, w, but) is not None
+                or _jump_straight(libre, c + sy, sy, 1, but) is not None):
+            return c
+        if not (libre[c + dx] and libre[c + sy]):
+            return None   # avancer couperait un coin
+        c += dx + sy
+    return None
+
+
+def _jump_vertical4(libre: bytearray, c: int, sy: int, w: int, but: int) -> Optional[int]:
+    """Vertical en 4-connexité: s'arrête aussi si un saut horizontal trouve un point de saut"""
+    while libre[c]:
+        if c == but:
+            return c
+        if (libre[c + 1] and not libre[c + 1 - sy]) or (libre[c - 1] and not libre[c - 1 - sy]):
+            return c
+        if (_jump_straight(libre, c + 1, 1, w, but) is not None
+                or _jump_straight(libre, c - 1, -1, w, but) is not None):
+            return c
+        c += sy
+    return None
+
+
+# ----------------------------
+# Recherche
+# ----------------------------
+def jump_point_search(problem: GridProblem, observer: Any = None) -> SearchResult:
+    """
+    A* sur les seuls points de saut: les chemins symétriques des zones
+    ouvertes ne sont jamais développés. Même coût optimal qu'A* sur la
+    grille; le chemin retourné est complet (cellule par cellule).
+    nodes_expanded compte les points de saut développés.
+
+    Le gain est maximal sur les plans de bâtiments (grandes pièces reliées
+    par des portes). En 4-connexité, des obstacles épars multiplient les
+    points de saut: A* (seaux de Dial) y reste souvent plus rapide.
+    """
+    return SearchStrategy._timed("jps", lambda: _jps_kernel(problem, observer))
+
+
+def _jps_kernel(problem: GridProblem, observer: Any) -> SearchResult:
+    """Noyau A* de jump_point_search, sur le modèle de SearchStrategy._a_star_kernel"""
+    initial = problem.initial_state
+    but = problem.goal_state
+    h = problem.heuristic
+    frontiere = [(h[initial], initial)]
+    explore = set()
+    parents: Dict[int, int] = {}
+    cout_cumule = {initial: 0}
+    jump_successors = problem.jump_successors
+    notify = observer is not None
+    heappop = heapq.heappop
+    heappush = heapq.heappush
+    if notify:
+        observer.bind(problem)
+        observer.init_trace(frontiere, explore, "jps")
+
+    def get_successors(etat):
+        return jump_successors(etat, parents.get(etat))
+    get_successors, heappush = SearchStrategy._hooks(observer, get_successors, heappush, True)
+
+    iteration = 0
+    generes = 1
+    max_frontiere = 1
+    perimes = 0
+    doublons = 0
+
+    while frontiere:
+        f_actuel, etat_actuel = heappop(frontiere)
+        g_actuel = cout_cumule[etat_actuel]
+        if f_actuel != g_actuel + h[etat_actuel]:
+            perimes += 1
+            continue
+
+        if etat_actuel == but:
+            if notify:
+                observer.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+            stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                        perimes, doublons, SearchStats.HEAP_ENTRY)
+            stats.frontier = "heap"
+            debut = _clock()
+            points = SearchStrategy._reconstruct_path(parents, but, initial)
+            chemin = problem.decode_path(problem.expand_path(points))
+            stats.add_phase("reconstruct", *_since(debut))
+            return SearchResult(chemin, g_actuel, stats.expanded, generes, max_frontiere, stats=stats)
+
+        explore.add(etat_actuel)
+        for successeur, cout in get_successors(etat_actuel):
+            nouveau_cout = g_actuel + cout
+            ancien = cout_cumule.get(successeur)
+            if ancien is None or nouveau_cout < ancien:
+                if ancien is not None:
+                    doublons += 1
+                cout_cumule[successeur] = nouveau_cout
+                parents[successeur] = etat_actuel
+                heappush(frontiere, (nouveau_cout + h[successeur], successeur))
+                generes += 1
+        if len(frontiere) > max_frontiere:
+            max_frontiere = len(frontiere)
+
+        if notify:
+            observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+        iteration += 1
+
+    if notify:
+        observer.failure_trace()
+    stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                perimes, doublons, SearchStats.HEAP_ENTRY)
+    stats.frontier = "heap"
+    return SearchStrategy._failure(stats)
@@ -0,0 +1,231 @@
+from array import array
+from collections import deque
+import csv
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# ----------------------------
+# Historiques d'agent (Agent.history)
+# ----------------------------
+# Tous les historiques acceptent append((percept, action)) comme une liste,
+# ce qui permet de remplacer Agent.history sans toucher aux programmes:
+#     agent.history = make_history("ring", capacity=1000, fields=("location",))
+
+
+def _project(percept: Any, fields: Optional[Sequence[str]]) -> Any:
+    """Ne garde du percept que les champs demandés (lus avec percept.get)"""
+    if fields is None or percept is None:
+        return percept
+    return {champ: percept.get(champ) for champ in fields}
+
+
+def _percept_fields(percept: Any) -> List[str]:
+    """Champs d'un percept: clés de percept_formulation() (NavigationPercept), ou d'un dict"""
+    # percept_formulation d'abord: NavigationPercept hérite de dict mais reste vide
+    formulation = getattr(percept, "percept_formulation", None)
+    if callable(formulation):
+        return list(formulation().keys())
+    if isinstance(percept, dict):
+        return list(percept.keys())
+    raise ValueError(f"Champs du percept {type(percept).__name__} impossibles à déduire: "
+                     "passer fields=(...) à ColumnarHistory")
+
+
+class _Exportable:
+    fields: Optional[Sequence[str]] = None
+
+    def export(self, path: str) -> int:
+        """Écrit l'historique en CSV (colonnes: champs du percept puis action); retourne le nombre de lignes"""
+        champs = list(self.fields) if self.fields is not None else ["percept"]
+        lignes = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(champs + ["action"])
+            for percept, action in self:
+                if self.fields is None:
+                    writer.writerow([percept, action])
+                else:
+                    writer.writerow([percept.get(champ) for champ in champs] + [action])
+                lignes += 1
+        return lignes
+
+
+class RingHistory(_Exportable):
+    """Garde seulement les `capacity` derniers (percept, action)"""
+
+    def __init__(self, capacity: int, fields: Optional[Sequence[str]] = None):
+        self.capacity = capacity
+        self.fields = fields
+        self.total = 0  # nombre d'entrées reçues depuis le début
+        self._entries: deque = deque(maxlen=capacity)
+
+    def append(self, entry: Tuple[Any, Any]) -> None:
+        percept, action = entry
+        self._entries.append((_project(percept, self.fields), action))
+        self.total += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(self._entries)
+
+    def __getitem__(self, index: int) -> Tuple[Any, Any]:
+        return self._entries[index]
+
+
+class _Column:
+    """
+    Colonne compacte d'un champ de percept: array('q') pour des entiers,
+    array('d') pour des réels, sinon codes entiers vers un vocabulaire interné.
+    """
+
+    def __init__(self):
+        self.kind: Optional[str] = None
+        self.values: Any = None
+        self.vocabulary: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def append(self, valeur: Any) -> None:
+        if self.kind is None:
+            self.kind = "q" if type(valeur) is int else "d" if type(valeur) is float else "code"
+            self.values = array("i" if self.kind == "code" else self.kind)
+        if self.kind != "code" and type(valeur) is (int if self.kind == "q" else float):
+            try:
+                self.values.append(valeur)
+                return
+            except OverflowError:
+                pass
+        if self.kind != "code":
+            # Valeur d'un autre type: la colonne devient une colonne de codes
+            anciennes = self.values.tolist()
+            self.kind, self.values = "code", array("i", [self._intern(v) for v in anciennes])
+        self.values.append(self._intern(valeur))
+
+    def _intern(self, valeur: Any) -> int:
+        try:
+            code = self._codes.get(valeur)
+        except TypeError:  # valeur non hachable: stockée telle quelle
+            self.vocabulary.append(valeur)
+            return len(self.vocabulary) - 1
+        if code is None:
+            code = self._codes[valeur] = len(self.vocabulary)
+            self.vocabulary.append(valeur)
+        return code
+
+    def __getitem__(self, index: int) -> Any:
+        valeur = self.values[index]
+        return self.vocabulary[valeur] if self.kind == "code" else valeur
+
+    def __len__(self) -> int:
+        return len(self.values) if self.values is not None else 0
+
+    def decoded(self) -> List[Any]:
+        if self.values is None:
+            return []
+        if self.kind == "code":
+            vocabulaire = self.vocabulary
+            return [vocabulaire[code] for code in self.values]
+        return self.values.tolist()
+
+
+class ColumnarHistory(_Exportable):
+    """
+    Historique en colonnes: une colonne compacte par champ de percept retenu
+    et les actions sous forme de codes internés (array('i') + vocabulaire).
+    Sans `fields`, les clés du premier percept sont utilisées (dict, ou
+    percept_formulation() d'un objet percept). Un ensemble de colonnes vide
+    lève ValueError plutôt que de n'enregistrer que les actions.
+    """
+
+    def __init__(self, fields: Optional[Sequence[str]] = None):
+        if fields is not None and not fields:
+            raise ValueError("ColumnarHistory: fields ne peut pas être vide")
+        self.fields = list(fields) if fields is not None else None
+        self.columns: Dict[str, _Column] = {}
+        self.actions = _Column()
+
+    def append(self, entry: Tuple[Any, Any]) -> None:
+        percept, action = entry
+        if self.fields is None:
+            champs = _percept_fields(percept)
+            if not champs:
+                raise ValueError("ColumnarHistory: le premier percept n'a aucun champ, passer fields=(...)")
+            self.fields = champs
+        for champ in self.fields:
+            colonne = self.columns.get(champ)
+            if colonne is None:
+                colonne = self.columns[champ] = _Column()
+            colonne.append(percept.get(champ) if percept is not None else None)
+        self.actions.append(action)
+
+    def clear(self) -> None:
+        self.columns.clear()
+        self.actions = _Column()
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def __getitem__(self, index: int) -> Tuple[Dict[str, Any], Any]:
+        if index < 0:
+            index += len(self)
+        percept = {champ: self.columns[champ][index] for champ in self.fields or ()}
+        return percept, self.actions[index]
+
+    def __iter__(self) -> Iterator[Tuple[Dict[str, Any], Any]]:
+        champs = self.fields or []
+        colonnes = [self.columns[champ].decoded() for champ in champs]
+        rangees = zip(*colonnes) if colonnes else (() for _ in range(len(self)))
+        for valeurs, action in zip(rangees, self.actions.decoded()):
+            yield dict(zip(champs, valeurs)), action
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Colonnes décodées {champ: valeurs, "action": actions}"""
+        colonnes = {champ: self.columns[champ].decoded() for champ in self.fields or ()}
+        colonnes["action"] = self.actions.decoded()
+        return colonnes
+
+    def export(self, path: str) -> int:
+        """Export CSV colonne par colonne (sans reconstruire les percepts)"""
+        colonnes = self.to_columns()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(list(colonnes))
+            writer.writerows(zip(*colonnes.values()))
+        return len(self)
+
+
+class NullHistory(_Exportable):
+    """Historique désactivé: ne garde rien, compte seulement les entrées"""
+
+    def __init__(self):
+        self.total = 0
+
+    def append(self, entry: Tuple[Any, Any]) -> None:
+        self.total += 1
+
+    def clear(self) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return 0
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(())
+
+
+def make_history(mode: str = "list", capacity: int = 1000,
+                 fields: Optional[Sequence[str]] = None):
+    """Fabrique un historique: "list" (défaut d'Agent), "ring", "columnar" ou "off" """
+    if mode == "list":
+        return []
+    if mode == "ring":
+        return RingHistory(capacity, fields)
+    if mode == "columnar":
+        return ColumnarHistory(fields)
+    if mode == "off":
+        return NullHistory()
+    raise ValueError(f"Mode d'historique inconnu: {mode}")
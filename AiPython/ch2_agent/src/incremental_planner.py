@@ -0,0 +1,205 @@
+from collections import deque
+import heapq
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from problem_solving_agent import NavigationProblem, SearchResult
+
+INF = float("inf")
+
+
+# ----------------------------
+# Replanification incrémentale: D* Lite
+# ----------------------------
+class DStarLitePlanner:
+    """
+    Planificateur D* Lite (Koenig & Likhachev) utilisable comme search_strategy
+    d'un ProblemSolvingAgent.
+
+    La recherche se fait à rebours depuis le but; les valeurs g/rhs sont
+    conservées entre deux appels. Quand l'agent s'est déplacé ou que des arêtes
+    ont changé (update_edge / notify_edge_change), seule la partie concernée
+    est réparée au lieu de relancer une recherche complète.
+
+    `heuristic(a, b)` doit être une borne inférieure de d(a, b) qui reste
+    admissible après les changements de coûts (zéro par défaut; une
+    LandmarkHeuristic.estimate convient tant que les coûts ne font qu'augmenter).
+    """
+
+    def __init__(self, heuristic: Optional[Callable[[Any, Any], float]] = None):
+        self.heuristic = heuristic if heuristic is not None else (lambda a, b: 0)
+        self.graph: Optional[dict] = None
+        self.goal = None
+        self.start = self.last = None
+        self.km = 0
+        self.g: Dict[Any, float] = {}
+        self.rhs: Dict[Any, float] = {}
+        self._pending: Set[Any] = set()
+        self._pred: Dict[Any, Dict[Any, float]] = {}
+        self._queue = []
+        self._queued: Dict[Any, Tuple[float, float]] = {}
+
+    # ----------------------------
+    # Interface search_strategy
+    # ----------------------------
+    def __call__(self, problem: NavigationProblem) -> SearchResult:
+        debut = time.perf_counter()
+        start = problem.initial_state
+        if problem.graph is not self.graph or problem.goal_state != self.goal:
+            self._reset(problem.graph, start, problem.goal_state)
+        elif start != self.start or self._pending:
+            # L'agent a bougé: les clés déjà en file restent valides grâce à km
+            self.km += self.heuristic(self.last, start)
+            self.last = start
+            self.start = start
+            for u in self._pending:
+                self._update_vertex(u)
+            self._pending.clear()
+
+        expanses = self._compute_shortest_path()
+        resultat = self._extract_path(expanses)
+        resultat.elapsed = time.perf_counter() - debut
+        resultat.strategy = "d-star-lite"
+        return resultat
+
+    # ----------------------------
+    # Modifications du graphe
+    # ----------------------------
+    def update_edge(self, u: Any, v: Any, cost: Optional[float]) -> None:
+        """Change le coût de l'arête u -> v dans le graphe (None = arête supprimée)"""
+        if self.graph is None:
+            raise RuntimeError("Aucun graphe: appeler le planificateur sur un problème d'abord")
+        if hasattr(self.graph, "set_edge"):
+            # VersionedGraph: la modification invalide aussi les chemins en cache
+            if cost is None:
+                self.graph.remove_edge(u, v)
+            else:
+                self.graph.set_edge(u, v, cost)
+        elif cost is None:
+            self.graph.get(u, {}).pop(v, None)
+        else:
+            self.graph.setdefault(u, {})[v] = cost
+        self.notify_edge_change(u, v)
+
+    def notify_edge_change(self, u: Any, v: Any) -> None:
+        """
+        Signale une arête u -> v déjà modifiée directement dans problem.graph.
+        Sans effet avant le premier plan: celui-ci lira le graphe à jour.
+        """
+        if self.graph is None:
+            return
+        cost = self.graph.get(u, {}).get(v)
+        if cost is None:
+            self._pred.get(v, {}).pop(u, None)
+        else:
+            self._pred.setdefault(v, {})[u] = cost
+        self._pending.add(u)
+
+    # ----------------------------
+    # D* Lite
+    # ----------------------------
+    def _reset(self, graph: dict, start: Any, goal: Any) -> None:
+        self.graph = graph
+        self.goal = goal
+        self.start = self.last = start
+        self.km = 0
+        self.g = {}
+        self.rhs = {goal: 0}
+        self._pending.clear()
+        # Adjacence inverse propre au planificateur, tenue à jour par notify_edge_change
+        self._pred = {}
+        for etat, voisins in graph.items():
+            for voisin, cout in voisins.items():
+                self._pred.setdefault(voisin, {})[etat] = cout
+        self._queue = []
+        self._queued: Dict[Any, Tuple[float, float]] = {}
+        self._push(goal, self._key(goal))
+
+    def _key(self, s: Any) -> Tuple[float, float]:
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self.heuristic(self.start, s) + self.km, m)
+
+    def _push(self, s: Any, key: Tuple[float, float]) -> None:
+        self._queued[s] = key
+        heapq.heappush(self._queue, (key, s))
+
+    def _top(self):
+        """Premier élément valide de la file (suppression paresseuse)"""
+        file, queued = self._queue, self._queued
+        while file:
+            key, s = file[0]
+            if queued.get(s) == key:
+                return key, s
+            heapq.heappop(file)
+        return (INF, INF), None
+
+    def _update_vertex(self, u: Any) -> None:
+        if u != self.goal:
+            g = self.g
+            self.rhs[u] = min((cout + g.get(v, INF) for v, cout in self.graph.get(u, {}).items()),
+                              default=INF)
+        self._queued.pop(u, None)
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self._push(u, self._key(u))
+
+    def _compute_shortest_path(self) -> int:
+        g, rhs = self.g, self.rhs
+        expanses = 0
+        while True:
+            k_old, u = self._top()
+            if u is None:
+                break
+            # Les clés égales à celle du départ sont aussi traitées: avec une arête
+            # de coût nul, un successeur du départ peut partager sa clé tout en
+            # étant incohérent, et le chemin extrait passerait par sa valeur périmée
+            if not (k_old <= self._key(self.start) or rhs.get(self.start, INF) != g.get(self.start, INF)):
+                break
+            heapq.heappop(self._queue)
+            del self._queued[u]
+            expanses += 1
+
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u, k_new)
+            elif g.get(u, INF) > rhs.get(u, INF):
+                g[u] = rhs[u]
+                for s in self._pred.get(u, {}):
+                    self._update_vertex(s)
+            else:
+                g[u] = INF
+                self._update_vertex(u)
+                for s in self._pred.get(u, {}):
+                    self._update_vertex(s)
+        return expanses
+
+    def _extract_path(self, expanses: int) -> SearchResult:
+        """
+        Suit les successeurs minimisant c(s, s') + g(s') jusqu'au but. Les
+        ex aequo (cycles de coût nul) sont tous explorés en largeur: un choix
+        glouton pourrait revenir sur ses pas sans jamais atteindre le but.
+        """
+        g = self.g
+        if g.get(self.start, INF) == INF and self.rhs.get(self.start, INF) == INF:
+            return SearchResult(None, INF, expanses)
+        parents = {self.start: None}
+        file = deque([self.start])
+        while file:
+            etat = file.popleft()
+            if etat == self.goal:
+                break
+            voisins = self.graph.get(etat, {})
+            meilleur = min((cout + g.get(v, INF) for v, cout in voisins.items()), default=INF)
+            if meilleur == INF:
+                continue
+            for v, cout in voisins.items():
+                if v not in parents and cout + g.get(v, INF) == meilleur:
+                    parents[v] = etat
+                    file.append(v)
+        if self.goal not in parents:
+            return SearchResult(None, INF, expanses)
+        chemin = [self.goal]
+        while parents[chemin[-1]] is not None:
+            chemin.append(parents[chemin[-1]])
+        chemin.reverse()
+        cout_total = sum(self.graph[u][v] for u, v in zip(chemin, chemin[1:]))
+        return SearchResult(chemin, cout_total, expanses, 0, len(self._queued))
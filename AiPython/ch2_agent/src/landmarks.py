@@ -0,0 +1,150 @@
+from array import array
+import heapq
+import random
+from typing import Any, List, Optional
+
+from csr_graph import CSRGraph
+
+INF = float("inf")
+
+
+def _dijkstra_all(graph: CSRGraph, source: int) -> array:
+    """Distances depuis source vers tous les états (inf si inaccessible)"""
+    dist = array("d", [INF]) * len(graph)
+    dist[source] = 0.0
+    file = [(0.0, source)]
+    offsets, targets, costs = graph.offsets, graph.targets, graph.costs
+    while file:
+        d, u = heapq.heappop(file)
+        if d > dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + costs[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(file, (nd, v))
+    return dist
+
+
+# ----------------------------
+# Heuristique ALT (A*, Landmarks, Triangle inequality)
+# ----------------------------
+class LandmarkHeuristic:
+    """
+    Heuristique admissible pour n'importe quel couple (départ, but), calculée
+    à partir des distances exactes depuis/vers k points de repère (landmarks).
+
+    Par l'inégalité triangulaire, pour tout repère L:
+        d(u, v) >= d(u, L) - d(v, L)   et   d(u, v) >= d(L, v) - d(L, u)
+    La borne retenue est le maximum sur les repères (jamais négative).
+    """
+
+    def __init__(self, graph: CSRGraph, landmarks: List[int], dist_from: array, dist_to: array):
+        self.graph = graph
+        self.landmarks = landmarks
+        # Tableaux plats k x n: dist_from[i*n + v] = d(L_i, v), dist_to[i*n + v] = d(v, L_i)
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+
+    @classmethod
+    def build(cls, graph, k: int = 8, seed: int = 0) -> "LandmarkHeuristic":
+        """
+        Choisit k repères par sélection « le plus éloigné » puis calcule
+        les distances depuis et vers chacun (graphe dict ou CSRGraph).
+        """
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = len(graph)
+        inverse = graph.reverse()
+        k = min(k, n)
+
+        landmarks: List[int] = []
+        dist_from, dist_to = array("d"), array("d")
+        # Distance minimale (aller ou retour) de chaque état aux repères déjà choisis
+        proximite = [INF] * n
+        candidat = random.Random(seed).randrange(n) if n else 0
+
+        while len(landmarks) < k:
+            depuis = _dijkstra_all(graph, candidat)
+            vers = _dijkstra_all(inverse, candidat)
+            landmarks.append(candidat)
+            dist_from.extend(depuis)
+            dist_to.extend(vers)
+
+            for v in range(n):
+                d = min(depuis[v], vers[v])
+                if d < proximite[v]:
+                    proximite[v] = d
+            # Prochain repère: l'état atteignable le plus éloigné des repères existants.
+            # Les états encore non atteints (inf) sont prioritaires: autre composante.
+            candidat, meilleure = None, -1.0
+            for v in range(n):
+                p = proximite[v]
+                if p != 0 and p > meilleure:
+                    candidat, meilleure = v, p
+            if candidat is None:
+                break
+
+        return cls(graph, landmarks, dist_from, dist_to)
+
+    def estimate_ids(self, u: int, v: int) -> float:
+        """Borne inférieure admissible de d(u, v) sur identifiants internes"""
+        n = len(self.graph)
+        dist_from, dist_to = self.dist_from, self.dist_to
+        meilleure = 0.0
+        for i in range(len(self.landmarks)):
+            base = i * n
+            # d(u, v) >= d(u, L) - d(v, L)
+            du, dv = dist_to[base + u], dist_to[base + v]
+            if du != INF and dv != INF and du - dv > meilleure:
+                meilleure = du - dv
+            # d(u, v) >= d(L, v) - d(L, u)
+            du, dv = dist_from[base + u], dist_from[base + v]
+            if du != INF and dv != INF and dv - du > meilleure:
+                meilleure = dv - du
+        return meilleure
+
+    def estimate(self, start: Any, goal: Any) -> float:
+        """Borne inférieure admissible de la distance entre deux états nommés"""
+        return self.estimate_ids(self.graph.id_of(start), self.graph.id_of(goal))
+
+    def for_goal(self, goal: Any) -> "LandmarkTable":
+        """Table h(état) = estimation vers `goal`, utilisable par SearchStrategy.a_star"""
+        return LandmarkTable(self, self.graph.id_of(goal), vers_but=True)
+
+    def for_start(self, start: Any) -> "LandmarkTable":
+        """Table h(état) = estimation depuis `start` (pour bidirectional_a_star)"""
+        return LandmarkTable(self, self.graph.id_of(start), vers_but=False)
+
+
+class LandmarkTable:
+    """
+    Vue « dictionnaire » d'une LandmarkHeuristic pour une extrémité fixée.
+    Indexée par nom d'état (NavigationProblem); by_state_id() donne la vue
+    indexée par identifiant entier attendue par CSRNavigationProblem.
+    """
+
+    # Bornes inférieures par inégalité triangulaire: réutilisables par PathCache
+    admissible = True
+
+    def __init__(self, heuristic: LandmarkHeuristic, extremite: int, vers_but: bool,
+                 par_nom: bool = True):
+        self.heuristic = heuristic
+        self.extremite = extremite
+        self.vers_but = vers_but
+        self.par_nom = par_nom
+
+    def __getitem__(self, state: Any) -> float:
+        if self.par_nom:
+            state = self.heuristic.graph.id_of(state)
+        if self.vers_but:
+            return self.heuristic.estimate_ids(state, self.extremite)
+        return self.heuristic.estimate_ids(self.extremite, state)
+
+    def by_state_id(self, graph: Optional[CSRGraph] = None) -> "LandmarkTable":
+        """Vue indexée par identifiant entier du graphe CSR de la recherche"""
+        if graph is not None and graph is not self.heuristic.graph:
+            if list(graph.names) != list(self.heuristic.graph.names):
+                raise ValueError("Heuristique construite sur un autre graphe CSR")
+        return LandmarkTable(self.heuristic, self.extremite, self.vers_but, par_nom=False)
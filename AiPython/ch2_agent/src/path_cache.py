@@ -0,0 +1,304 @@
+from collections import OrderedDict
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from csr_graph import CSRGraph
+from problem_solving_agent import (
+    CSRNavigationProblem, NavigationProblem, SearchResult, SearchStats,
+    _clock, _since
+)
+
+# Stratégies dont les chemins sont de coût minimal: tout sous-chemin l'est aussi
+OPTIMAL_STRATEGIES = ("ucs", "a-star", "ida-star", "bidirectional-ucs", "bidirectional-a-star")
+
+
+# ----------------------------
+# Graphe versionné
+# ----------------------------
+class VersionedGraph(dict):
+    """
+    Graphe dict-of-dicts {état: {voisin: coût}} avec un numéro de version.
+    Toute modification passant par l'API ci-dessous ou par les méthodes de
+    dict (update, pop, setdefault, clear, ...) incrémente `version`, ce qui
+    invalide automatiquement les chemins en cache. Modifier directement les
+    dicts internes (graph[u][v] = c) n'est pas suivi: utiliser set_edge.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _touch(self) -> None:
+        self.version += 1
+
+    def set_edge(self, u: Any, v: Any, cost: float) -> None:
+        """Ajoute ou modifie l'arête u -> v"""
+        super().setdefault(u, {})[v] = cost
+        super().setdefault(v, {})
+        self._touch()
+
+    def remove_edge(self, u: Any, v: Any) -> None:
+        """Supprime l'arête u -> v si elle existe"""
+        if v in self.get(u, {}):
+            del self[u][v]
+            self._touch()
+
+    def add_state(self, state: Any) -> None:
+        if state not in self:
+            super().__setitem__(state, {})
+            self._touch()
+
+    def remove_state(self, state: Any) -> None:
+        """Supprime un état et toutes ses arêtes entrantes et sortantes"""
+        super().pop(state, None)
+        for voisins in self.values():
+            voisins.pop(state, None)
+        self._touch()
+
+    def __setitem__(self, state, voisins) -> None:
+        super().__setitem__(state, voisins)
+        self._touch()
+
+    def __delitem__(self, state) -> None:
+        super().__delitem__(state)
+        self._touch()
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def __ior__(self, other):
+        super().update(other)
+        self._touch()
+        return self
+
+    def pop(self, state, *default):
+        if state in self:
+            self._touch()
+        return super().pop(state, *default)
+
+    def popitem(self):
+        entree = super().popitem()
+        self._touch()
+        return entree
+
+    def setdefault(self, state, voisins=None):
+        if state not in self:
+            self._touch()
+        return super().setdefault(state, voisins)
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+
+class AdmissibleHeuristics(dict):
+    """
+    Dict d'heuristiques {état: h} déclaré admissible: les chemins A* / IDA*
+    calculés avec lui sont optimaux et leurs sous-chemins peuvent servir
+    d'autres requêtes. Toute table portant `admissible = True` (par exemple
+    LandmarkTable) est traitée de la même façon.
+    """
+
+    admissible = True
+
+
+def _heuristics_key(heuristics: Any) -> Any:
+    """Identité de l'heuristique (ou du tuple d'heuristiques) dans la clé du cache"""
+    if heuristics is None:
+        return None
+    if isinstance(heuristics, tuple):
+        return tuple(id(h) for h in heuristics)
+    return id(heuristics)
+
+
+def _same_heuristics(a: Any, b: Any) -> bool:
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+    return a is b
+
+
+def _trusted(heuristics: Any) -> bool:
+    """Chemin garanti optimal: aucune heuristique, ou heuristiques toutes déclarées admissibles"""
+    if heuristics is None:
+        return True
+    if isinstance(heuristics, tuple):
+        return all(_trusted(h) for h in heuristics)
+    return getattr(heuristics, "admissible", False) is True
+
+
+def graph_version(graph: Any) -> Optional[int]:
+    """Version d'un graphe cachable (None si ses modifications ne sont pas suivies)"""
+    if isinstance(graph, CSRGraph):
+        return 0  # immuable
+    return getattr(graph, "version", None)
+
+
+# ----------------------------
+# Cache LRU des requêtes résolues
+# ----------------------------
+class _Entry:
+    __slots__ = ("graph", "heuristics", "result", "positions", "prefix")
+
+    def __init__(self, graph, heuristics, result, positions, prefix):
+        self.graph = graph
+        self.heuristics = heuristics
+        self.result = result
+        self.positions = positions  # état -> indice dans le chemin
+        self.prefix = prefix        # coûts cumulés le long du chemin
+
+
+class PathCache:
+    """
+    Cache borné (LRU) des requêtes résolues, partagé par toutes les entrées de
+    recherche une fois installé avec SearchStrategy.set_path_cache(cache).
+
+    Clé: (graphe, version, départ, but, stratégie, identité de l'heuristique,
+    ou des deux heuristiques de bidirectional_a_star).
+    Pour les stratégies optimales, un chemin en cache sert aussi les requêtes
+    (u, v) dont u puis v apparaissent sur ce chemin: tout sous-chemin d'un
+    plus court chemin est un plus court chemin. Seuls les chemins calculés
+    sans heuristique ou avec des heuristiques déclarées admissibles
+    (AdmissibleHeuristics, attribut `admissible`) sont ainsi réutilisés.
+
+    Un même cache peut servir plusieurs threads (Environment.step parallèle,
+    agents asynchrones): l'ordre LRU, l'index des états et les compteurs sont
+    protégés par un verrou. Les recherches elles-mêmes restent hors verrou.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple, _Entry]" = OrderedDict()
+        # (id graphe, version, état) -> clés des chemins optimaux passant par l'état
+        self._by_state: Dict[Tuple[int, int, Any], Set[Tuple]] = {}
+        self.hits = 0
+        self.subpath_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_state.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits,
+                    "subpath_hits": self.subpath_hits, "misses": self.misses}
+
+    @staticmethod
+    def cacheable(problem: Any) -> bool:
+        """Seuls les problèmes de navigation standard sur un graphe versionné sont mis en cache"""
+        return (type(problem) in (NavigationProblem, CSRNavigationProblem)
+                and graph_version(problem.graph) is not None)
+
+    @staticmethod
+    def _endpoints(problem: Any) -> Tuple[Any, Any]:
+        return problem.decode_path([problem.initial_state])[0], problem.goal_state
+
+    # ----------------------------
+    # Lecture
+    # ----------------------------
+    def lookup(self, problem: Any, strategy: str, heuristics: Any = None) -> Optional[SearchResult]:
+        """
+        Retourne un SearchResult en cache pour ce problème, ou None. Ses stats
+        sont à zéro, avec le temps de la recherche dans le cache en phase "cache".
+        """
+        debut = _clock()
+        graph = problem.graph
+        version = graph_version(graph)
+        depart, but = self._endpoints(problem)
+        cle = (id(graph), version, depart, but, strategy, _heuristics_key(heuristics))
+
+        with self._lock:
+            entree = self._entries.get(cle)
+            if entree is not None and entree.graph is graph and _same_heuristics(entree.heuristics, heuristics):
+                self._entries.move_to_end(cle)
+                self.hits += 1
+                trouve = entree.result.path, entree.result.cost, entree.result.bound
+            elif strategy in OPTIMAL_STRATEGIES:
+                trouve = self._lookup_subpath(graph, version, depart, but)
+                if trouve is not None:
+                    self.subpath_hits += 1
+            else:
+                trouve = None
+            if trouve is None:
+                self.misses += 1
+                return None
+        chemin, cout, borne = trouve
+        return self._copy(chemin, cout, strategy, debut, borne)
+
+    def _lookup_subpath(self, graph, version, depart, but) -> Optional[Tuple[List[Any], float, Optional[float]]]:
+        """(sous-chemin, coût, borne) d'un chemin optimal en cache passant par depart puis but"""
+        for cle in self._by_state.get((id(graph), version, depart), ()):
+            entree = self._entries[cle]
+            if entree.graph is not graph:
+                continue
+            i, j = entree.positions[depart], entree.positions.get(but)
+            if j is not None and j >= i:
+                self._entries.move_to_end(cle)
+                return entree.result.path[i:j + 1], entree.prefix[j] - entree.prefix[i], None
+        return None
+
+    @staticmethod
+    def _copy(path, cost, strategy, debut, bound=None) -> SearchResult:
+        stats = SearchStats()
+        mur, cpu = _since(debut)
+        stats.add_phase("cache", mur, cpu)
+        return SearchResult(list(path) if path is not None else None, cost,
+                            0, 0, 0, mur, strategy, stats, bound)
+
+    # ----------------------------
+    # Écriture
+    # ----------------------------
+    def store(self, problem: Any, strategy: str, heuristics: Any, result: SearchResult) -> None:
+        """Enregistre le résultat d'une recherche (les échecs aussi)"""
+        graph = problem.graph
+        version = graph_version(graph)
+        depart, but = self._endpoints(problem)
+        cle = (id(graph), version, depart, but, strategy, _heuristics_key(heuristics))
+
+        positions, prefix = {}, []
+        if result.path is not None:
+            positions = {etat: i for i, etat in enumerate(result.path)}
+            prefix = self._prefix_costs(graph, result.path)
+        entree = _Entry(graph, heuristics, result, positions, prefix)
+
+        with self._lock:
+            if cle in self._entries:
+                self._unindex(cle, self._entries[cle])
+            self._entries[cle] = entree
+            self._entries.move_to_end(cle)
+            # Un chemin avec des états répétés, ou peut-être sous-optimal, ne sert pas aux sous-chemins
+            if (strategy in OPTIMAL_STRATEGIES and _trusted(heuristics)
+                    and result.path is not None and len(positions) == len(prefix)):
+                for etat in result.path:
+                    self._by_state.setdefault((id(graph), version, etat), set()).add(cle)
+
+            while len(self._entries) > self.maxsize:
+                ancienne_cle, ancienne = self._entries.popitem(last=False)
+                self._unindex(ancienne_cle, ancienne)
+
+    def _unindex(self, cle: Tuple, entree: _Entry) -> None:
+        if entree.result.path is None:
+            return
+        for etat in entree.result.path:
+            cles = self._by_state.get((cle[0], cle[1], etat))
+            if cles is not None:
+                cles.discard(cle)
+                if not cles:
+                    del self._by_state[(cle[0], cle[1], etat)]
+
+    @staticmethod
+    def _prefix_costs(graph: Any, path: List[Any]) -> List[float]:
+        prefix = [0]
+        if isinstance(graph, CSRGraph):
+            for a, b in zip(path, path[1:]):
+                prefix.append(prefix[-1] + graph.cost(graph.id_of(a), graph.id_of(b)))
+        else:
+            for a, b in zip(path, path[1:]):
+                prefix.append(prefix[-1] + graph[a][b])
+        return prefix
@@ -0,0 +1,256 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# ----------------------------
+# Files de priorité adressables (frontières de UCS / A*)
+# ----------------------------
+# Interface commune:
+#     push(état, priorité)   insère l'état, ou diminue sa priorité s'il est déjà
+#                            présent (une priorité plus grande est ignorée)
+#     pop() -> (priorité, état)   retire l'état de plus petite priorité
+#     len(), `état in file`, itération sur les (priorité, état) présents
+#
+# Contrairement au tas heapq à suppression paresseuse, chaque état n'est
+# présent qu'une seule fois: aucune entrée périmée n'encombre la frontière.
+
+# Au-delà de ce coût d'arête maximal, les seaux de Dial deviennent trop creux
+# (un seau par valeur de priorité) et le tas radix prend le relais
+DIAL_MAX_COST = 1024
+
+
+class BucketQueue:
+    """
+    Seaux de Dial: un seau par valeur entière de priorité, parcourus par un
+    curseur croissant. push et decrease-key en O(1), pop en O(1) amorti
+    (le curseur avance d'au plus C seaux vides par état, C = coût d'arête
+    maximal). Adapté aux petits coûts entiers (minutes, km, unités d'effort).
+    Les seaux déjà dépassés par le curseur sont libérés au fil de la
+    recherche: seule la plage des priorités présentes occupe de la mémoire.
+
+    Les priorités doivent être des entiers. Une priorité inférieure au
+    curseur (heuristique non consistante) est acceptée: le curseur recule.
+    """
+
+    def __init__(self):
+        self._buckets: List[Optional[Dict[Any, None]]] = []
+        self._priority: Dict[Any, int] = {}
+        self._base = 0      # priorité du seau 0
+        self._cursor = 0    # indice du premier seau éventuellement non vide
+
+    def push(self, state: Any, priority: int) -> None:
+        ancienne = self._priority.get(state)
+        if ancienne is not None:
+            if priority >= ancienne:
+                return
+            del self._buckets[ancienne - self._base][state]
+        seaux = self._buckets
+        i = priority - self._base
+        if i < 0:
+            seaux[0:0] = [None] * -i
+            self._base = priority
+            self._cursor -= i
+            i = 0
+        elif i >= len(seaux):
+            if self._cursor > len(seaux) >> 1:
+                # Libère les seaux déjà parcourus plutôt que d'agrandir la liste
+                del seaux[:self._cursor]
+                self._base += self._cursor
+                i -= self._cursor
+                self._cursor = 0
+            if i >= len(seaux):
+                seaux.extend([None] * (i + 1 - len(seaux)))
+        seau = seaux[i]
+        if seau is None:
+            seau = seaux[i] = {}
+        seau[state] = None
+        self._priority[state] = priority
+        if i < self._cursor:
+            self._cursor = i
+
+    def pop(self) -> Tuple[int, Any]:
+        if not self._priority:
+            raise IndexError("pop sur une file vide")
+        seaux = self._buckets
+        curseur = self._cursor
+        while not seaux[curseur]:
+            curseur += 1
+        self._cursor = curseur
+        state = seaux[curseur].popitem()[0]
+        return self._priority.pop(state), state
+
+    def __len__(self) -> int:
+        return len(self._priority)
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self._priority
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        return ((priorite, state) for state, priorite in self._priority.items())
+
+
+class RadixHeap:
+    """
+    Tas radix pour priorités entières monotones (la plus petite priorité
+    retirée ne décroît pas, comme dans Dijkstra ou A* consistant). Le seau i
+    contient les états dont la priorité diffère de la dernière retirée à
+    partir du bit i-1: au plus 65 seaux quelle que soit la taille des coûts,
+    et chaque état n'est redistribué qu'O(log C) fois.
+
+    Une priorité inférieure à la dernière retirée (heuristique non
+    consistante) reste correcte mais force une redistribution complète.
+    """
+
+    def __init__(self):
+        self._buckets: List[Dict[Any, int]] = [{} for _ in range(65)]
+        self._where: Dict[Any, int] = {}
+        self._last = 0
+
+    def push(self, state: Any, priority: int) -> None:
+        seau = self._where.get(state)
+        if seau is not None:
+            ancienne = self._buckets[seau][state]
+            if priority >= ancienne:
+                return
+            del self._buckets[seau][state]
+        if priority < self._last:
+            self._rebase(priority)
+        seau = (priority ^ self._last).bit_length()
+        self._buckets[seau][state] = priority
+        self._where[state] = seau
+
+    def pop(self) -> Tuple[int, Any]:
+        seaux = self._buckets
+        if not seaux[0]:
+            if not self._where:
+                raise IndexError("pop sur une file vide")
+            i = 1
+            while not seaux[i]:
+                i += 1
+            pleins = seaux[i]
+            seaux[i] = {}
+            self._last = dernier = min(pleins.values())
+            where = self._where
+            for state, priorite in pleins.items():
+                j = (priorite ^ dernier).bit_length()
+                seaux[j][state] = priorite
+                where[state] = j
+        state, priorite = seaux[0].popitem()
+        del self._where[state]
+        return priorite, state
+
+    def _rebase(self, priority: int) -> None:
+        """Redistribue tous les états autour d'une nouvelle dernière priorité plus petite"""
+        entrees = [(state, p) for seau in self._buckets for state, p in seau.items()]
+        for seau in self._buckets:
+            seau.clear()
+        self._last = priority
+        for state, p in entrees:
+            j = (p ^ priority).bit_length()
+            self._buckets[j][state] = p
+            self._where[state] = j
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self._where
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        return ((p, state) for seau in self._buckets for state, p in seau.items())
+
+
+class IndexedHeap:
+    """
+    Tas binaire indexé: la position de chaque état est connue, ce qui permet
+    un vrai decrease-key en O(log n) au lieu de ré-empiler. Accepte
+    n'importe quelles priorités comparables (coûts flottants).
+    """
+
+    def __init__(self):
+        self._heap: List[Any] = []
+        self._priority: Dict[Any, Any] = {}
+        self._position: Dict[Any, int] = {}
+
+    def push(self, state: Any, priority: Any) -> None:
+        ancienne = self._priority.get(state)
+        if ancienne is None:
+            i = len(self._heap)
+            self._heap.append(state)
+        elif priority < ancienne:
+            i = self._position[state]
+        else:
+            return
+        self._priority[state] = priority
+        self._sift_up(i, state, priority)
+
+    def _sift_up(self, i: int, state: Any, priority: Any) -> None:
+        tas, priorites, positions = self._heap, self._priority, self._position
+        while i:
+            parent = (i - 1) >> 1
+            etat_parent = tas[parent]
+            if priorites[etat_parent] <= priority:
+                break
+            tas[i] = etat_parent
+            positions[etat_parent] = i
+            i = parent
+        tas[i] = state
+        positions[state] = i
+
+    def pop(self) -> Tuple[Any, Any]:
+        tas, priorites, positions = self._heap, self._priority, self._position
+        if not tas:
+            raise IndexError("pop sur une file vide")
+        racine = tas[0]
+        dernier = tas.pop()
+        priorite_racine = priorites.pop(racine)
+        del positions[racine]
+        if tas:
+            # Descente du dernier élément depuis la racine
+            n = len(tas)
+            priorite = priorites[dernier]
+            i = 0
+            enfant = 1
+            while enfant < n:
+                droit = enfant + 1
+                if droit < n and priorites[tas[droit]] < priorites[tas[enfant]]:
+                    enfant = droit
+                etat_enfant = tas[enfant]
+                if priorite <= priorites[etat_enfant]:
+                    break
+                tas[i] = etat_enfant
+                positions[etat_enfant] = i
+                i = enfant
+                enfant = 2 * i + 1
+            tas[i] = dernier
+            positions[dernier] = i
+        return priorite_racine, racine
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, state: Any) -> bool:
+        return state in self._position
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return ((self._priority[state], state) for state in self._heap)
+
+
+FRONTIERS = {
+    "buckets": BucketQueue,
+    "radix": RadixHeap,
+    "indexed-heap": IndexedHeap,
+}
+
+
+def choose_frontier(max_cost: Optional[int]) -> str:
+    """
+    Frontière adaptée aux coûts: `max_cost` est le plus grand coût d'arête
+    quand tous les coûts (et heuristiques) sont entiers, None sinon.
+    Pour des coûts réels, "heap" désigne le tas heapq à suppression
+    paresseuse des noyaux de SearchStrategy: écrit en C, il reste plus rapide
+    que IndexedHeap, qui se demande explicitement (moins de mémoire au pic).
+    """
+    if max_cost is None:
+        return "heap"
+    if max_cost <= DIAL_MAX_COST:
+        return "buckets"
+    return "radix"
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Callable,Any,Tuple
+from typing import Dict, List, Optional, Callable,Any,Tuple,Iterable
 
 from collections import deque
 import heapq
+import time
 
 import sys
 
@@ -10,6 +11,8 @@ import sys
 sys.path.append('../../ch2-agents/src')  # ou './src' selon votre structure
 # Importer toutes les classes
 from agent  import Agent, Action,Action,Environment,Percept,Sensor
+from csr_graph import CSRGraph
+from priority_queues import FRONTIERS, choose_frontier
 
 # ----------------------------
 # Problem Formulation 
@@ -42,6 +45,25 @@ class Problem(ABC):
     def path_cost(self, cost_so_far: float, state1: Any, action: Any, state2: Any) -> float:
         """Coût du chemin - souvent additif"""
         return cost_so_far + 1  # Coût uniforme par défaut
+
+    def decode_path(self, path: List[Any]) -> List[Any]:
+        """Traduit un chemin d'états internes en états du domaine (identité par défaut)"""
+        return path
+
+    def encode_state(self, state: Any) -> Any:
+        """Traduit un état du domaine en état interne (identité par défaut)"""
+        return state
+
+    def encode_heuristics(self, heuristics: Any) -> Any:
+        """Adapte la table d'heuristiques aux états internes (identité par défaut)"""
+        return heuristics
+
+    def max_integer_cost(self) -> Optional[int]:
+        """
+        Plus grand coût d'action si tous les coûts sont entiers, None sinon
+        ou si c'est inconnu (défaut): guide le choix de la frontière de UCS / A*.
+        """
+        return None
 # ----------------------------
 # Navigation Problem
 # ----------------------------   
@@ -64,141 +86,1451 @@ class NavigationProblem(Problem):
     def path_cost(self, state1: str, action: str, state2: str) -> float:
         return self.graph[state1][action]
 
-    def get_successors(self, state: str) -> List[Tuple[str, float]]:
-        return [(action, self.graph[state][action]) for action in self.actions(state)]
+    def get_successors(self, state: str) -> Iterable[Tuple[str, float]]:
+        # Vue (voisin, coût) du dict: aucune liste intermédiaire n'est allouée
+        return self.graph.get(state, {}).items()
+
+    def get_predecessors(self, state: str) -> Iterable[Tuple[str, float]]:
+        """Prédécesseurs (état, coût) via l'adjacence inverse, construite une fois par problème"""
+        inverse = self.__dict__.get("_reverse")
+        if inverse is None:
+            inverse = self._reverse = reverse_graph(self.graph)
+        return inverse.get(state, {}).items()
+
+    def max_integer_cost(self) -> Optional[int]:
+        """Calculé une fois par problème: le graphe dict a pu changer depuis le précédent"""
+        if "_max_cost" not in self.__dict__:
+            self._max_cost = integer_cost_bound(self.graph)
+        return self._max_cost
+
+
+def reverse_graph(graph: dict) -> dict:
+    """
+    Adjacence inverse {état: {prédécesseur: coût}} d'un graphe dict. Elle est
+    reconstruite à chaque appel, sauf pour un graphe versionné (attribut
+    `version`, ex. VersionedGraph) qui la garde tant que sa version ne change pas.
+    """
+    version = getattr(graph, "version", None)
+    if version is not None:
+        entree = graph.__dict__.get("_reverse")
+        if entree is not None and entree[0] == version:
+            return entree[1]
+    inverse: Dict[Any, Dict[Any, float]] = {}
+    for etat, voisins in graph.items():
+        for voisin, cout in voisins.items():
+            inverse.setdefault(voisin, {})[etat] = cout
+    if version is not None:
+        graph._reverse = (version, inverse)
+    return inverse
+
+
+def integer_cost_bound(graph: dict) -> Optional[int]:
+    """
+    Plus grand coût d'un graphe dict si tous ses coûts sont entiers, None sinon.
+    Un dict ordinaire est parcouru à chaque appel (il peut avoir été modifié
+    en place); un graphe versionné (attribut `version`, ex. VersionedGraph)
+    garde le résultat tant que sa version ne change pas.
+    """
+    version = getattr(graph, "version", None)
+    if version is not None:
+        entree = graph.__dict__.get("_cost_bound")
+        if entree is not None and entree[0] == version:
+            return entree[1]
+    maximum = 0
+    for voisins in graph.values():
+        for cout in voisins.values():
+            if type(cout) is not int:
+                maximum = None
+                break
+            if cout > maximum:
+                maximum = cout
+        if maximum is None:
+            break
+    if version is not None:
+        graph._cost_bound = (version, maximum)
+    return maximum
+
+
+# ----------------------------
+# Navigation Problem (graphe CSR)
+# ----------------------------
+class CSRNavigationProblem(NavigationProblem):
+    """
+    Problème de navigation sur un graphe compact CSRGraph.
+    Les états de recherche sont les identifiants entiers du graphe (dont
+    initial_state, point de départ des noyaux); les noms ne sont retrouvés
+    qu'à la construction du chemin final. goal_state reste le nom du but,
+    comme pour un NavigationProblem: un agent peut le réutiliser tel quel.
+    """
+
+    def __init__(self, initial_state: Any, goal: Any, graph: CSRGraph):
+        Problem.__init__(self, graph.id_of(initial_state), goal)
+        self.graph = graph
+        self._goal_id = graph.id_of(goal)
+
+    def goal_test(self, state: int) -> bool:
+        return state == self._goal_id
+
+    def actions(self, state: int):
+        return self.graph.neighbors(state)
+
+    def path_cost(self, state1: int, action: int, state2: int) -> float:
+        return self.graph.cost(state1, action)
+
+    def get_successors(self, state: int):
+        return self.graph.successors(state)
+
+    def get_predecessors(self, state: int):
+        return self.graph.reverse().successors(state)
+
+    def decode_path(self, path: List[int]) -> List[Any]:
+        name_of = self.graph.name_of
+        return [name_of(state) for state in path]
+
+    def encode_state(self, state: Any) -> int:
+        return self.graph.id_of(state)
+
+    def encode_heuristics(self, heuristics: Any) -> Any:
+        """Transforme un dict {nom: h} en liste indexée par identifiant entier"""
+        if isinstance(heuristics, dict):
+            return [heuristics[name] for name in self.graph.names]
+        if hasattr(heuristics, "by_state_id"):
+            # Tables calculées à la demande (ex. LandmarkTable)
+            return heuristics.by_state_id(self.graph)
+        return heuristics
+
+    def max_integer_cost(self) -> Optional[int]:
+        return self.graph.max_integer_cost
+
+
+def make_navigation_problem(initial_state: Any, goal: Any, graph: Any) -> NavigationProblem:
+    """Crée le problème de navigation adapté au type de graphe (dict ou CSRGraph)"""
+    if isinstance(graph, CSRGraph):
+        return CSRNavigationProblem(initial_state, goal, graph)
+    return NavigationProblem(initial_state, goal, graph)
     
+# ----------------------------
+# Search Statistics
+# ----------------------------
+def _clock() -> Tuple[float, float]:
+    """Instant courant (mur, CPU)"""
+    return time.perf_counter(), time.process_time()
+
+
+def _since(debut: Tuple[float, float]) -> Tuple[float, float]:
+    """Durées (mur, CPU) écoulées depuis `debut`"""
+    return time.perf_counter() - debut[0], time.process_time() - debut[1]
+
+
+class SearchStats:
+    """
+    Statistiques détaillées d'une recherche, remplies par tous les noyaux de
+    SearchStrategy (SearchResult.stats):
+      - expanded / generated: états développés / ajoutés à la frontière
+      - stale_pops: entrées périmées retirées du tas puis ignorées
+      - duplicate_pushes: états ré-empilés après amélioration de leur coût
+      - peak_frontier: taille maximale de la frontière
+      - peak_memory: estimation (octets) des structures frontière + explorés
+        + parents + coûts au pic (conteneurs seuls, sans les états eux-mêmes)
+      - phases: {phase: (secondes mur, secondes CPU)} pour "heuristics",
+        "search" et "reconstruct"
+      - iterations / transposition_hits: approfondissements successifs et
+        états écartés par la table de transposition (IDDFS, IDA*)
+      - frontier: file de priorité utilisée par UCS / A* ("heap", "buckets",
+        "radix" ou "indexed-heap"; vide pour les autres stratégies)
+    """
+
+    __slots__ = ("expanded", "generated", "stale_pops", "duplicate_pushes",
+                 "peak_frontier", "peak_memory", "phases", "iterations", "transposition_hits",
+                 "frontier")
+
+    # Coût mémoire d'une entrée de frontière: un pointeur, plus le tuple (priorité, état) d'un tas
+    STACK_ENTRY = 8
+    HEAP_ENTRY = 8 + sys.getsizeof((0, None))
+    # File adressable (priority_queues): deux entrées de dict (hachage, clé, valeur)
+    QUEUE_ENTRY = 2 * 3 * 8
+    # Un niveau de la pile d'approfondissement: état, coût et itérateur de successeurs
+    DEPTH_ENTRY = 3 * 8 + sys.getsizeof(iter(()))
+
+    def __init__(self, expanded: int = 0, generated: int = 0, stale_pops: int = 0,
+                 duplicate_pushes: int = 0, peak_frontier: int = 0, peak_memory: int = 0):
+        self.expanded = expanded
+        self.generated = generated
+        self.stale_pops = stale_pops
+        self.duplicate_pushes = duplicate_pushes
+        self.peak_frontier = peak_frontier
+        self.peak_memory = peak_memory
+        self.phases: Dict[str, Tuple[float, float]] = {}
+        self.iterations = 0
+        self.transposition_hits = 0
+        self.frontier = ""
+
+    @staticmethod
+    def measure(explore, parents, cout_cumule, generes, max_frontiere,
+                perimes=0, doublons=0, entree=STACK_ENTRY) -> "SearchStats":
+        """
+        Statistiques de fin de recherche. Explorés, parents et coûts ne font que
+        croître: leur taille finale est leur pic. La frontière est estimée
+        depuis son pic (max_frontiere entrées de `entree` octets).
+        """
+        memoire = (sys.getsizeof(explore) + sys.getsizeof(parents)
+                   + sys.getsizeof(cout_cumule) + max_frontiere * entree)
+        return SearchStats(len(explore), generes, perimes, doublons, max_frontiere, memoire)
+
+    def add_phase(self, phase: str, wall: float, cpu: float) -> None:
+        mur, processeur = self.phases.get(phase, (0.0, 0.0))
+        self.phases[phase] = (mur + wall, processeur + cpu)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "expanded": self.expanded,
+            "generated": self.generated,
+            "stale_pops": self.stale_pops,
+            "duplicate_pushes": self.duplicate_pushes,
+            "peak_frontier": self.peak_frontier,
+            "peak_memory": self.peak_memory,
+            "iterations": self.iterations,
+            "transposition_hits": self.transposition_hits,
+            "frontier": self.frontier,
+            "phases": {phase: {"wall": mur, "cpu": cpu} for phase, (mur, cpu) in self.phases.items()},
+        }
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{phase}={mur * 1000:.3f}ms/{cpu * 1000:.3f}ms"
+                           for phase, (mur, cpu) in self.phases.items())
+        approfondissement = (f", iterations={self.iterations}, "
+                             f"transposition_hits={self.transposition_hits}" if self.iterations else "")
+        frontiere = f", frontier={self.frontier}" if self.frontier else ""
+        return (f"SearchStats(expanded={self.expanded}, generated={self.generated}, "
+                f"stale_pops={self.stale_pops}, duplicate_pushes={self.duplicate_pushes}, "
+                f"peak_frontier={self.peak_frontier}, peak_memory={self.peak_memory}B"
+                f"{frontiere}{approfondissement}{', ' + phases if phases else ''})")
+
+# ----------------------------
+# Search Result
+# ----------------------------
+class SearchResult:
+    """
+    Résultat d'une recherche: chemin reconstruit depuis les parents, coût total
+    et statistiques. Se comporte comme la liste du chemin (itération, index, len)
+    pour rester compatible avec le code qui manipulait directement le chemin.
+    `stats` (SearchStats) détaille la recherche; pour un résultat servi par le
+    cache de chemins, compteurs à zéro et seule la phase "cache" renseignée. `bound` est la garantie de sous-optimalité des
+    recherches approchées (coût <= bound x optimal), None ailleurs.
+    """
+
+    __slots__ = ("path", "cost", "nodes_expanded", "nodes_generated",
+                 "max_frontier", "elapsed", "strategy", "stats", "bound")
+
+    def __init__(self, path: Optional[List[Any]], cost: float = float("inf"),
+                 nodes_expanded: int = 0, nodes_generated: int = 0,
+                 max_frontier: int = 0, elapsed: float = 0.0, strategy: str = "",
+                 stats: Optional[SearchStats] = None, bound: Optional[float] = None):
+        self.path = path
+        self.cost = cost
+        self.nodes_expanded = nodes_expanded
+        self.nodes_generated = nodes_generated
+        self.max_frontier = max_frontier
+        self.elapsed = elapsed
+        self.strategy = strategy
+        self.stats = stats
+        self.bound = bound
+
+    @property
+    def found(self) -> bool:
+        return self.path is not None
+
+    def __bool__(self) -> bool:
+        return self.path is not None
+
+    def __len__(self) -> int:
+        return len(self.path) if self.path is not None else 0
+
+    def __iter__(self):
+        return iter(self.path or ())
+
+    def __getitem__(self, index):
+        return (self.path or [])[index]
+
+    def __eq__(self, other):
+        if isinstance(other, SearchResult):
+            return self.path == other.path and self.cost == other.cost
+        if isinstance(other, list):
+            return self.path == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        borne = f", bound={self.bound:.3f}" if self.bound is not None else ""
+        return (f"SearchResult(path={self.path}, cost={self.cost}, "
+                f"expanded={self.nodes_expanded}, generated={self.nodes_generated}, "
+                f"max_frontier={self.max_frontier}, elapsed={self.elapsed:.6f}s{borne})")
+
 # ----------------------------
 # Search Strategy 
 # ----------------------------
+class _ScaledHeuristics:
+    """Table d'heuristiques calculée à la demande, multipliée par epsilon (A* pondéré)"""
+
+    __slots__ = ("heuristics", "epsilon")
+
+    def __init__(self, heuristics: Any, epsilon: float):
+        self.heuristics = heuristics
+        self.epsilon = epsilon
+
+    def __getitem__(self, state: Any) -> float:
+        return self.epsilon * self.heuristics[state]
+
+
 class SearchStrategy:
     """Classe unifiée pour toutes les stratégies de recherche"""
     
+    # Cache de chemins partagé par toutes les recherches (voir set_path_cache)
+    cache = None
+    
+    @staticmethod
+    def set_path_cache(cache):
+        """Installe (ou retire avec None) un PathCache consulté par toutes les stratégies"""
+        SearchStrategy.cache = cache
+    
+    @staticmethod
+    def dfs(problem, observer=None):
+        return SearchStrategy._search(problem, "dfs", observer=observer)
+    
     @staticmethod
-    def dfs(problem):
-        return SearchStrategy._search(problem, "dfs")
+    def bfs(problem, observer=None):
+        return SearchStrategy._search(problem, "bfs", observer=observer)
     
     @staticmethod
-    def bfs(problem):
-        return SearchStrategy._search(problem, "bfs")
+    def ucs(problem, observer=None, frontier="auto"):
+        """
+        frontier: "auto" (choisie d'après le type des coûts, voir _frontier),
+        "heap", "buckets", "radix" ou "indexed-heap" (voir priority_queues)
+        """
+        return SearchStrategy._search(problem, "ucs", observer=observer, frontier=frontier)
     
     @staticmethod
-    def ucs(problem):
-        return SearchStrategy._search(problem, "ucs")
+    def a_star(problem, heuristics=None, observer=None, frontier="auto"):
+        return SearchStrategy._search(problem, "a-star", heuristics, observer, frontier)
+    
+    @staticmethod
+    def weighted_a_star(problem, heuristics=None, epsilon=1.5, observer=None):
+        """
+        A* pondéré: f = g + epsilon * h. Développe beaucoup moins d'états
+        qu'A* et garantit, avec une heuristique admissible, un coût au plus
+        epsilon fois l'optimal (result.bound = epsilon).
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon doit être >= 1")
+
+        def calcul():
+            debut = _clock()
+            h = SearchStrategy._weighted(problem.encode_heuristics(heuristics), epsilon)
+            duree = _since(debut)
+            if observer is not None:
+                observer.bind(problem)
+            resultat = SearchStrategy._a_star_kernel(problem, h, observer)
+            resultat.stats.add_phase("heuristics", *duree)
+            resultat.bound = epsilon if resultat.path is not None else None
+            return resultat
+        strategie = f"weighted-a-star(eps={epsilon:g})"
+        if observer is not None:
+            return SearchStrategy._timed(strategie, calcul)
+        return SearchStrategy._cached(problem, strategie, heuristics, calcul)
+
+    @staticmethod
+    def anytime_a_star(problem, heuristics=None, epsilon=3.0, decrement=0.5,
+                       time_budget=None, node_budget=None, on_solution=None):
+        """
+        A* anytime (ARA*): une première solution pondérée par `epsilon` est
+        trouvée vite, puis améliorée en diminuant epsilon de `decrement` et en
+        réutilisant les recherches précédentes, jusqu'à l'optimal (bound = 1)
+        ou l'épuisement du budget (secondes et/ou nombre de développements).
+        `on_solution(result)` reçoit chaque solution améliorée avec sa borne.
+        Retourne la meilleure solution trouvée; sans solution dans le budget:
+        chemin None et bound = inf (None si aucun chemin n'existe).
+
+            agent = ProblemSolvingAgent("Garde", lambda p: SearchStrategy.anytime_a_star(
+                p, h, time_budget=0.05), probleme)
+        """
+        dernier = SearchResult(None, float("inf"), strategy="anytime-a-star")
+        for resultat in SearchStrategy.anytime_a_star_iter(problem, heuristics, epsilon, decrement,
+                                                           time_budget, node_budget):
+            if on_solution is not None and resultat.path is not None:
+                on_solution(resultat)
+            dernier = resultat
+        return dernier
+
+    @staticmethod
+    def anytime_a_star_iter(problem, heuristics=None, epsilon=3.0, decrement=0.5,
+                            time_budget=None, node_budget=None):
+        """
+        Générateur d'anytime_a_star: produit chaque solution améliorée
+        (SearchResult avec bound); l'appelant peut s'arrêter quand il veut.
+        Le dernier résultat produit est toujours le meilleur; si aucune
+        solution n'a été trouvée, un unique échec est produit.
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon doit être >= 1")
+        debut = _clock()
+        h = problem.encode_heuristics(heuristics)
+        duree = _since(debut)
+        for resultat in SearchStrategy._ara_star(problem, h, epsilon, decrement,
+                                                 time_budget, node_budget, debut):
+            resultat.stats.add_phase("heuristics", *duree)
+            yield resultat
+
+    @staticmethod
+    def iddfs(problem, max_depth=None, table_size=None, node_budget=None, observer=None):
+        """
+        Profondeur itérative: DFS limitée à 0, 1, 2, ... arêtes. Trouve un
+        chemin au plus petit nombre d'arêtes (comme BFS). Voir
+        _deepening_kernel pour `table_size` (défaut: table sans limite, qui
+        garantit l'arrêt quand le but est inaccessible) et `node_budget`.
+        """
+        def calcul():
+            if observer is not None:
+                observer.bind(problem)
+            return SearchStrategy._deepening_kernel(problem, None, max_depth, table_size, observer,
+                                                    node_budget)
+        if observer is not None or max_depth is not None or node_budget is not None:
+            return SearchStrategy._timed("iddfs", calcul)
+        return SearchStrategy._cached(problem, "iddfs", None, calcul)
+
+    @staticmethod
+    def ida_star(problem, heuristics=None, table_size=None, max_bound=None, node_budget=None,
+                 observer=None):
+        """
+        IDA*: DFS limitée par un seuil sur f = g + h, relevé à chaque itération
+        au plus petit f dépassé. Optimal avec une heuristique admissible.
+        Voir _deepening_kernel pour `table_size` (défaut: table sans limite,
+        qui garantit l'arrêt quand le but est inaccessible), `max_bound`
+        (seuil maximal) et `node_budget` (développements au total).
+
+        Avec des coûts réels, presque chaque valeur de f est distincte: le
+        seuil n'avance que d'un état à la fois et le nombre d'itérations
+        peut approcher le nombre d'états (temps quadratique). IDA* convient
+        aux petits coûts entiers; sinon, préférer a_star ou borner la recherche.
+        """
+        def calcul():
+            debut = _clock()
+            h = problem.encode_heuristics(heuristics)
+            duree = _since(debut)
+            if observer is not None:
+                observer.bind(problem)
+            resultat = SearchStrategy._deepening_kernel(problem, h, max_bound, table_size, observer,
+                                                        node_budget)
+            resultat.stats.add_phase("heuristics", *duree)
+            return resultat
+        if observer is not None or max_bound is not None or node_budget is not None:
+            return SearchStrategy._timed("ida-star", calcul)
+        return SearchStrategy._cached(problem, "ida-star", heuristics, calcul)
+
+    @staticmethod
+    def bidirectional_ucs(problem):
+        """Dijkstra bidirectionnel: recherche avant depuis l'état initial, arrière depuis le but"""
+        def calcul():
+            return SearchStrategy._bidirectional_kernel(problem, None)
+        return SearchStrategy._cached(problem, "bidirectional-ucs", None, calcul)
     
     @staticmethod
-    def a_star(problem, heuristics=None):
-        return SearchStrategy._search(problem, "a-star", heuristics)
+    def bidirectional_a_star(problem, heuristics, heuristics_to_start):
+        """
+        A* bidirectionnel front-to-end avec potentiel moyen:
+        p(v) = (h_but(v) - h_depart(v)) / 2, où `heuristics` estime la distance
+        de v au but et `heuristics_to_start` la distance de l'état initial à v.
+        Les deux heuristiques doivent être cohérentes pour garantir l'optimalité.
+        """
+        def calcul():
+            debut = _clock()
+            h_but = problem.encode_heuristics(heuristics)
+            h_depart = problem.encode_heuristics(heuristics_to_start)
+            duree = _since(debut)
+            resultat = SearchStrategy._bidirectional_kernel(
+                problem, lambda etat: (h_but[etat] - h_depart[etat]) / 2)
+            resultat.stats.add_phase("heuristics", *duree)
+            return resultat
+        return SearchStrategy._cached(problem, "bidirectional-a-star",
+                                      (heuristics, heuristics_to_start), calcul)
     
     @staticmethod
-    def _search(problem, strategy, heuristics=None):
-        """Méthode principale unifiée pour toutes les recherches"""
+    def _search(problem, strategy, heuristics=None, observer=None, frontier="heap"):
+        """
+        Point d'entrée commun: choisit une seule fois le noyau de la stratégie.
+        Sans observateur (défaut), aucune trace n'est produite pendant la boucle.
+        Retourne toujours un SearchResult (chemin None si aucune solution).
+        """
+        kernel = SearchStrategy._KERNELS[strategy]
+        prioritaire = strategy in ("ucs", "a-star")
+        if prioritaire and frontier != "auto" and frontier != "heap" and frontier not in FRONTIERS:
+            raise ValueError(f"Frontière inconnue: {frontier} "
+                             f"(choix: auto, heap, {', '.join(FRONTIERS)})")
         
-        # Initialisation selon la stratégie
-        if strategy in ["dfs", "bfs"]:
-            frontiere = deque([problem.initial_state])
-        elif strategy == "ucs":
-            frontiere = [(0, problem.initial_state)]
-        elif strategy == "a-star":
-            frontiere = [(heuristics[problem.initial_state], problem.initial_state)]
+        def calcul():
+            h = None
+            if strategy == "a-star":
+                debut = _clock()
+                h = problem.encode_heuristics(heuristics)
+                file = SearchStrategy._frontier(problem, h, frontier)
+                duree = _since(debut)
+            elif prioritaire:
+                file = SearchStrategy._frontier(problem, None, frontier)
+            if observer is not None:
+                observer.bind(problem)
+            if prioritaire and file != "heap":
+                resultat = SearchStrategy._queue_kernel(problem, h, observer, file)
+            else:
+                resultat = kernel(problem, h, observer)
+                if prioritaire:
+                    resultat.stats.frontier = "heap"
+            if h is not None:
+                resultat.stats.add_phase("heuristics", *duree)
+            return resultat
         
+        if observer is not None:
+            # Une recherche observée est toujours exécutée réellement
+            return SearchStrategy._timed(strategy, calcul)
+        return SearchStrategy._cached(problem, strategy, heuristics, calcul)
+
+    @staticmethod
+    def _timed(strategy, calcul):
+        """
+        Exécute un noyau et renseigne la durée et le nom de la stratégie.
+        La phase "search" est le temps total moins les phases déjà mesurées
+        (heuristiques, reconstruction du chemin).
+        """
+        debut = _clock()
+        resultat = calcul()
+        mur, cpu = _since(debut)
+        resultat.elapsed = mur
+        resultat.strategy = strategy
+        stats = resultat.stats
+        for autre_mur, autre_cpu in stats.phases.values():
+            mur -= autre_mur
+            cpu -= autre_cpu
+        stats.add_phase("search", mur, cpu)
+        return resultat
+
+    @staticmethod
+    def _cached(problem, strategy, heuristics, calcul):
+        """Passe par le cache de chemins partagé s'il est installé et applicable"""
+        cache = SearchStrategy.cache
+        if cache is None or not cache.cacheable(problem):
+            return SearchStrategy._timed(strategy, calcul)
+        debut = _clock()
+        resultat = cache.lookup(problem, strategy, heuristics)
+        if resultat is None:
+            duree = _since(debut)
+            resultat = SearchStrategy._timed(strategy, calcul)
+            # Le temps perdu à consulter le cache compte dans la recherche
+            resultat.stats.add_phase("cache", *duree)
+            resultat.elapsed += duree[0]
+            cache.store(problem, strategy, heuristics, resultat)
+        return resultat
+
+    @staticmethod
+    def _solution(problem, parents, etat_but, cout_cumule, stats):
+        """Construit le SearchResult d'un but atteint (phase "reconstruct" chronométrée)"""
+        debut = _clock()
+        chemin = SearchStrategy._reconstruct_path(parents, etat_but, problem.initial_state)
+        chemin = problem.decode_path(chemin)
+        stats.add_phase("reconstruct", *_since(debut))
+        return SearchResult(chemin, cout_cumule[etat_but], stats.expanded, stats.generated,
+                            stats.peak_frontier, stats=stats)
+
+    @staticmethod
+    def _failure(stats):
+        """SearchResult d'une recherche sans solution"""
+        return SearchResult(None, float("inf"), stats.expanded, stats.generated,
+                            stats.peak_frontier, stats=stats)
+
+    @staticmethod
+    def _frontier(problem, heuristics, frontier):
+        """
+        Résout frontier="auto": seaux de Dial ou tas radix quand les coûts
+        (problem.max_integer_cost) et l'heuristique sont entiers, sinon le tas
+        heapq à suppression paresseuse (plus rapide en CPython que le tas
+        indexé écrit en Python, qui reste disponible explicitement).
+        """
+        if frontier != "auto":
+            return frontier
+        maximum = problem.max_integer_cost()
+        if maximum is not None and heuristics is not None:
+            if isinstance(heuristics, dict):
+                valeurs = heuristics.values()
+            elif isinstance(heuristics, list):
+                valeurs = heuristics
+            elif getattr(heuristics, "integral", False):
+                valeurs = ()    # table calculée à la demande qui se déclare entière
+            else:
+                return "heap"   # table calculée à la demande: type des valeurs inconnu
+            if not all(type(h) is int for h in valeurs):
+                return "heap"
+        return choose_frontier(maximum)
+
+    @staticmethod
+    def _weighted(heuristics, epsilon):
+        """Heuristique encodée multipliée par epsilon (dict, liste ou table indexable)"""
+        if epsilon == 1:
+            return heuristics
+        if isinstance(heuristics, dict):
+            return {etat: epsilon * h for etat, h in heuristics.items()}
+        if isinstance(heuristics, list):
+            return [epsilon * h for h in heuristics]
+        return _ScaledHeuristics(heuristics, epsilon)
+
+    @staticmethod
+    def _hooks(observer, get_successors, push, tas):
+        """
+        Branche les crochets on_expand(état) / on_push(état, priorité) de
+        l'observateur en enveloppant get_successors et push: la boucle des
+        noyaux reste identique et ne paie rien quand ils ne sont pas définis.
+        tas: True pour heappush(file, (priorité, état)), False pour push(état),
+        None pour push(état, priorité) d'une file de priority_queues.
+        """
+        on_expand = getattr(observer, "on_expand", None)
+        on_push = getattr(observer, "on_push", None)
+        if on_expand is not None:
+            successeurs = get_successors
+
+            def get_successors(etat):
+                on_expand(etat)
+                return successeurs(etat)
+        if on_push is not None:
+            empiler = push
+            if tas is None:
+                def push(etat, priorite):
+                    empiler(etat, priorite)
+                    on_push(etat, priorite)
+            elif tas:
+                def push(file, entree):
+                    empiler(file, entree)
+                    on_push(entree[1], entree[0])
+            else:
+                def push(etat):
+                    empiler(etat)
+                    on_push(etat, None)
+        return get_successors, push
+
+    # ----------------------------
+    # Noyaux spécialisés par stratégie
+    # ----------------------------
+    @staticmethod
+    def _dfs_kernel(problem, heuristics, observer):
+        """DFS: pile LIFO, chaque état n'est empilé qu'une seule fois"""
+        initial = problem.initial_state
+        frontiere = [initial]
         explore = set()
         parents = {}
-        cout_cumule = {problem.initial_state: 0}
-        trace = Trace(problem)
-        
+        cout_cumule = {initial: 0}
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        notify = observer is not None
+        if notify:
+            observer.init_trace(frontiere, explore, "dfs")
+
         iteration = 0
-        trace.init_trace(frontiere, explore, strategy)
-        
+        generes = 1
+        max_frontiere = 1
+        pop = frontiere.pop
+        push = frontiere.append
+        if notify:
+            get_successors, push = SearchStrategy._hooks(observer, get_successors, push, False)
+
         while frontiere:
-            # Sélection de l'état selon la stratégie
-            if strategy == "dfs":
-                etat_actuel = frontiere.pop()
-            elif strategy == "bfs":
-                etat_actuel = frontiere.popleft()
-            elif strategy == "ucs":
-                cout_actuel, etat_actuel = heapq.heappop(frontiere)
-                if cout_actuel != cout_cumule[etat_actuel]:
+            etat_actuel = pop()
+
+            if goal_test(etat_actuel):
+                if notify:
+                    observer.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+                stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere)
+                return SearchStrategy._solution(problem, parents, etat_actuel, cout_cumule, stats)
+
+            explore.add(etat_actuel)
+            cout_actuel = cout_cumule[etat_actuel]
+            for successeur, cout in get_successors(etat_actuel):
+                if successeur not in cout_cumule:
+                    cout_cumule[successeur] = cout_actuel + cout
+                    parents[successeur] = etat_actuel
+                    push(successeur)
+                    generes += 1
+            if len(frontiere) > max_frontiere:
+                max_frontiere = len(frontiere)
+
+            if notify:
+                observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+            iteration += 1
+
+        if notify:
+            observer.failure_trace()
+        return SearchStrategy._failure(
+            SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere))
+
+    @staticmethod
+    def _bfs_kernel(problem, heuristics, observer):
+        """BFS: file FIFO, chaque état n'est enfilé qu'une seule fois"""
+        initial = problem.initial_state
+        frontiere = deque([initial])
+        explore = set()
+        parents = {}
+        cout_cumule = {initial: 0}
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        notify = observer is not None
+        if notify:
+            observer.init_trace(frontiere, explore, "bfs")
+
+        iteration = 0
+        generes = 1
+        max_frontiere = 1
+        pop = frontiere.popleft
+        push = frontiere.append
+        if notify:
+            get_successors, push = SearchStrategy._hooks(observer, get_successors, push, False)
+
+        while frontiere:
+            etat_actuel = pop()
+
+            if goal_test(etat_actuel):
+                if notify:
+                    observer.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+                stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere)
+                return SearchStrategy._solution(problem, parents, etat_actuel, cout_cumule, stats)
+
+            explore.add(etat_actuel)
+            cout_actuel = cout_cumule[etat_actuel]
+            for successeur, cout in get_successors(etat_actuel):
+                if successeur not in cout_cumule:
+                    cout_cumule[successeur] = cout_actuel + cout
+                    parents[successeur] = etat_actuel
+                    push(successeur)
+                    generes += 1
+            if len(frontiere) > max_frontiere:
+                max_frontiere = len(frontiere)
+
+            if notify:
+                observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+            iteration += 1
+
+        if notify:
+            observer.failure_trace()
+        return SearchStrategy._failure(
+            SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere))
+
+    @staticmethod
+    def _ucs_kernel(problem, heuristics, observer):
+        """UCS: file de priorité (coût, état) avec suppression paresseuse"""
+        initial = problem.initial_state
+        frontiere = [(0, initial)]
+        explore = set()
+        parents = {}
+        cout_cumule = {initial: 0}
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        notify = observer is not None
+        if notify:
+            observer.init_trace(frontiere, explore, "ucs")
+
+        iteration = 0
+        generes = 1
+        max_frontiere = 1
+        perimes = 0
+        doublons = 0
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        if notify:
+            get_successors, heappush = SearchStrategy._hooks(observer, get_successors, heappush, True)
+
+        while frontiere:
+            cout_actuel, etat_actuel = heappop(frontiere)
+            if cout_actuel != cout_cumule[etat_actuel] or etat_actuel in explore:
+                perimes += 1
+                continue
+
+            if goal_test(etat_actuel):
+                if notify:
+                    observer.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+                stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                            perimes, doublons, SearchStats.HEAP_ENTRY)
+                return SearchStrategy._solution(problem, parents, etat_actuel, cout_cumule, stats)
+
+            explore.add(etat_actuel)
+            for successeur, cout in get_successors(etat_actuel):
+                nouveau_cout = cout_actuel + cout
+                ancien = cout_cumule.get(successeur)
+                if ancien is None or nouveau_cout < ancien:
+                    if ancien is not None:
+                        doublons += 1
+                    cout_cumule[successeur] = nouveau_cout
+                    parents[successeur] = etat_actuel
+                    heappush(frontiere, (nouveau_cout, successeur))
+                    generes += 1
+            if len(frontiere) > max_frontiere:
+                max_frontiere = len(frontiere)
+
+            if notify:
+                observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+            iteration += 1
+
+        if notify:
+            observer.failure_trace()
+        return SearchStrategy._failure(
+            SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                perimes, doublons, SearchStats.HEAP_ENTRY))
+
+    @staticmethod
+    def _a_star_kernel(problem, heuristics, observer):
+        """A*: file de priorité (f = g + h, état) avec suppression paresseuse"""
+        initial = problem.initial_state
+        frontiere = [(heuristics[initial], initial)]
+        explore = set()
+        parents = {}
+        cout_cumule = {initial: 0}
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        notify = observer is not None
+        if notify:
+            observer.init_trace(frontiere, explore, "a-star")
+
+        iteration = 0
+        generes = 1
+        max_frontiere = 1
+        perimes = 0
+        doublons = 0
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        if notify:
+            get_successors, heappush = SearchStrategy._hooks(observer, get_successors, heappush, True)
+
+        while frontiere:
+            f_actuel, etat_actuel = heappop(frontiere)
+            g_actuel = cout_cumule[etat_actuel]
+            if f_actuel != g_actuel + heuristics[etat_actuel]:
+                perimes += 1
+                continue
+
+            if goal_test(etat_actuel):
+                if notify:
+                    observer.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+                stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                            perimes, doublons, SearchStats.HEAP_ENTRY)
+                return SearchStrategy._solution(problem, parents, etat_actuel, cout_cumule, stats)
+
+            explore.add(etat_actuel)
+            for successeur, cout in get_successors(etat_actuel):
+                nouveau_cout = g_actuel + cout
+                ancien = cout_cumule.get(successeur)
+                if ancien is None or nouveau_cout < ancien:
+                    if ancien is not None:
+                        doublons += 1
+                    cout_cumule[successeur] = nouveau_cout
+                    parents[successeur] = etat_actuel
+                    heappush(frontiere, (nouveau_cout + heuristics[successeur], successeur))
+                    generes += 1
+            if len(frontiere) > max_frontiere:
+                max_frontiere = len(frontiere)
+
+            if notify:
+                observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+            iteration += 1
+
+        if notify:
+            observer.failure_trace()
+        return SearchStrategy._failure(
+            SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                perimes, doublons, SearchStats.HEAP_ENTRY))
+
+    @staticmethod
+    def _queue_kernel(problem, heuristics, observer, frontier):
+        """
+        UCS (heuristics None) ou A* sur une file adressable de priority_queues
+        (seaux de Dial, tas radix, tas indexé): un coût amélioré diminue la
+        priorité de l'état en place, la frontière ne contient aucune entrée périmée.
+        """
+        initial = problem.initial_state
+        file = FRONTIERS[frontier]()
+        algo = "ucs" if heuristics is None else "a-star"
+        file.push(initial, 0 if heuristics is None else heuristics[initial])
+        explore = set()
+        parents = {}
+        cout_cumule = {initial: 0}
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        notify = observer is not None
+        if notify:
+            observer.init_trace(file, explore, algo)
+
+        iteration = 0
+        generes = 1
+        max_frontiere = 1
+        doublons = 0
+        pop = file.pop
+        push = file.push
+        if notify:
+            get_successors, push = SearchStrategy._hooks(observer, get_successors, push, None)
+
+        while file:
+            etat_actuel = pop()[1]
+            g_actuel = cout_cumule[etat_actuel]
+
+            if goal_test(etat_actuel):
+                if notify:
+                    observer.goal_trace(iteration, etat_actuel, file, explore, parents, cout_cumule)
+                stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                            0, doublons, SearchStats.QUEUE_ENTRY)
+                stats.frontier = frontier
+                return SearchStrategy._solution(problem, parents, etat_actuel, cout_cumule, stats)
+
+            explore.add(etat_actuel)
+            for successeur, cout in get_successors(etat_actuel):
+                nouveau_cout = g_actuel + cout
+                ancien = cout_cumule.get(successeur)
+                if ancien is None or nouveau_cout < ancien:
+                    if ancien is not None:
+                        doublons += 1
+                    cout_cumule[successeur] = nouveau_cout
+                    parents[successeur] = etat_actuel
+                    if heuristics is None:
+                        push(successeur, nouveau_cout)
+                    else:
+                        push(successeur, nouveau_cout + heuristics[successeur])
+                    generes += 1
+            if len(file) > max_frontiere:
+                max_frontiere = len(file)
+
+            if notify:
+                observer.iteration_trace(iteration, etat_actuel, file, explore, parents, cout_cumule)
+            iteration += 1
+
+        if notify:
+            observer.failure_trace()
+        stats = SearchStats.measure(explore, parents, cout_cumule, generes, max_frontiere,
+                                    0, doublons, SearchStats.QUEUE_ENTRY)
+        stats.frontier = frontier
+        return SearchStrategy._failure(stats)
+
+    @staticmethod
+    def _deepening_kernel(problem, heuristics, max_depth, table_size, observer, node_budget=None):
+        """
+        Noyau commun à IDDFS (heuristics None: limite en nombre d'arêtes) et
+        IDA* (limite sur f = g + h). Le chemin courant, ses coûts et ses
+        itérateurs de successeurs sont gardés, plus la table de transposition.
+        Les cycles sur le chemin courant sont évités. `max_depth` borne la
+        limite (arêtes ou f), `node_budget` le nombre total de développements.
+
+        table_size: table de transposition, vidée à chaque itération, qui
+        écarte un état déjà atteint dans l'itération avec une marge au moins
+        aussi bonne (g plus petit pour IDA*, plus d'arêtes restantes pour IDDFS):
+            None -> sans limite: mémoire O(états atteints), arrêt garanti
+            n    -> au plus n états mémorisés
+            0    -> désactivée: mémoire O(profondeur), mais chaque itération
+                    énumère tous les chemins simples sous le seuil; sans
+                    max_depth ni node_budget, un but inaccessible peut ne
+                    jamais être signalé sur un graphe avec des cycles
+        Avec la table, le seuil suivant ignore les dépassements d'états déjà
+        atteints dans l'itération avec une meilleure marge: quand aucun
+        dépassement ne peut plus rien améliorer, la recherche s'arrête.
+        """
+        initial = problem.initial_state
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        ida = heuristics is not None
+        limite_table = float("inf") if table_size is None else table_size
+        budget = float("inf") if node_budget is None else node_budget
+        table = {}
+        candidats = {}  # dépassements du seuil: état -> plus petite marge
+        notify = observer is not None
+        chemin = [initial]
+        push = chemin.append
+        if notify:
+            get_successors, push = SearchStrategy._hooks(observer, get_successors, push, False)
+            observer.init_trace(chemin, table, "ida-star" if ida else "iddfs")
+
+        stats = SearchStats(peak_frontier=1)
+        developpes = 0
+        generes = 1
+        profondeur_max = 1
+        pic_table = 0
+        succes = False
+        cout = 0
+        seuil = heuristics[initial] if ida else 0
+        INF = float("inf")
+
+        if goal_test(initial):
+            succes = True
+        while not succes:
+            stats.iterations += 1
+            prochain = INF  # plus petite limite dépassée: seuil de l'itération suivante
+            chemin[:] = [initial]
+            couts = [0]
+            iterateurs = [iter(get_successors(initial))]
+            sur_chemin = {initial}
+            developpes += 1
+            if notify:
+                observer.iteration_trace(developpes - 1, initial, chemin, table, {}, {initial: 0})
+
+            while iterateurs:
+                g_parent = couts[-1]
+                for successeur, cout in iterateurs[-1]:
+                    generes += 1
+                    if successeur in sur_chemin:
+                        continue
+                    g = g_parent + cout
+                    limite = g + heuristics[successeur] if ida else len(chemin)
+                    if limite_table:
+                        # IDA*: g atteint; IDDFS: arêtes restantes (négatif pour comparer par <=)
+                        marge = g if ida else len(chemin) - seuil
+                    if limite > seuil:
+                        if not limite_table:
+                            if limite < prochain:
+                                prochain = limite
+                            continue
+                        ancienne = candidats.get(successeur)
+                        if ancienne is None:
+                            if len(candidats) < limite_table:
+                                candidats[successeur] = marge
+                            elif limite < prochain:
+                                prochain = limite
+                        elif marge < ancienne:
+                            candidats[successeur] = marge
+                        continue
+                    if limite_table:
+                        ancienne = table.get(successeur)
+                        if ancienne is not None and ancienne <= marge:
+                            stats.transposition_hits += 1
+                            continue
+                        if ancienne is not None or len(table) < limite_table:
+                            table[successeur] = marge
+                    push(successeur)
+                    couts.append(g)
+                    if goal_test(successeur):
+                        succes, cout = True, g
+                        break
+                    sur_chemin.add(successeur)
+                    iterateurs.append(iter(get_successors(successeur)))
+                    developpes += 1
+                    if len(chemin) > profondeur_max:
+                        profondeur_max = len(chemin)
+                    if notify:
+                        observer.iteration_trace(developpes - 1, successeur, chemin, table,
+                                                 dict(zip(chemin[1:], chemin)), dict(zip(chemin, couts)))
+                    if developpes >= budget:
+                        iterateurs.clear()
+                    break
+                else:
+                    iterateurs.pop()
+                    sur_chemin.discard(chemin.pop())
+                    couts.pop()
                     continue
-            elif strategy == "a-star":
-                f_actuel, etat_actuel = heapq.heappop(frontiere)
-                g_actuel = cout_cumule[etat_actuel]
-                if f_actuel != g_actuel + heuristics[etat_actuel]:
+                if succes:
+                    break
+
+            # Seuil suivant: seuls comptent les dépassements non dominés par
+            # un état atteint dans l'itération avec une meilleure marge
+            for etat, marge in candidats.items():
+                ancienne = table.get(etat)
+                if ancienne is None or marge < ancienne:
+                    limite = marge + heuristics[etat] if ida else marge + seuil
+                    if limite < prochain:
+                        prochain = limite
+            if len(table) > pic_table:
+                pic_table = len(table)
+            stats.peak_memory = max(stats.peak_memory, sys.getsizeof(table) + sys.getsizeof(candidats))
+            table.clear()
+            candidats.clear()
+            if (succes or prochain == INF or developpes >= budget
+                    or (max_depth is not None and prochain > max_depth)):
+                break
+            seuil = prochain
+
+        stats.expanded = developpes
+        stats.generated = generes
+        stats.peak_frontier = profondeur_max
+        stats.peak_memory += profondeur_max * SearchStats.DEPTH_ENTRY
+        if not succes:
+            if notify:
+                observer.failure_trace()
+            return SearchStrategy._failure(stats)
+        if notify:
+            couts_chemin = dict(zip(chemin, couts if len(chemin) > 1 else [0]))
+            observer.goal_trace(developpes, chemin[-1], chemin, table,
+                                dict(zip(chemin[1:], chemin)), couts_chemin)
+        debut = _clock()
+        resultat = problem.decode_path(list(chemin))
+        stats.add_phase("reconstruct", *_since(debut))
+        return SearchResult(resultat, cout, developpes, generes, profondeur_max, stats=stats)
+
+    @staticmethod
+    def _ara_star(problem, heuristics, epsilon, decrement, time_budget, node_budget, debut):
+        """
+        ARA* (Likhachev et al.): chaque itération (ImprovePath) développe les
+        états par clé g + eps * h sans jamais redévelopper un état fermé dans
+        l'itération; un état fermé dont g s'améliore passe dans `incoherents`
+        et ne revient dans la file qu'à l'itération suivante, avec un eps plus
+        petit. Borne publiée: min(eps, coût / min(g + h) sur ouverts + incohérents).
+        Le facteur eps suppose une heuristique consistante; le rapport, lui,
+        reste une borne pour une heuristique seulement admissible. L'itération
+        eps = 1 rouvre donc les états fermés dont g s'améliore (A* avec
+        réouverture): la borne 1 annoncée à la fin est exacte dans les deux cas.
+        """
+        initial = problem.initial_state
+        goal_test = problem.goal_test
+        get_successors = problem.get_successors
+        INF = float("inf")
+        limite_temps = debut[0] + time_budget if time_budget is not None else INF
+        limite_noeuds = node_budget if node_budget is not None else INF
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        g = {initial: 0}
+        parents = {}
+        ouverts = {initial}
+        fermes = set()
+        incoherents = set()
+        but, cout_but = (initial, 0) if goal_test(initial) else (None, INF)
+        eps = epsilon
+        developpes = 0
+        generes = 1
+        perimes = 0
+        max_frontiere = 1
+        publie, borne_publiee = INF, INF
+        budget_epuise = False
+
+        def resultat(borne):
+            stats = SearchStats.measure(fermes, parents, g, generes, max_frontiere, perimes, 0,
+                                        SearchStats.HEAP_ENTRY)
+            stats.expanded = developpes
+            stats.iterations = iteration
+            chemin = None
+            if but is not None:
+                horloge = _clock()
+                chemin = problem.decode_path(SearchStrategy._reconstruct_path(parents, but, initial))
+                stats.add_phase("reconstruct", *_since(horloge))
+            mur, cpu = _since(debut)
+            stats.add_phase("search", mur, cpu)
+            return SearchResult(chemin, cout_but, developpes, generes, max_frontiere,
+                                mur, "anytime-a-star", stats, borne)
+
+        iteration = 0
+        while True:
+            iteration += 1
+            file = [(g[s] + eps * heuristics[s], s) for s in ouverts]
+            heapq.heapify(file)
+
+            # ImprovePath
+            while file:
+                cle, etat = file[0]
+                if etat not in ouverts or cle != g[etat] + eps * heuristics[etat]:
+                    heappop(file)
+                    perimes += 1
                     continue
-            
-            # Test du but
-            if problem.goal_test(etat_actuel):
-                trace.goal_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
-                chemin = trace.chemin_str.split(" -> ")
-                return chemin
-            
-            # Exploration si pas encore exploré
-            if etat_actuel not in explore:
-                explore.add(etat_actuel)
-                
-                successeurs = list(problem.get_successors(etat_actuel))
-                for successeur, cout in successeurs:
-                    nouveau_cout = cout_cumule[etat_actuel] + cout
-                    
-                    # Condition d'ajout selon la stratégie
-                    if strategy in ["dfs", "bfs"]:
-                        if successeur not in explore:
-                            parents[successeur] = etat_actuel
-                            cout_cumule[successeur] = nouveau_cout
-                            frontiere.append(successeur)
-                    
-                    elif strategy == "ucs":
-                        if successeur not in cout_cumule or nouveau_cout < cout_cumule[successeur]:
-                            cout_cumule[successeur] = nouveau_cout
-                            parents[successeur] = etat_actuel
-                            heapq.heappush(frontiere, (nouveau_cout, successeur))
-                    
-                    elif strategy == "a-star":
-                        if successeur not in cout_cumule or nouveau_cout < cout_cumule[successeur]:
-                            cout_cumule[successeur] = nouveau_cout
-                            parents[successeur] = etat_actuel
-                            f_successeur = nouveau_cout + heuristics[successeur]
-                            heapq.heappush(frontiere, (f_successeur, successeur))
-            
-            # Trace d'itération
-            if strategy in ["ucs", "a-star"]:
-                frontiere_triee = sorted(frontiere, key=lambda x: x[0])
-                trace.iteration_trace(iteration, etat_actuel, frontiere_triee, explore, parents, cout_cumule)
+                if cout_but <= cle:
+                    break
+                if developpes >= limite_noeuds or (
+                        not developpes & 63 and time.perf_counter() >= limite_temps):
+                    budget_epuise = True
+                    break
+                heappop(file)
+                ouverts.discard(etat)
+                fermes.add(etat)
+                developpes += 1
+                g_etat = g[etat]
+                for successeur, cout in get_successors(etat):
+                    nouveau = g_etat + cout
+                    if nouveau < g.get(successeur, INF):
+                        g[successeur] = nouveau
+                        parents[successeur] = etat
+                        generes += 1
+                        if goal_test(successeur) and nouveau < cout_but:
+                            but, cout_but = successeur, nouveau
+                        if successeur in fermes and eps > 1:
+                            incoherents.add(successeur)
+                        else:
+                            fermes.discard(successeur)
+                            ouverts.add(successeur)
+                            heappush(file, (nouveau + eps * heuristics[successeur], successeur))
+                if len(file) > max_frontiere:
+                    max_frontiere = len(file)
+
+            if budget_epuise:
+                if cout_but < publie:
+                    # Coupé en cours d'itération: la borne inférieure de la
+                    # dernière itération terminée reste valable
+                    borne = borne_publiee * cout_but / publie if publie < INF and publie else INF
+                    yield resultat(borne)
+                elif publie == INF:
+                    yield resultat(INF)
+                return
+
+            inferieure = min((g[s] + heuristics[s] for s in ouverts | incoherents), default=INF)
+            if cout_but == INF:
+                # Aucun chemin: l'espace atteignable est épuisé
+                yield resultat(None)
+                return
+            if inferieure == INF or cout_but <= inferieure:
+                borne = 1.0
             else:
-                trace.iteration_trace(iteration, etat_actuel, list(frontiere), explore, parents, cout_cumule)
-            
-            iteration += 1
-        
-        print("✗ AUCUN CHEMIN TROUVÉ")
-        return None
+                borne = min(eps, cout_but / inferieure)
+            if cout_but < publie or borne < borne_publiee:
+                publie, borne_publiee = cout_but, borne
+                yield resultat(borne)
+            if borne <= 1.0:
+                return
+            eps = max(1.0, eps - decrement)
+            ouverts |= incoherents
+            incoherents.clear()
+            fermes.clear()
+
+    @staticmethod
+    def _bidirectional_kernel(problem, potentiel):
+        """
+        Dijkstra bidirectionnel sur les coûts réduits par `potentiel` (aucun si None).
+        Clés: d_avant(v) + p(v) en avant, d_arriere(v) - p(v) en arrière.
+        Arrêt dès que min_avant + min_arriere >= mu (meilleur chemin connu):
+        aucun chemin plus court ne peut plus être découvert.
+        """
+        depart, but = problem.initial_state, problem.encode_state(problem.goal_state)
+        if depart == but:
+            return SearchResult(problem.decode_path([depart]), 0, 0, 1, 1,
+                                stats=SearchStats(0, 1, peak_frontier=1))
+        p = potentiel if potentiel is not None else (lambda etat: 0)
+
+        dist_avant, dist_arriere = {depart: 0}, {but: 0}
+        parents_avant, suivants_arriere = {}, {}
+        fermes_avant, fermes_arriere = set(), set()
+        file_avant, file_arriere = [(p(depart), depart)], [(-p(but), but)]
+        mu, rencontre = float("inf"), None
+        generes = 2
+        max_frontiere = 2
+        perimes = 0
+        doublons = 0
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        while file_avant and file_arriere:
+            if file_avant[0][0] + file_arriere[0][0] >= mu:
+                break
+            taille = len(file_avant) + len(file_arriere)
+            if taille > max_frontiere:
+                max_frontiere = taille
+
+            # On fait avancer la frontière la plus petite
+            if len(file_avant) <= len(file_arriere):
+                cle, u = heappop(file_avant)
+                if u in fermes_avant or cle != dist_avant[u] + p(u):
+                    perimes += 1
+                    continue
+                fermes_avant.add(u)
+                d_u = dist_avant[u]
+                for v, cout in problem.get_successors(u):
+                    nd = d_u + cout
+                    if nd < dist_avant.get(v, float("inf")):
+                        if v in dist_avant:
+                            doublons += 1
+                        dist_avant[v] = nd
+                        parents_avant[v] = u
+                        heappush(file_avant, (nd + p(v), v))
+                        generes += 1
+                    d_v = dist_arriere.get(v)
+                    if d_v is not None and nd + d_v < mu:
+                        mu, rencontre = nd + d_v, v
+            else:
+                cle, u = heappop(file_arriere)
+                if u in fermes_arriere or cle != dist_arriere[u] - p(u):
+                    perimes += 1
+                    continue
+                fermes_arriere.add(u)
+                d_u = dist_arriere[u]
+                for v, cout in problem.get_predecessors(u):
+                    nd = d_u + cout
+                    if nd < dist_arriere.get(v, float("inf")):
+                        if v in dist_arriere:
+                            doublons += 1
+                        dist_arriere[v] = nd
+                        suivants_arriere[v] = u
+                        heappush(file_arriere, (nd - p(v), v))
+                        generes += 1
+                    d_v = dist_avant.get(v)
+                    if d_v is not None and nd + d_v < mu:
+                        mu, rencontre = nd + d_v, v
+
+        memoire = sum(sys.getsizeof(structure) for structure in (
+            dist_avant, dist_arriere, parents_avant, suivants_arriere, fermes_avant, fermes_arriere))
+        stats = SearchStats(len(fermes_avant) + len(fermes_arriere), generes, perimes, doublons,
+                            max_frontiere, memoire + max_frontiere * SearchStats.HEAP_ENTRY)
+        if rencontre is None:
+            return SearchStrategy._failure(stats)
+
+        debut = _clock()
+        chemin = SearchStrategy._reconstruct_path(parents_avant, rencontre, depart)
+        etat = rencontre
+        while etat != but:
+            etat = suivants_arriere[etat]
+            chemin.append(etat)
+        chemin = problem.decode_path(chemin)
+        stats.add_phase("reconstruct", *_since(debut))
+        return SearchResult(chemin, mu, stats.expanded, generes, max_frontiere, stats=stats)
+
+    @staticmethod
+    def _reconstruct_path(parents, goal, start) -> List[Any]:
+        """Reconstruit le chemin du début à la fin à partir des parents"""
+        chemin = [goal]
+        etat = goal
+        while etat in parents:
+            etat = parents[etat]
+            chemin.append(etat)
+        return chemin[::-1]
+
+
+# Table des noyaux, résolue une seule fois par appel de recherche
+SearchStrategy._KERNELS = {
+    "dfs": SearchStrategy._dfs_kernel,
+    "bfs": SearchStrategy._bfs_kernel,
+    "ucs": SearchStrategy._ucs_kernel,
+    "a-star": SearchStrategy._a_star_kernel,
+}
 
 # ----------------------------
 # Fonctions de recherche simplifiées 
 # ----------------------------
-def bfs(graphe: dict, etat_initial: str, etat_but: str):
-    """Recherche en largeur - Breadth First Search"""
-    problem = NavigationProblem(etat_initial, etat_but, graphe)
-    return SearchStrategy.bfs(problem)
-
-def dfs(graphe: dict, etat_initial: str, etat_but: str):
-    """Recherche en profondeur - Depth First Search"""
-    problem = NavigationProblem(etat_initial, etat_but, graphe)
-    return SearchStrategy.dfs(problem)
-
-def ucs(graphe: dict, etat_initial: str, etat_but: str):
-    """Recherche à coût uniforme - Uniform Cost Search"""
-    problem = NavigationProblem(etat_initial, etat_but, graphe)
-    return SearchStrategy.ucs(problem)
-
-def astar(graphe: dict, etat_initial: str, etat_but: str, heuristique: dict):
-    """Recherche A* avec heuristique"""
-    problem = NavigationProblem(etat_initial, etat_but, graphe)
-    return SearchStrategy.a_star(problem, heuristique)
+def bfs(graphe, etat_initial: str, etat_but: str, observer=None):
+    """Recherche en largeur - Breadth First Search (graphe dict ou CSRGraph)"""
+    problem = make_navigation_problem(etat_initial, etat_but, graphe)
+    return SearchStrategy.bfs(problem, observer)
+
+def dfs(graphe, etat_initial: str, etat_but: str, observer=None):
+    """Recherche en profondeur - Depth First Search (graphe dict ou CSRGraph)"""
+    problem = make_navigation_problem(etat_initial, etat_but, graphe)
+    return SearchStrategy.dfs(problem, observer)
+
+def ucs(graphe, etat_initial: str, etat_but: str, observer=None):
+    """Recherche à coût uniforme - Uniform Cost Search (graphe dict ou CSRGraph)"""
+    problem = make_navigation_problem(etat_initial, etat_but, graphe)
+    return SearchStrategy.ucs(problem, observer)
+
+def astar(graphe, etat_initial: str, etat_but: str, heuristique: dict, observer=None):
+    """Recherche A* avec heuristique (graphe dict ou CSRGraph)"""
+    problem = make_navigation_problem(etat_initial, etat_but, graphe)
+    return SearchStrategy.a_star(problem, heuristique, observer)
+
+# ----------------------------
+# Observateurs de recherche
+# ----------------------------
+class SearchObserver:
+    """
+    Interface d'observation de SearchStrategy._search.
+    Toutes les méthodes sont vides: un observateur ne surcharge que ce qui l'intéresse.
+
+    on_expand(état) et on_push(état, priorité) sont des crochets optionnels
+    appelés à chaque développement / ajout à la frontière (priorité None pour
+    DFS et BFS). Les états sont ceux du noyau (indices pour un CSRGraph:
+    voir problem.decode_path).
+    """
+
+    problem = None
+    on_expand: Optional[Callable[[Any], None]] = None
+    on_push: Optional[Callable[[Any, Any], None]] = None
+
+    def bind(self, problem):
+        """Associe l'observateur au problème en cours de résolution"""
+        self.problem = problem
+
+    def init_trace(self, frontiere, explore, algo):
+        pass
+
+    def iteration_trace(self, iteration, etat_actuel, frontiere, explore, parents, cout_cumule):
+        pass
+
+    def goal_trace(self, iteration, etat_but, frontiere, explore, parents, cout_cumule):
+        pass
+
+    def failure_trace(self):
+        pass
+
+
+class CountingObserver(SearchObserver):
+    """Compte les itérations sans rien afficher"""
+
+    def __init__(self):
+        self.iterations = 0
+        self.goal_iteration = None
+        self.found = False
+
+    def init_trace(self, frontiere, explore, algo):
+        self.iterations = 0
+        self.goal_iteration = None
+        self.found = False
+
+    def iteration_trace(self, iteration, etat_actuel, frontiere, explore, parents, cout_cumule):
+        self.iterations += 1
+
+    def goal_trace(self, iteration, etat_but, frontiere, explore, parents, cout_cumule):
+        self.goal_iteration = iteration
+        self.found = True
+
+
+class SearchHooks(SearchObserver):
+    """
+    Crochets de profilage sans aucun affichage (contrairement à Trace):
+        hooks = SearchHooks(on_expand=lambda etat: compteur.update([etat]))
+        SearchStrategy.ucs(problem, hooks)
+    """
+
+    def __init__(self, on_expand: Optional[Callable[[Any], None]] = None,
+                 on_push: Optional[Callable[[Any, Any], None]] = None):
+        self.on_expand = on_expand
+        self.on_push = on_push
+
+
+class SamplingObserver(SearchObserver):
+    """
+    Ne rapporte qu'une itération sur `every`.
+    Délègue à `observer` (par exemple Trace) ou affiche une ligne de résumé.
+    """
+
+    def __init__(self, every: int = 1000, observer: Optional[SearchObserver] = None):
+        self.every = every
+        self.observer = observer
+
+    def bind(self, problem):
+        super().bind(problem)
+        if self.observer is not None:
+            self.observer.bind(problem)
+
+    def init_trace(self, frontiere, explore, algo):
+        if self.observer is not None:
+            self.observer.init_trace(frontiere, explore, algo)
+
+    def iteration_trace(self, iteration, etat_actuel, frontiere, explore, parents, cout_cumule):
+        if iteration % self.every:
+            return
+        if self.observer is not None:
+            self.observer.iteration_trace(iteration, etat_actuel, frontiere, explore, parents, cout_cumule)
+        else:
+            etat = self.problem.decode_path([etat_actuel])[0]
+            print(f"🔄 Itération {iteration}: '{etat}' (coût : {cout_cumule[etat_actuel]}) "
+                  f"| 🚧 {len(frontiere)} | 📂 {len(explore)}")
+
+    def goal_trace(self, iteration, etat_but, frontiere, explore, parents, cout_cumule):
+        if self.observer is not None:
+            self.observer.goal_trace(iteration, etat_but, frontiere, explore, parents, cout_cumule)
+        else:
+            etat = self.problem.decode_path([etat_but])[0]
+            print(f"🏁 ✓ BUT '{etat}' ATTEINT À L'ITÉRATION {iteration} (coût : {cout_cumule[etat_but]})")
+
+    def failure_trace(self):
+        if self.observer is not None:
+            self.observer.failure_trace()
+        else:
+            print("✗ AUCUN CHEMIN TROUVÉ")
+
 
 # ----------------------------
 # Tracabilite  
 # ----------------------------
-class Trace:
-    def __init__(self, problem):
+class Trace(SearchObserver):
+    """Observateur pédagogique: affiche frontière, explorés et chemin à chaque itération"""
+
+    def __init__(self, problem=None):
         self.problem = problem
         self.chemin_str = ""
         self.algo=""
@@ -207,6 +1539,9 @@ class Trace:
             "bfs":"Recherche en largeur",
             "ucs":"Recherche avec cout uniforme",
             "a-star":"Recherche a-star avec heuristique",
+            "iddfs":"Recherche en profondeur itérative",
+            "ida-star":"Recherche IDA* (a-star itératif)",
+            "jps":"Recherche Jump Point Search sur grille",
 
         }
 
@@ -227,8 +1562,13 @@ class Trace:
         print(f"🧩 État actuel : '{etat_actuel}' (coût : {cout_cumule[etat_actuel]})")
         print(f"❓ Test du but : {self.problem.goal_test(etat_actuel)}")
         
+        # Les files de priorité (UCS, A*) sont affichées par priorité croissante
+        frontiere = list(frontiere)
+        if frontiere and isinstance(frontiere[0], tuple):
+            frontiere.sort(key=lambda x: x[0])
+        
         # Nettoyage visuel des doublons
-        frontiere_aff = list(dict.fromkeys(list(frontiere)))
+        frontiere_aff = list(dict.fromkeys(frontiere))
         explore_aff = list(dict.fromkeys(list(explore)))
         
         print(f"🚧 Frontière : {frontiere_aff}")
@@ -241,7 +1581,7 @@ class Trace:
             chemin_actuel.append(temp)
             temp = parents[temp]
         chemin_actuel.append(self.problem.initial_state)
-        self.chemin_str = ' -> '.join(chemin_actuel[::-1])
+        self.chemin_str = ' -> '.join(map(str, self.problem.decode_path(chemin_actuel[::-1])))
         
         print(f"🔗 Chemin : {self.chemin_str}")
         print(f"💰 Coût cumulé : {cout_cumule[etat_actuel]}")
@@ -254,6 +1594,9 @@ class Trace:
         print(f"💰 Coût total : {cout_cumule[etat_but]}")
         print("============================================\n")
 
+    def failure_trace(self):
+        print("✗ AUCUN CHEMIN TROUVÉ")
+
        
 # ----------------------------
 # Problem Solving Agent 
@@ -268,8 +1611,10 @@ class NavigationPercept(Percept):
     @property
     def neighbors(self):
         """Utilise la même méthode que get_successors mais format différent"""
-        successors = self.problem.get_successors(self.location)
-        return {state: cost for state, cost in successors}
+        problem = self.problem
+        successors = list(problem.get_successors(problem.encode_state(self.location)))
+        names = problem.decode_path([state for state, _ in successors])
+        return {name: cost for name, (_, cost) in zip(names, successors)}
     
     def percept_formulation(self):
         return {"location": self.location, "neighbors": self.neighbors}
@@ -285,14 +1630,22 @@ class NavigationPercept(Percept):
     
 class ProblemSolvingAgent(Agent):
     """Agent de résolution de problèmes selon l'architecture AIMA"""
+
+    # Problème (et son graphe) et problème courant référencent le graphe de
+    # l'environnement: jamais remplacés par une copie en pas parallèle "process"
+    shared_state = ("problem", "current_problem", "search_function")
     
     def __init__(self, 
                  name: str, 
                  search_strategy: Callable,
-                 problem: Any):  # SUPPRIMER goal_function - le but est dans le problème
+                 problem: Any,  # SUPPRIMER goal_function - le but est dans le problème
+                 replan_each_step: bool = False):
         super().__init__(name)
         self.search_function = search_strategy
         self.problem = problem  # Le problème contient déjà le but
+        # Replanifier à chaque pas (utile avec un planificateur incrémental
+        # comme DStarLitePlanner quand les coûts changent en cours de route)
+        self.replan_each_step = replan_each_step
         
         # État interne de l'agent
         self.seq = deque()  # Séquence d'actions
@@ -316,7 +1669,7 @@ class ProblemSolvingAgent(Agent):
             graph=self.problem.graph
         )
 
-    def search(self, problem: Any) -> Optional[List[Any]]:
+    def search(self, problem: Any) -> Optional[SearchResult]:
         """Recherche une solution au problème"""
         return self.search_function(problem)
 
@@ -327,6 +1680,8 @@ class ProblemSolvingAgent(Agent):
         self.state = self.update_state(self.state, percept)
         
         # 2. Si séquence vide, formuler problème et rechercher
+        if self.replan_each_step:
+            self.seq.clear()
         if not self.seq:
             goal = self.formulate_goal()
             
@@ -340,7 +1695,7 @@ class ProblemSolvingAgent(Agent):
             self.current_problem = self.formulate_problem(self.state)
             solution = self.search(self.current_problem)
             
-            if solution is None:
+            if not solution:
                 print(f"❌ {self.name}: Aucune solution de {self.state} à {goal}!")
                 return None
             
@@ -0,0 +1,138 @@
+from array import array
+import heapq
+import time
+from typing import Any, Iterable, List, Optional
+
+from csr_graph import CSRGraph
+from problem_solving_agent import SearchResult
+
+INF = float("inf")
+
+
+# ----------------------------
+# Arbre des plus courts chemins depuis une source
+# ----------------------------
+class ShortestPathTree:
+    """
+    Résultat d'un Dijkstra « un vers tous »: distances et parents stockés
+    dans des tableaux compacts indexés par identifiant d'état.
+
+    Une seule recherche depuis la source sert ensuite n'importe quel but:
+    path_to() remonte les parents en O(longueur du chemin), nearest() choisit
+    le but le plus proche d'un ensemble (ex: toutes les sorties de secours).
+    """
+
+    def __init__(self, graph: CSRGraph, source: int, dist: array, parent: array,
+                 expanded: int = 0, elapsed: float = 0.0):
+        self.graph = graph
+        self.source = source
+        self.dist = dist      # dist[v] = coût depuis la source (inf si non atteint)
+        self.parent = parent  # parent[v] = prédécesseur sur le chemin (-1 sinon)
+        self.expanded = expanded
+        self.elapsed = elapsed
+
+    @classmethod
+    def build(cls, graph, source: Any, targets: Optional[Iterable[Any]] = None,
+              first_only: bool = False) -> "ShortestPathTree":
+        """
+        Lance Dijkstra depuis `source` (graphe dict ou CSRGraph).
+        Sans `targets`, tout le graphe accessible est exploré. Avec `targets`,
+        la recherche s'arrête dès que tous les buts sont fixés, ou dès le
+        premier si first_only=True (cas « sortie la plus proche »).
+        """
+        debut = time.perf_counter()
+        if not isinstance(graph, CSRGraph):
+            graph = CSRGraph.from_dict(graph)
+        n = len(graph)
+        s = graph.id_of(source)
+        restants = None
+        if targets is not None:
+            restants = {graph.id_of(t) for t in targets if t in graph}
+
+        dist = array("d", [INF]) * n
+        parent = array("i", [-1]) * n
+        fixe = bytearray(n)
+        dist[s] = 0.0
+        file = [(0.0, s)]
+        offsets, cibles, couts = graph.offsets, graph.targets, graph.costs
+        expanses = 0
+
+        while file:
+            d, u = heapq.heappop(file)
+            if fixe[u]:
+                continue
+            fixe[u] = 1
+            expanses += 1
+            if restants is not None and u in restants:
+                restants.discard(u)
+                if first_only or not restants:
+                    break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = cibles[k]
+                nd = d + couts[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(file, (nd, v))
+
+        # Les états atteints mais non fixés (arrêt anticipé) n'ont pas une distance définitive
+        if restants is not None:
+            for v in range(n):
+                if not fixe[v]:
+                    dist[v] = INF
+                    parent[v] = -1
+
+        return cls(graph, s, dist, parent, expanses, time.perf_counter() - debut)
+
+    # ----------------------------
+    # Requêtes (sans nouvelle recherche)
+    # ----------------------------
+    def distance(self, goal: Any) -> float:
+        if goal not in self.graph:
+            return INF
+        return self.dist[self.graph.id_of(goal)]
+
+    def reachable(self, goal: Any) -> bool:
+        return self.distance(goal) != INF
+
+    def path_to(self, goal: Any) -> SearchResult:
+        """Chemin source -> goal reconstruit depuis les parents"""
+        debut = time.perf_counter()
+        if not self.reachable(goal):
+            return SearchResult(None, INF, self.expanded, 0, 0,
+                                time.perf_counter() - debut, "shortest-path-tree")
+        v = self.graph.id_of(goal)
+        cout = self.dist[v]
+        chemin: List[int] = []
+        while v != -1:
+            chemin.append(v)
+            v = self.parent[v]
+        chemin.reverse()
+        names = self.graph.names
+        if self.graph.cost_typecode != "d":
+            cout = int(cout)  # coûts entiers: même type de coût que ucs
+        return SearchResult([names[i] for i in chemin], cout, self.expanded, 0, 0,
+                            time.perf_counter() - debut, "shortest-path-tree")
+
+    def nearest(self, goals: Iterable[Any]) -> SearchResult:
+        """Chemin vers le but le plus proche parmi `goals` (échec si aucun n'est atteint)"""
+        meilleur, meilleure = None, INF
+        for goal in goals:
+            d = self.distance(goal)
+            if d < meilleure:
+                meilleur, meilleure = goal, d
+        if meilleur is None:
+            return SearchResult(None, INF, self.expanded, 0, 0, 0.0, "shortest-path-tree")
+        return self.path_to(meilleur)
+
+
+def shortest_path_tree(graphe, source: Any, buts: Optional[Iterable[Any]] = None) -> ShortestPathTree:
+    """Raccourci: arbre des plus courts chemins depuis `source`"""
+    return ShortestPathTree.build(graphe, source, buts)
+
+
+def nearest_goal(graphe, source: Any, buts: Iterable[Any]) -> SearchResult:
+    """Chemin vers le but le plus proche (ex: Sortie_Urgence), arrêt au premier but fixé"""
+    buts = list(buts)
+    arbre = ShortestPathTree.build(graphe, source, buts, first_only=True)
+    return arbre.nearest(buts)
@@ -0,0 +1,162 @@
+"""
+Outils partagés des tests: graphes aléatoires reproductibles et Dijkstra de
+référence, volontairement naïf, contre lequel toutes les méthodes sont comparées.
+"""
+# -*- coding: utf-8 -*-
+
+import heapq
+import math
+import os
+import random
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RACINE, "src"))
+sys.path.insert(0, RACINE)
+
+from problem_solving_agent import SearchStrategy  # noqa: E402
+
+INF = float("inf")
+Graph = Dict[Any, Dict[Any, float]]
+
+
+def random_graph(n: int, degree: float, seed: int, integer: bool = True,
+                 zero_cost: float = 0.0, max_cost: int = 20) -> Graph:
+    """Graphe orienté aléatoire {état: {voisin: coût}} (quelques arêtes de coût nul si demandé)"""
+    rng = random.Random(seed)
+    graph: Graph = {i: {} for i in range(n)}
+    for u in range(n):
+        for _ in range(rng.randint(0, int(2 * degree))):
+            v = rng.randrange(n)
+            if v == u:
+                continue
+            if rng.random() < zero_cost:
+                cout = 0
+            else:
+                cout = rng.randint(1, max_cost) if integer else round(rng.uniform(0.5, max_cost), 3)
+            graph[u][v] = cout
+    return graph
+
+
+def dijkstra(graph: Graph, source: Any) -> Dict[Any, float]:
+    """Distances exactes depuis `source` (Dijkstra à suppression paresseuse, sans optimisation)"""
+    dist = {source: 0}
+    file = [(0, 0, source)]
+    compteur = 1
+    fixes = set()
+    while file:
+        d, _, u = heapq.heappop(file)
+        if u in fixes:
+            continue
+        fixes.add(u)
+        for v, c in graph.get(u, {}).items():
+            if d + c < dist.get(v, INF):
+                dist[v] = d + c
+                heapq.heappush(file, (d + c, compteur, v))
+                compteur += 1
+    return dist
+
+
+def reversed_graph(graph: Graph) -> Graph:
+    inverse: Graph = {u: {} for u in graph}
+    for u, voisins in graph.items():
+        for v, c in voisins.items():
+            inverse.setdefault(v, {})[u] = c
+    return inverse
+
+
+def exact_heuristics(graph: Graph, goal: Any) -> Dict[Any, float]:
+    """h* (distance exacte au but, inf si inaccessible): heuristique admissible et consistante"""
+    dist = dijkstra(reversed_graph(graph), goal)
+    return {u: dist.get(u, INF) for u in graph}
+
+
+def scaled_heuristics(graph: Graph, goal: Any, factor: float) -> Dict[Any, float]:
+    """factor x h* (admissible pour factor <= 1), valeurs finies même hors d'atteinte"""
+    h = exact_heuristics(graph, goal)
+    return {u: (factor * d if d < INF else 0) for u, d in h.items()}
+
+
+def path_cost(graph: Graph, path: List[Any]) -> float:
+    """Coût d'un chemin, en vérifiant que chaque arête existe"""
+    total = 0
+    for a, b in zip(path, path[1:]):
+        assert b in graph[a], f"arête inexistante {a!r} -> {b!r}"
+        total += graph[a][b]
+    return total
+
+
+def assert_optimal(result, graph: Graph, start: Any, goal: Any,
+                   expected: Optional[float] = None) -> None:
+    """Le résultat est un plus court chemin valide de start à goal (ou un échec si inaccessible)"""
+    if expected is None:
+        expected = dijkstra(graph, start).get(goal, INF)
+    if expected == INF:
+        assert result.path is None
+        assert result.cost == INF
+        return
+    assert result.path is not None, f"{start!r} -> {goal!r}: chemin attendu de coût {expected}"
+    assert result.path[0] == start and result.path[-1] == goal
+    assert math.isclose(path_cost(graph, result.path), expected, rel_tol=1e-9, abs_tol=1e-9)
+    assert math.isclose(result.cost, expected, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def queries(graph: Graph, count: int, seed: int) -> List[Tuple[Any, Any]]:
+    rng = random.Random(seed)
+    etats = list(graph)
+    return [(rng.choice(etats), rng.choice(etats)) for _ in range(count)]
+
+
+def search_cases(integer: bool, n: int = 40, degree: float = 2.5, zero_cost: float = 0.0,
+                 seeds=range(12)):
+    """(graphe, départ, but, distance attendue) sur des graphes aléatoires, pour chaque graine"""
+    for seed in seeds:
+        graph = random_graph(n, degree, seed, integer=integer, zero_cost=zero_cost)
+        for start, goal in queries(graph, 6, seed):
+            yield graph, start, goal, dijkstra(graph, start).get(goal, INF)
+
+
+def renamed(graph: Graph, rename) -> Graph:
+    """Copie du graphe où chaque état i devient rename(i)"""
+    return {rename(u): {rename(v): c for v, c in voisins.items()} for u, voisins in graph.items()}
+
+
+# Nommages d'états utilisés par les tests d'allers-retours disque
+NAMINGS = {
+    "str": lambda i: f"v{i}",
+    "int": lambda i: i * 7 - 50,
+    "tuple": lambda i: (i % 5, i // 5),
+}
+
+
+# ----------------------------
+# Graphes des cas limites, partagés par les fichiers de test de chaque méthode
+# ----------------------------
+# Le but "Y" est inaccessible depuis "A"
+UNREACHABLE = {
+    "A": {"B": 1, "C": 2}, "B": {"C": 1, "A": 1}, "C": {"A": 3},
+    "X": {"Y": 1}, "Y": {"X": 1},
+}
+
+# Cycles de coût nul A -> B -> C -> A et D <-> E: d(A, F) = 3
+ZERO_CYCLES = {
+    "A": {"B": 0, "D": 5}, "B": {"C": 0, "A": 0}, "C": {"A": 0, "D": 2},
+    "D": {"E": 0}, "E": {"D": 0, "F": 1}, "F": {},
+}
+
+# États nommés par des tuples (cellules de grille): d((0, 0), (2, 2)) = 4, (9, 9) isolé
+TUPLES = {
+    (0, 0): {(0, 1): 1, (1, 0): 4}, (0, 1): {(1, 1): 1}, (1, 0): {(1, 1): 1},
+    (1, 1): {(2, 2): 2}, (2, 2): {}, (9, 9): {},
+}
+
+
+@pytest.fixture(autouse=True)
+def no_path_cache():
+    """Aucun test ne doit hériter du cache de chemins installé par un autre"""
+    SearchStrategy.set_path_cache(None)
+    yield
+    SearchStrategy.set_path_cache(None)
@@ -0,0 +1,33 @@
+"""Matrices all-pairs (Floyd-Warshall, Dijkstra répété) et allers-retours disque"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import INF, NAMINGS, assert_optimal, dijkstra, queries, random_graph, renamed
+
+pytest.importorskip("numpy")
+
+from all_pairs import AllPairsShortestPaths  # noqa: E402
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("method", ("floyd-warshall", "dijkstra"))
+def test_all_pairs(seed, method):
+    graph = random_graph(40, 2.5, seed, integer=False)
+    matrices = AllPairsShortestPaths.build(graph, method=method)
+    for start in graph:
+        attendu = dijkstra(graph, start)
+        for goal in graph:
+            assert_optimal(matrices.query(start, goal), graph, start, goal, attendu.get(goal, INF))
+
+
+@pytest.mark.parametrize("naming", sorted(NAMINGS))
+@pytest.mark.parametrize("mmap", (True, False))
+def test_all_pairs_round_trip(tmp_path, naming, mmap):
+    graph = renamed(random_graph(30, 2.5, 5, integer=False), NAMINGS[naming])
+    matrices = AllPairsShortestPaths.build(graph)
+    matrices.save(str(tmp_path / "apsp"))
+    relues = AllPairsShortestPaths.load(str(tmp_path / "apsp"), mmap=mmap)
+    assert relues.names == matrices.names
+    for start, goal in queries(graph, 30, 5):
+        assert_optimal(relues.query(start, goal), graph, start, goal)
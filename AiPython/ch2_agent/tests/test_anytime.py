@@ -0,0 +1,51 @@
+"""A* pondéré et ARA*: bornes de sous-optimalité publiées, convergence vers l'optimal"""
+# -*- coding: utf-8 -*-
+
+import math
+import random
+
+import pytest
+
+from conftest import (
+    INF, assert_optimal, dijkstra, exact_heuristics, path_cost, queries, random_graph,
+    scaled_heuristics, search_cases,
+)
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+def test_weighted_a_star_respects_bound():
+    for graph, start, goal, attendu in search_cases(integer=False):
+        h = scaled_heuristics(graph, goal, 1)
+        resultat = SearchStrategy.weighted_a_star(NavigationProblem(start, goal, graph), h, 2.0)
+        if attendu == INF:
+            assert resultat.path is None
+            continue
+        assert resultat.bound == 2.0
+        assert math.isclose(path_cost(graph, resultat.path), resultat.cost)
+        assert attendu - 1e-9 <= resultat.cost <= 2.0 * attendu + 1e-9
+
+
+def test_anytime_a_star_converges_to_optimal():
+    for graph, start, goal, attendu in search_cases(integer=True):
+        h = scaled_heuristics(graph, goal, 1)
+        bornes = []
+        resultat = SearchStrategy.anytime_a_star(NavigationProblem(start, goal, graph), h,
+                                                 epsilon=3.0, decrement=1.0,
+                                                 on_solution=lambda r: bornes.append(r.bound))
+        assert_optimal(resultat, graph, start, goal, attendu)
+        if attendu < INF:
+            assert resultat.bound == 1
+            assert bornes == sorted(bornes, reverse=True)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_anytime_a_star_inconsistent_heuristic(seed):
+    # h = h* x facteur aléatoire par état: admissible mais pas consistante.
+    # La borne 1 finale ne doit être annoncée que pour un coût réellement optimal.
+    graph = random_graph(30, 2.5, seed)
+    rng = random.Random(seed)
+    for start, goal in queries(graph, 5, seed):
+        h = {u: (d * rng.random() if d < INF else 0) for u, d in exact_heuristics(graph, goal).items()}
+        resultat = SearchStrategy.anytime_a_star(NavigationProblem(start, goal, graph), h,
+                                                 epsilon=2.0, decrement=0.5)
+        assert_optimal(resultat, graph, start, goal, dijkstra(graph, start).get(goal, INF))
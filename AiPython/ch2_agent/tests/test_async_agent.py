@@ -0,0 +1,67 @@
+"""Agents asynchrones: délai par agent, appels jamais superposés, mode synchrone"""
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+
+import pytest
+
+from agent import Agent
+from async_agent import AsyncEnvironment, SyncAgentAdapter
+
+
+class _SlowAgent(Agent):
+    def __init__(self, delay: float):
+        super().__init__("lent")
+        self.delay = delay
+        self.running = self.max_running = self.calls = 0
+
+    def program(self, percept):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.calls += 1
+        time.sleep(self.delay)
+        self.running -= 1
+        return "avancer"
+
+
+class _Env(AsyncEnvironment):
+    def __init__(self, agent_timeout=None):
+        super().__init__(agent_timeout)
+        self.actions = []
+
+    async def get_percepts(self, agent):
+        return {}
+
+    async def apply_action(self, agent, action):
+        self.actions.append(action)
+
+
+def test_async_timeout_never_overlaps_calls():
+    agent = _SlowAgent(0.2)
+    env = _Env(agent_timeout=0.05)
+    env.agents = [SyncAgentAdapter(agent, in_thread=True)]
+
+    async def scenario():
+        for _ in range(4):
+            await env.step()
+        await asyncio.sleep(0.3)
+        await env.step()
+
+    asyncio.run(scenario())
+    assert agent.max_running == 1
+    assert env.timeouts["lent"] >= 1 and env.skipped["lent"] >= 1
+    assert agent.calls == env.timeouts["lent"] and env.actions == []
+
+
+def test_async_timeout_requires_thread():
+    with pytest.raises(ValueError):
+        SyncAgentAdapter(_SlowAgent(0), timeout=1)
+    env = _Env(agent_timeout=1)
+    env.agents = [_SlowAgent(0)]
+    with pytest.raises(ValueError):
+        env.run_sync(1)
+    sans_delai = _Env()
+    sans_delai.agents = [_SlowAgent(0)]
+    sans_delai.run_sync(2)
+    assert sans_delai.actions == ["avancer", "avancer"]
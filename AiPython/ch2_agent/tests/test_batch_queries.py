@@ -0,0 +1,25 @@
+"""Moteur de requêtes en lot, en série et sur un pool de processus, comparé à Dijkstra"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from batch_queries import BatchQueryEngine
+from conftest import TUPLES, assert_optimal, queries, random_graph, renamed
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+@pytest.mark.parametrize("rename", (str, lambda i: (i % 7, i // 7)), ids=("str", "tuple"))
+def test_batch_matches_dijkstra(workers, rename):
+    graph = renamed(random_graph(40, 2.5, 3), rename)
+    paires = queries(graph, 50, 3)
+    with BatchQueryEngine(graph, "ucs", workers=workers, chunksize=8) as moteur:
+        for (start, goal), resultat in zip(paires, moteur.run_all(paires)):
+            assert_optimal(resultat, graph, start, goal)
+        assert moteur.completed == len(paires)
+
+
+def test_batch_tuple_names_unordered():
+    paires = [((0, 0), (2, 2)), ((0, 1), (2, 2)), ((0, 0), (9, 9))] * 5
+    with BatchQueryEngine(TUPLES, "bidirectional-ucs", workers=2, chunksize=2) as moteur:
+        couts = sorted(resultat.cost for _, _, resultat in moteur.run(paires, ordered=False))
+    assert couts == sorted([4, 3, float("inf")] * 5)
@@ -0,0 +1,44 @@
+"""UCS et A* bidirectionnels comparés à Dijkstra, y compris après modification du graphe"""
+# -*- coding: utf-8 -*-
+
+from conftest import assert_optimal, reversed_graph, scaled_heuristics, search_cases
+from path_cache import VersionedGraph
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+def test_bidirectional_ucs():
+    for graph, start, goal, attendu in search_cases(integer=False):
+        resultat = SearchStrategy.bidirectional_ucs(NavigationProblem(start, goal, graph))
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+def test_bidirectional_a_star():
+    for graph, start, goal, attendu in search_cases(integer=True):
+        vers_but = scaled_heuristics(graph, goal, 1)
+        vers_depart = scaled_heuristics(reversed_graph(graph), start, 1)
+        resultat = SearchStrategy.bidirectional_a_star(NavigationProblem(start, goal, graph),
+                                                       vers_but, vers_depart)
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+def test_mutated_graph_is_reversed_again():
+    # L'adjacence inverse du premier appel ne doit pas survivre à la suppression de B -> C
+    graph = {"A": {"B": 1, "D": 5}, "B": {"C": 1}, "C": {}, "D": {"C": 1}}
+    assert SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph)).cost == 2
+    del graph["B"]["C"]
+    resultat = SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph))
+    assert resultat.path == ["A", "D", "C"] and resultat.cost == 6
+    graph["B"]["C"] = 0.5
+    assert_optimal(SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph)), graph, "A", "C")
+
+
+def test_versioned_graph_is_reversed_after_each_change():
+    graph = VersionedGraph({"A": {"B": 1, "D": 5}, "B": {"C": 1}, "C": {}, "D": {"C": 1}})
+    assert SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph)).cost == 2
+    assert SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph)).cost == 2
+    graph.remove_edge("B", "C")
+    assert SearchStrategy.bidirectional_ucs(NavigationProblem("A", "C", graph)).cost == 6
+    graph.set_edge("D", "C", 0.5)
+    vers_but = {"A": 0, "B": 0, "C": 0, "D": 0}
+    assert SearchStrategy.bidirectional_a_star(NavigationProblem("A", "C", graph),
+                                               vers_but, vers_but).cost == 5.5
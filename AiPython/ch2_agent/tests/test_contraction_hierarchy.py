@@ -0,0 +1,50 @@
+"""Hiérarchie de contraction: requêtes comparées à Dijkstra et allers-retours disque"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import NAMINGS, assert_optimal, queries, random_graph, renamed
+from contraction_hierarchy import ContractionHierarchy, verify_against_ucs
+from csr_graph import CSRGraph
+from graph_file import load_graph_file, save_graph
+
+SEEDS = range(8)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("integer", (True, False))
+def test_contraction_hierarchy(seed, integer):
+    graph = random_graph(60, 2.5, seed, integer=integer)
+    ch = ContractionHierarchy.build(graph)
+    for start, goal in queries(graph, 20, seed):
+        assert_optimal(ch.query(start, goal), graph, start, goal)
+    assert verify_against_ucs(ch, graph, samples=20, seed=seed) == []
+
+
+# ----------------------------
+# Sauvegarde et relecture
+# ----------------------------
+@pytest.mark.parametrize("naming", sorted(NAMINGS))
+def test_contraction_hierarchy_round_trip(tmp_path, naming):
+    graph = renamed(random_graph(50, 2.5, 3), NAMINGS[naming])
+    ch = ContractionHierarchy.build(graph)
+    chemin = str(tmp_path / "g.ch")
+    ch.save(chemin)
+    relue = ContractionHierarchy.load(chemin)
+    assert relue.names == ch.names
+    assert relue.up_costs.typecode == ch.up_costs.typecode == "q"
+    for start, goal in queries(graph, 20, 3):
+        assert_optimal(relue.query(start, goal), graph, start, goal)
+
+
+def test_contraction_hierarchy_keeps_mapped_integer_costs(tmp_path):
+    chemin = str(tmp_path / "g.agraph")
+    save_graph(CSRGraph.from_dict(random_graph(30, 2, 4)), chemin)
+    with load_graph_file(chemin) as relu:
+        assert ContractionHierarchy.build(relu).up_costs.typecode == "q"
+
+
+def test_contraction_hierarchy_rejects_unreadable_names(tmp_path):
+    ch = ContractionHierarchy.build({frozenset({1}): {"b": 1}, "b": {}})
+    with pytest.raises(ValueError):
+        ch.save(str(tmp_path / "g.ch"))
@@ -0,0 +1,54 @@
+"""Graphe CSR: mêmes réponses que le graphe dict, noms d'états conservés jusqu'à l'agent"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import TUPLES, assert_optimal, random_graph, scaled_heuristics, search_cases
+from csr_graph import CSRGraph
+from problem_solving_agent import (
+    NavigationPercept, ProblemSolvingAgent, SearchStrategy, make_navigation_problem,
+)
+
+
+def test_from_dict_round_trip():
+    graph = random_graph(40, 2.5, 0)
+    csr = CSRGraph.from_dict(graph)
+    assert csr.to_dict() == graph
+    assert csr.num_edges == sum(len(voisins) for voisins in graph.values())
+    assert CSRGraph.from_dict(TUPLES).to_dict() == TUPLES
+
+
+@pytest.mark.parametrize("strategy", ("ucs", "a-star"))
+def test_csr_problem_matches_dict_problem(strategy):
+    for graph, start, goal, attendu in search_cases(integer=True):
+        csr = CSRGraph.from_dict(graph)
+        probleme = make_navigation_problem(start, goal, csr)
+        if strategy == "ucs":
+            resultat = SearchStrategy.ucs(probleme)
+        else:
+            resultat = SearchStrategy.a_star(probleme, scaled_heuristics(graph, goal, 1))
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+def test_goal_state_stays_a_name():
+    probleme = make_navigation_problem((0, 0), (2, 2), CSRGraph.from_dict(TUPLES))
+    assert probleme.goal_state == (2, 2)
+    assert probleme.decode_path([probleme.initial_state]) == [(0, 0)]
+    assert NavigationPercept((1, 1), probleme).neighbors == {(2, 2): 2}
+    assert SearchStrategy.bidirectional_ucs(probleme).cost == 4
+
+
+@pytest.mark.parametrize("replan_each_step", (False, True))
+def test_agent_reaches_goal_on_csr_problem(replan_each_step):
+    graph = {"A": {"B": 1, "C": 4}, "B": {"C": 1, "D": 5}, "C": {"D": 1}, "D": {}}
+    probleme = make_navigation_problem("A", "D", CSRGraph.from_dict(graph))
+    agent = ProblemSolvingAgent("robot", SearchStrategy.ucs, probleme, replan_each_step)
+    position, visites = "A", ["A"]
+    for _ in range(10):
+        action = agent.program(NavigationPercept(position, probleme))
+        if action is None:
+            break
+        position = action[len("move_to_"):]
+        visites.append(position)
+    assert visites == ["A", "B", "C", "D"]
+    assert agent.done
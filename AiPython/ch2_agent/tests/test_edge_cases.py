@@ -0,0 +1,68 @@
+"""
+Cas limites communs à toutes les méthodes (but inaccessible, cycles de coût
+nul, noms d'états en tuples); graphes partagés dans conftest.
+"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import (
+    INF, TUPLES, UNREACHABLE, ZERO_CYCLES, assert_optimal, dijkstra, reversed_graph,
+    scaled_heuristics,
+)
+from contraction_hierarchy import ContractionHierarchy
+from csr_graph import CSRGraph
+from problem_solving_agent import (
+    NavigationProblem, SearchStrategy, make_navigation_problem,
+)
+from shortest_path_tree import ShortestPathTree
+
+
+def _all_methods(graph, start, goal):
+    """(nom, résultat) de chaque méthode optimale sur la requête start -> goal"""
+    vers_but = scaled_heuristics(graph, goal, 1)
+    vers_depart = scaled_heuristics(reversed_graph(graph), start, 1)
+    probleme = lambda: NavigationProblem(start, goal, graph)  # noqa: E731
+    yield "ucs", SearchStrategy.ucs(probleme())
+    for frontier in ("heap", "buckets", "radix", "indexed-heap"):
+        yield f"ucs-{frontier}", SearchStrategy.ucs(probleme(), frontier=frontier)
+        yield f"a-star-{frontier}", SearchStrategy.a_star(probleme(), vers_but, frontier=frontier)
+    yield "ida-star", SearchStrategy.ida_star(probleme(), vers_but)
+    yield "anytime", SearchStrategy.anytime_a_star(probleme(), vers_but)
+    yield "bidirectional-ucs", SearchStrategy.bidirectional_ucs(probleme())
+    yield "bidirectional-a-star", SearchStrategy.bidirectional_a_star(probleme(), vers_but, vers_depart)
+    yield "csr-ucs", SearchStrategy.ucs(make_navigation_problem(start, goal, CSRGraph.from_dict(graph)))
+    yield "ch", ContractionHierarchy.build(graph).query(start, goal)
+    yield "tree", ShortestPathTree.build(graph, start).path_to(goal)
+
+
+# ----------------------------
+# But inaccessible
+# ----------------------------
+def test_unreachable_goal_every_method():
+    for nom, resultat in _all_methods(UNREACHABLE, "A", "Y"):
+        assert resultat.path is None, nom
+        assert resultat.cost == INF, nom
+
+
+# ----------------------------
+# Cycles de coût nul
+# ----------------------------
+@pytest.mark.parametrize("goal", ("C", "D", "F"))
+def test_zero_cost_cycles(goal):
+    attendu = dijkstra(ZERO_CYCLES, "A")[goal]
+    for nom, resultat in _all_methods(ZERO_CYCLES, "A", goal):
+        assert_optimal(resultat, ZERO_CYCLES, "A", goal, attendu)
+    chemin = SearchStrategy.iddfs(NavigationProblem("A", goal, ZERO_CYCLES)).path
+    assert chemin[0] == "A" and chemin[-1] == goal
+
+
+# ----------------------------
+# Noms d'états en tuples
+# ----------------------------
+def test_tuple_state_names():
+    for nom, resultat in _all_methods(TUPLES, (0, 0), (2, 2)):
+        assert_optimal(resultat, TUPLES, (0, 0), (2, 2), 4)
+        assert all(type(etat) is tuple for etat in resultat.path), nom
+    for nom, resultat in _all_methods(TUPLES, (0, 0), (9, 9)):
+        assert resultat.path is None, nom
@@ -0,0 +1,28 @@
+"""Générateurs des benchmarks: reproductibles par graine, heuristiques admissibles"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from benchmarks.generators import GENERATORS, generate, grid_with_obstacles
+from conftest import INF, exact_heuristics
+
+
+def _admissible(bench):
+    exacte = exact_heuristics(bench.graph, bench.goal)
+    return all(bench.heuristic[u] <= exacte[u] + 1e-9 for u in bench.graph if exacte[u] < INF)
+
+
+@pytest.mark.parametrize("family", sorted(GENERATORS))
+def test_reproducible_and_admissible(family):
+    bench = generate(family, 300, seed=5)
+    assert bench.graph == generate(family, 300, seed=5).graph
+    assert bench.start in bench.graph and bench.goal in bench.graph
+    assert _admissible(bench)
+
+
+def test_weighted_grid():
+    bench = grid_with_obstacles(400, obstacle_ratio=0, seed=42, max_cost=9)
+    couts = {c for voisins in bench.graph.values() for c in voisins.values()}
+    assert bench.num_nodes == 400 and couts <= set(range(1, 10)) and len(couts) > 1
+    assert _admissible(bench)
+    assert grid_with_obstacles(400, seed=3).graph == generate("grid", 400, seed=3).graph
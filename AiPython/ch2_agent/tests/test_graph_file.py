@@ -0,0 +1,49 @@
+"""Graphe binaire projeté en mémoire: allers-retours disque et fichiers invalides"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import NAMINGS, assert_optimal, queries, random_graph, renamed
+from csr_graph import CSRGraph, RangeIndex
+from graph_file import MappedGraph, load_graph_file, save_graph
+from problem_solving_agent import SearchStrategy, make_navigation_problem
+
+
+@pytest.mark.parametrize("naming", ("str", "int"))
+@pytest.mark.parametrize("integer", (True, False))
+def test_graph_file_round_trip(tmp_path, naming, integer):
+    graph = renamed(random_graph(40, 2.5, 1, integer=integer), NAMINGS[naming])
+    coords = {nom: (float(i), -float(i)) for i, nom in enumerate(graph)}
+    chemin = str(tmp_path / "g.agraph")
+    save_graph(CSRGraph.from_dict(graph), chemin, coords)
+    with load_graph_file(chemin) as relu:
+        assert relu.to_dict() == graph
+        assert relu.cost_typecode == ("q" if integer else "d")
+        for nom in list(graph)[:5]:
+            assert relu.coordinates(nom) == coords[nom]
+        assert "absent" not in relu
+        for start, goal in queries(graph, 10, 1):
+            assert_optimal(SearchStrategy.ucs(make_navigation_problem(start, goal, relu)),
+                           graph, start, goal)
+
+
+def test_graph_file_range_names(tmp_path):
+    csr = CSRGraph.from_dict(renamed(random_graph(30, 2, 2), lambda i: i + 1))
+    dimacs = CSRGraph(range(1, 31), csr.offsets, csr.targets, csr.costs, RangeIndex(1, 30))
+    chemin = str(tmp_path / "d.agraph")
+    save_graph(dimacs, chemin)
+    with MappedGraph(chemin) as relu:
+        assert isinstance(relu.names, range)
+        assert relu.to_dict() == dimacs.to_dict()
+
+
+def test_graph_file_rejects_mixed_names(tmp_path):
+    with pytest.raises(ValueError):
+        save_graph(CSRGraph.from_dict({(0, 0): {"a": 1}, "a": {}}), str(tmp_path / "x.agraph"))
+
+
+def test_graph_file_rejects_foreign_file(tmp_path):
+    chemin = tmp_path / "faux.agraph"
+    chemin.write_bytes(b"pas un graphe" * 10)
+    with pytest.raises(ValueError):
+        load_graph_file(str(chemin))
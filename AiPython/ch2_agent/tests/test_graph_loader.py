@@ -0,0 +1,78 @@
+"""Chargeurs texte (listes d'arêtes CSV/TSV, DIMACS) comparés au graphe dict d'origine"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import random_graph, renamed
+from graph_loader import load_dimacs, load_edge_list
+from problem_solving_agent import SearchStrategy, make_navigation_problem
+
+
+def test_edge_list_matches_dict(tmp_path):
+    graph = renamed(random_graph(40, 2.5, 6), lambda i: f"v{i}")
+    chemin = tmp_path / "g.csv"
+    lignes = ["source,cible,cout", "# commentaire"]
+    lignes += [f"{u},{v},{c}" for u, voisins in graph.items() for v, c in voisins.items()]
+    chemin.write_text("\n".join(lignes) + "\n")
+    # Un état sans aucune arête n'apparaît pas dans la liste
+    presents = {u for u, voisins in graph.items() if voisins} | {v for d in graph.values() for v in d}
+    attendu = {u: voisins for u, voisins in graph.items() if u in presents}
+    for taille in (64, 1 << 20):
+        assert load_edge_list(str(chemin), chunk_size=taille).to_dict() == attendu
+
+
+def test_edge_list_without_comment_prefix(tmp_path):
+    chemin = tmp_path / "g.txt"
+    chemin.write_text("#a b 1\nb c 2\n")
+    assert load_edge_list(str(chemin)).num_edges == 1
+    for sans in ("", None):
+        relu = load_edge_list(str(chemin), comment=sans)
+        assert relu.num_edges == 2 and "#a" in relu
+
+
+def test_edge_list_detects_merged_names(tmp_path):
+    chemin = tmp_path / "g.txt"
+    chemin.write_text("01 2 1\n1 3 1\n")
+    with pytest.raises(ValueError):
+        load_edge_list(str(chemin), name_type=int)
+    assert len(load_edge_list(str(chemin))) == 4
+
+
+def test_dimacs(tmp_path):
+    chemin = tmp_path / "g.gr"
+    chemin.write_text("c exemple\np sp 4 4\na 1 2 3\na 2 3 4\na 1 3 9\na 3 4 1\n")
+    graphe = load_dimacs(str(chemin))
+    assert graphe.to_dict() == {1: {2: 3, 3: 9}, 2: {3: 4}, 3: {4: 1}, 4: {}}
+    assert SearchStrategy.ucs(make_navigation_problem(1, 4, graphe)).cost == 8
+
+
+@pytest.mark.parametrize("arc", ("a 1 5 2", "a 0 2 2"))
+def test_dimacs_rejects_out_of_range_arcs(tmp_path, arc):
+    chemin = tmp_path / "g.gr"
+    chemin.write_text(f"p sp 4 2\na 1 2 3\n{arc}\n")
+    with pytest.raises(ValueError):
+        load_dimacs(str(chemin))
+
+
+@pytest.mark.parametrize("taille", (8, 24, 64, 1 << 20))
+def test_edge_list_rows_of_varying_width(tmp_path, taille):
+    # 4 + 3 + 5 champs = 3 lignes de 4: le total seul ne révèle pas le décalage
+    chemin = tmp_path / "g.txt"
+    motif = ["a b 1 9", "c d 2", "e f 3 9 9"]
+    chemin.write_text("\n".join(motif * 20) + "\n")
+    assert load_edge_list(str(chemin), chunk_size=taille).to_dict() == {
+        "a": {"b": 1}, "b": {}, "c": {"d": 2}, "d": {}, "e": {"f": 3}, "f": {}}
+    assert load_edge_list(str(chemin), chunk_size=taille).num_edges == 60
+
+
+def test_edge_list_header_without_cost_column(tmp_path):
+    chemin = tmp_path / "g.csv"
+    chemin.write_text("source,target\n1,2\n2,3\n")
+    for name_type in (str, int):
+        relu = load_edge_list(str(chemin), columns=(0, 1), name_type=name_type)
+        assert relu.num_edges == 2 and len(relu) == 3
+    assert load_edge_list(str(chemin), columns=(0, 1), header=False).num_edges == 3
+    # Noms non numériques: seul name_type permet de reconnaître l'en-tête
+    chemin.write_text("from,to\n1,b\n")
+    assert load_edge_list(str(chemin), columns=(0, 1), header=True).num_edges == 1
+    assert load_edge_list(str(chemin), columns=(0, 1), name_type=str).num_edges == 2
@@ -0,0 +1,90 @@
+"""Jump Point Search et A* sur grille comparés à Dijkstra sur la même grille en dict"""
+# -*- coding: utf-8 -*-
+
+import math
+import random
+
+import pytest
+
+from conftest import INF, dijkstra
+from grid_map import SQRT2, GridMap, GridProblem, jump_point_search
+from problem_solving_agent import SearchHooks, SearchStrategy
+
+
+def _random_grid(width: int, height: int, obstacles: float, seed: int) -> GridMap:
+    rng = random.Random(seed)
+    return GridMap(width, height, bytes(rng.random() >= obstacles for _ in range(width * height)))
+
+
+def _as_dict(grid: GridMap, diagonal: bool):
+    """Graphe {(x, y): {(x', y'): coût}} des cellules libres, mêmes règles que GridProblem"""
+    graph = {}
+    for y in range(grid.height):
+        for x in range(grid.width):
+            if not grid.is_free(x, y):
+                continue
+            voisins = graph[(x, y)] = {}
+            for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                if grid.is_free(x + dx, y + dy):
+                    voisins[(x + dx, y + dy)] = 1
+            if diagonal:
+                for dx in (1, -1):
+                    for dy in (1, -1):
+                        if (grid.is_free(x + dx, y + dy) and grid.is_free(x + dx, y)
+                                and grid.is_free(x, y + dy)):
+                            voisins[(x + dx, y + dy)] = SQRT2
+    return graph
+
+
+def _check(resultat, graph, start, goal, attendu):
+    if attendu == INF:
+        assert resultat.path is None
+        return
+    chemin = resultat.path
+    assert chemin[0] == start and chemin[-1] == goal
+    assert math.isclose(sum(graph[a][b] for a, b in zip(chemin, chemin[1:])), attendu)
+    assert math.isclose(resultat.cost, attendu)
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("diagonal", (True, False))
+def test_jps_and_a_star_match_dijkstra(seed, diagonal):
+    grid = _random_grid(24, 18, 0.25, seed)
+    graph = _as_dict(grid, diagonal)
+    libres = sorted(graph)
+    rng = random.Random(seed)
+    for _ in range(8):
+        start, goal = rng.choice(libres), rng.choice(libres)
+        attendu = dijkstra(graph, start).get(goal, INF)
+        probleme = GridProblem(grid, start, goal, diagonal)
+        _check(jump_point_search(probleme), graph, start, goal, attendu)
+        _check(SearchStrategy.a_star(probleme), graph, start, goal, attendu)
+
+
+def test_grid_from_strings():
+    plan = GridMap.from_strings(["....#", ".##.#", "....."])
+    assert (plan.width, plan.height) == (5, 3)
+    assert not plan.is_free(1, 1) and plan.is_free(3, 1) and not plan.is_free(5, 0)
+    resultat = jump_point_search(GridProblem(plan, (0, 0), (4, 2)))
+    assert resultat.path[0] == (0, 0) and resultat.path[-1] == (4, 2)
+
+
+def test_blocked_endpoint_rejected():
+    plan = GridMap.from_strings([".#", ".."])
+    with pytest.raises(ValueError):
+        GridProblem(plan, (1, 0), (0, 1))
+
+
+def test_jps_stats_and_hooks():
+    plan = _random_grid(30, 20, 0.2, 4)
+    libres = [(x, y) for y in range(plan.height) for x in range(plan.width) if plan.is_free(x, y)]
+    developpes, empiles = [], []
+    crochets = SearchHooks(on_expand=developpes.append, on_push=lambda etat, f: empiles.append(f))
+    resultat = jump_point_search(GridProblem(plan, libres[0], libres[-1]), crochets)
+    assert resultat.strategy == "jps" and resultat.elapsed > 0
+    assert {"search", "reconstruct"} <= set(resultat.stats.phases)
+    assert len(developpes) == resultat.nodes_expanded == resultat.stats.expanded
+    assert len(empiles) == resultat.nodes_generated - 1
+    bloque = GridMap.from_strings([".#.", "##.", "..."])
+    echec = jump_point_search(GridProblem(bloque, (0, 0), (2, 2)))
+    assert echec.path is None and echec.cost == float("inf") and "search" in echec.stats.phases
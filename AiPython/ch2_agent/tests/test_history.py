@@ -0,0 +1,20 @@
+"""Historique en colonnes des percepts et actions"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from history import ColumnarHistory
+from problem_solving_agent import NavigationPercept, NavigationProblem
+
+
+def test_columnar_history_derives_fields_from_percept_objects():
+    graph = {"A": {"B": 1}, "B": {}}
+    historique = ColumnarHistory()
+    historique.append((NavigationPercept("A", NavigationProblem("A", "B", graph)), "B"))
+    assert historique[0] == ({"location": "A", "neighbors": {"B": 1}}, "B")
+    with pytest.raises(ValueError):
+        ColumnarHistory(fields=())
+    with pytest.raises(ValueError):
+        ColumnarHistory().append(({}, "B"))
+    with pytest.raises(ValueError):
+        ColumnarHistory().append((42, "B"))
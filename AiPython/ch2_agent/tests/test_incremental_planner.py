@@ -0,0 +1,85 @@
+"""D* Lite comparé à UCS après chaque changement d'arête et chaque déplacement de l'agent"""
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from conftest import INF, TUPLES, UNREACHABLE, ZERO_CYCLES, assert_optimal, queries, random_graph
+from incremental_planner import DStarLitePlanner
+from problem_solving_agent import (
+    NavigationPercept, NavigationProblem, ProblemSolvingAgent, SearchStrategy,
+)
+
+
+def _replay(graph, start, goal, rng, steps: int, costs):
+    """Alterne plan, changement d'arête aléatoire et déplacement; compare chaque plan à UCS"""
+    planificateur = DStarLitePlanner()
+    etats = list(graph)
+    for _ in range(steps):
+        resultat = planificateur(NavigationProblem(start, goal, graph))
+        attendu = SearchStrategy.ucs(NavigationProblem(start, goal, graph)).cost
+        assert_optimal(resultat, graph, start, goal, attendu)
+        # Surtout des arêtes existantes: les hausses de coût sont le cas délicat
+        u = rng.choice(etats)
+        v = rng.choice(list(graph[u]) if graph[u] and rng.random() < 0.7 else etats)
+        if u != v:
+            planificateur.update_edge(u, v, rng.choice(costs))
+        if resultat.path is not None and len(resultat.path) > 1 and rng.random() < 0.5:
+            start = resultat.path[1]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_replans_after_edge_changes(seed):
+    rng = random.Random(seed)
+    graph = random_graph(40, 2.5, seed)
+    start, goal = queries(graph, 1, seed)[0]
+    _replay(graph, start, goal, rng, 10, (None, 1, 5, 20, 40))
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_zero_cost_edges_match_ucs(seed):
+    # Régression: une égalité de clés arrêtait la recherche avec un départ incohérent
+    rng = random.Random(seed)
+    graph = random_graph(rng.randint(5, 40), 2, seed, zero_cost=0.4, max_cost=5)
+    start, goal = queries(graph, 1, seed)[0]
+    _replay(graph, start, goal, rng, 8, (None, 0, 0, 1, 3))
+
+
+def test_zero_cost_successor_sharing_start_key():
+    # S -> A a un coût nul: après la hausse de A -> G, A et S ont la même clé
+    graph = {"S": {"A": 0, "G": 5}, "A": {"G": 1}, "G": {}}
+    planificateur = DStarLitePlanner()
+    assert planificateur(NavigationProblem("S", "G", graph)).cost == 1
+    planificateur.update_edge("A", "G", 10)
+    resultat = planificateur(NavigationProblem("S", "G", graph))
+    assert resultat.path == ["S", "G"] and resultat.cost == 5
+
+
+def test_edge_cases():
+    assert DStarLitePlanner()(NavigationProblem("A", "Y", UNREACHABLE)).cost == INF
+    for goal in ("C", "D", "F"):
+        assert_optimal(DStarLitePlanner()(NavigationProblem("A", goal, ZERO_CYCLES)),
+                       ZERO_CYCLES, "A", goal)
+    assert_optimal(DStarLitePlanner()(NavigationProblem((0, 0), (2, 2), TUPLES)), TUPLES, (0, 0), (2, 2))
+
+
+def test_notify_before_first_plan():
+    graph = {"A": {"B": 1, "C": 5}, "B": {"C": 1}, "C": {}}
+    planificateur = DStarLitePlanner()
+    graph["B"]["C"] = 10
+    planificateur.notify_edge_change("B", "C")
+    assert planificateur(NavigationProblem("A", "C", graph)).path == ["A", "C"]
+    with pytest.raises(RuntimeError):
+        DStarLitePlanner().update_edge("A", "B", 2)
+
+
+def test_agent_replans_each_step():
+    graph = {"A": {"B": 1, "C": 4}, "B": {"A": 1, "D": 1}, "C": {"D": 1}, "D": {}}
+    planificateur = DStarLitePlanner()
+    probleme = NavigationProblem("A", "D", graph)
+    agent = ProblemSolvingAgent("robot", planificateur, probleme, replan_each_step=True)
+    assert agent.program(NavigationPercept("A", probleme)) == "move_to_B"
+    planificateur.update_edge("B", "D", 10)
+    assert agent.program(NavigationPercept("B", probleme)) == "move_to_A"
+    assert agent.program(NavigationPercept("A", probleme)) == "move_to_C"
@@ -0,0 +1,47 @@
+"""IDDFS et IDA*: optimalité sur graphes aléatoires, terminaison et budgets"""
+# -*- coding: utf-8 -*-
+
+import time
+
+import pytest
+
+from conftest import (
+    INF, UNREACHABLE, assert_optimal, dijkstra, path_cost, scaled_heuristics, search_cases,
+)
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+def test_iddfs_finds_fewest_edges():
+    for graph, start, goal, _ in search_cases(integer=True, n=25, degree=2):
+        unitaire = {u: {v: 1 for v in voisins} for u, voisins in graph.items()}
+        attendu = dijkstra(unitaire, start).get(goal, INF)
+        resultat = SearchStrategy.iddfs(NavigationProblem(start, goal, graph))
+        if attendu == INF:
+            assert resultat.path is None
+        else:
+            assert len(resultat.path) - 1 == attendu
+            path_cost(graph, resultat.path)
+
+
+@pytest.mark.parametrize("integer", (True, False))
+def test_ida_star(integer):
+    for graph, start, goal, attendu in search_cases(integer=integer, n=25, degree=2):
+        h = scaled_heuristics(graph, goal, 0.5)
+        resultat = SearchStrategy.ida_star(NavigationProblem(start, goal, graph), h)
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+def test_unreachable_goal_iterative_deepening_terminates():
+    debut = time.perf_counter()
+    assert SearchStrategy.iddfs(NavigationProblem("A", "Y", UNREACHABLE)).path is None
+    assert SearchStrategy.ida_star(NavigationProblem("A", "Y", UNREACHABLE)).path is None
+    assert time.perf_counter() - debut < 5
+
+
+def test_iterative_deepening_budgets():
+    chaine = {i: {i + 1: 1} for i in range(50)}
+    chaine[50] = {}
+    assert SearchStrategy.iddfs(NavigationProblem(0, 50, chaine), max_depth=10).path is None
+    assert SearchStrategy.ida_star(NavigationProblem(0, 50, chaine), max_bound=10).path is None
+    resultat = SearchStrategy.ida_star(NavigationProblem(0, 50, chaine), node_budget=20)
+    assert resultat.path is None and resultat.nodes_expanded <= 40
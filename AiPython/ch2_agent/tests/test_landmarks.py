@@ -0,0 +1,22 @@
+"""Heuristique ALT (repères): admissibilité et optimalité d'A* et A* bidirectionnel"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import INF, assert_optimal, dijkstra, queries, random_graph
+from landmarks import LandmarkHeuristic
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_landmark_heuristic(seed):
+    graph = random_graph(60, 2.5, seed)
+    alt = LandmarkHeuristic.build(graph, k=4, seed=seed)
+    for start, goal in queries(graph, 15, seed):
+        attendu = dijkstra(graph, start).get(goal, INF)
+        assert alt.estimate(start, goal) <= attendu
+        resultat = SearchStrategy.a_star(NavigationProblem(start, goal, graph), alt.for_goal(goal))
+        assert_optimal(resultat, graph, start, goal, attendu)
+        resultat = SearchStrategy.bidirectional_a_star(NavigationProblem(start, goal, graph),
+                                                       alt.for_goal(goal), alt.for_start(start))
+        assert_optimal(resultat, graph, start, goal, attendu)
@@ -0,0 +1,89 @@
+"""Cache de chemins: réponses optimales, suivi des versions du graphe, partage entre threads"""
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import TUPLES, assert_optimal, queries, random_graph
+from path_cache import AdmissibleHeuristics, PathCache, VersionedGraph
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+SEEDS = range(8)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_path_cache_hits_are_optimal(seed):
+    graph = VersionedGraph(random_graph(50, 2.5, seed))
+    cache = PathCache()
+    SearchStrategy.set_path_cache(cache)
+    paires = queries(graph, 40, seed)
+    for start, goal in paires + paires:
+        resultat = SearchStrategy.ucs(NavigationProblem(start, goal, graph))
+        assert_optimal(resultat, graph, start, goal)
+        assert resultat.stats is not None
+    assert cache.hits + cache.subpath_hits >= len(paires)
+
+
+def test_path_cache_follows_graph_changes():
+    graph = VersionedGraph({"A": {"B": 1, "C": 5}, "B": {"C": 1}, "C": {}})
+    SearchStrategy.set_path_cache(PathCache())
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 2
+    graph.set_edge("B", "C", 10)
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 5
+    graph.update({"D": {}})
+    graph["A"] = {"D": 1}
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).path is None
+    graph.pop("D")
+    graph.setdefault("A", {})["C"] = 3
+    graph.remove_edge("A", "C")
+    graph.set_edge("A", "C", 3)
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 3
+
+
+def test_path_cache_ignores_inadmissible_heuristics_for_subpaths():
+    graph = VersionedGraph({"A": {"B": 1, "X": 1}, "B": {"C": 1}, "X": {"C": 5}, "C": {"D": 1}, "D": {}})
+    cache = PathCache()
+    SearchStrategy.set_path_cache(cache)
+    trompeuse = {"A": 0, "B": 100, "X": 0, "C": 0, "D": 0}
+    chemin = SearchStrategy.a_star(NavigationProblem("A", "D", graph), trompeuse).path
+    assert chemin == ["A", "X", "C", "D"]
+    # Le chemin sous-optimal ne doit pas servir la requête A -> C
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 2
+    assert cache.subpath_hits == 0
+
+    exacte = AdmissibleHeuristics({"A": 3, "B": 2, "X": 2, "C": 1, "D": 0})
+    SearchStrategy.a_star(NavigationProblem("A", "D", graph), exacte)
+    resultat = SearchStrategy.ucs(NavigationProblem("B", "D", graph))
+    assert resultat.path == ["B", "C", "D"] and cache.subpath_hits == 1
+    assert resultat.stats.expanded == 0 and "cache" in resultat.stats.phases
+
+
+def test_tuple_state_names_through_path_cache():
+    graph = VersionedGraph(TUPLES)
+    SearchStrategy.set_path_cache(PathCache())
+    for _ in range(2):
+        assert SearchStrategy.ucs(NavigationProblem((0, 0), (2, 2), graph)).path == \
+            [(0, 0), (0, 1), (1, 1), (2, 2)]
+    assert SearchStrategy.ucs(NavigationProblem((0, 1), (2, 2), graph)).cost == 3
+
+
+def test_shared_between_threads():
+    # Huit threads interrogent et remplissent le même petit cache (évictions fréquentes)
+    graph = VersionedGraph(random_graph(60, 2.5, 11))
+    cache = PathCache(maxsize=16)
+    SearchStrategy.set_path_cache(cache)
+    paires = queries(graph, 200, 11)
+
+    def resoudre(decalage):
+        for start, goal in paires[decalage:] + paires[:decalage]:
+            assert_optimal(SearchStrategy.ucs(NavigationProblem(start, goal, graph)), graph, start, goal)
+            if start == goal:
+                cache.clear()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for futur in [pool.submit(resoudre, 25 * k) for k in range(8)]:
+            futur.result()
+    statistiques = cache.stats()
+    assert statistiques["size"] <= 16
+    assert statistiques["hits"] + statistiques["subpath_hits"] + statistiques["misses"] == 8 * len(paires)
@@ -0,0 +1,85 @@
+"""Frontières adressables de priority_queues: même ordre de sortie qu'un tri, decrease-key compris"""
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from path_cache import VersionedGraph
+from priority_queues import DIAL_MAX_COST, FRONTIERS, IndexedHeap, choose_frontier
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+
+def _simulate(file, rng, operations: int, monotone: bool, max_step: int):
+    """Alterne push / decrease-key / pop et compare à un dict de référence"""
+    reference = {}
+    dernier = 0
+    sorties = []
+    for _ in range(operations):
+        if reference and rng.random() < 0.4:
+            priorite, etat = file.pop()
+            assert priorite == min(reference.values())
+            assert reference.pop(etat) == priorite
+            dernier = priorite
+            sorties.append(priorite)
+            continue
+        etat = rng.randrange(60)
+        base = dernier if monotone else 0
+        priorite = base + rng.randint(0, max_step)
+        file.push(etat, priorite)
+        if priorite < reference.get(etat, float("inf")):
+            reference[etat] = priorite
+        assert len(file) == len(reference)
+        assert etat in file
+    assert sorted(file) == sorted((p, e) for e, p in reference.items())
+    while reference:
+        priorite, etat = file.pop()
+        assert reference.pop(etat) == priorite == min([priorite] + list(reference.values()))
+        sorties.append(priorite)
+    with pytest.raises(IndexError):
+        file.pop()
+    return sorties
+
+
+@pytest.mark.parametrize("name", sorted(FRONTIERS))
+@pytest.mark.parametrize("seed", range(5))
+def test_monotone_priorities(name, seed):
+    rng = random.Random(seed)
+    sorties = _simulate(FRONTIERS[name](), rng, 2000, monotone=True, max_step=DIAL_MAX_COST)
+    assert sorties == sorted(sorties)
+
+
+@pytest.mark.parametrize("name", sorted(FRONTIERS))
+def test_non_monotone_priorities(name):
+    # Heuristique non consistante: une priorité peut passer sous la dernière retirée
+    _simulate(FRONTIERS[name](), random.Random(7), 2000, monotone=False, max_step=5000)
+
+
+def test_indexed_heap_float_priorities():
+    rng = random.Random(3)
+    file = IndexedHeap()
+    valeurs = {i: rng.random() for i in range(200)}
+    for etat, priorite in valeurs.items():
+        file.push(etat, priorite + 1)
+        file.push(etat, priorite)
+    assert [file.pop()[1] for _ in range(200)] == sorted(valeurs, key=valeurs.get)
+
+
+def test_choose_frontier():
+    assert choose_frontier(None) == "heap"
+    assert choose_frontier(1) == "buckets"
+    assert choose_frontier(DIAL_MAX_COST) == "buckets"
+    assert choose_frontier(DIAL_MAX_COST + 1) == "radix"
+
+
+def test_auto_frontier_follows_graph_changes():
+    # Un coût devenu réel après une première recherche ne doit pas finir dans les seaux
+    graph = {"A": {"B": 1, "C": 3}, "B": {"C": 1}, "C": {}}
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 2
+    graph["A"]["B"] = 1.5
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", graph)).cost == 2.5
+    versionne = VersionedGraph({"A": {"B": 1, "C": 3}, "B": {"C": 1}, "C": {}})
+    assert NavigationProblem("A", "C", versionne).max_integer_cost() == 3
+    versionne.set_edge("B", "C", 0.5)
+    assert NavigationProblem("A", "C", versionne).max_integer_cost() is None
+    assert SearchStrategy.ucs(NavigationProblem("A", "C", versionne)).cost == 1.5
@@ -0,0 +1,47 @@
+"""
+Tests différentiels des noyaux UCS et A*: sur graphes aléatoires et avec
+chaque frontière, même coût que le Dijkstra de référence (conftest.dijkstra).
+"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import assert_optimal, scaled_heuristics, search_cases
+from problem_solving_agent import NavigationProblem, SearchStrategy
+
+INT_FRONTIERS = ("heap", "buckets", "radix", "indexed-heap", "auto")
+FLOAT_FRONTIERS = ("heap", "indexed-heap", "auto")
+
+
+# ----------------------------
+# UCS et A* sur toutes les frontières
+# ----------------------------
+@pytest.mark.parametrize("frontier", INT_FRONTIERS)
+def test_ucs_integer_costs(frontier):
+    for graph, start, goal, attendu in search_cases(integer=True, zero_cost=0.1):
+        resultat = SearchStrategy.ucs(NavigationProblem(start, goal, graph), frontier=frontier)
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+@pytest.mark.parametrize("frontier", FLOAT_FRONTIERS)
+def test_ucs_float_costs(frontier):
+    for graph, start, goal, attendu in search_cases(integer=False):
+        resultat = SearchStrategy.ucs(NavigationProblem(start, goal, graph), frontier=frontier)
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+@pytest.mark.parametrize("frontier", INT_FRONTIERS)
+@pytest.mark.parametrize("factor", (0, 1))
+def test_a_star_integer_costs(frontier, factor):
+    for graph, start, goal, attendu in search_cases(integer=True, zero_cost=0.1):
+        h = scaled_heuristics(graph, goal, factor)
+        resultat = SearchStrategy.a_star(NavigationProblem(start, goal, graph), h, frontier=frontier)
+        assert_optimal(resultat, graph, start, goal, attendu)
+
+
+@pytest.mark.parametrize("frontier", FLOAT_FRONTIERS)
+def test_a_star_float_costs(frontier):
+    for graph, start, goal, attendu in search_cases(integer=False):
+        h = scaled_heuristics(graph, goal, 0.5)
+        resultat = SearchStrategy.a_star(NavigationProblem(start, goal, graph), h, frontier=frontier)
+        assert_optimal(resultat, graph, start, goal, attendu)
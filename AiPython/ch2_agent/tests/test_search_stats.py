@@ -0,0 +1,38 @@
+"""SearchStats remplies par chaque noyau, et crochets on_expand / on_push cohérents avec elles"""
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from conftest import random_graph, scaled_heuristics
+from problem_solving_agent import NavigationProblem, SearchHooks, SearchStrategy
+
+
+def _run(method, graph, start, goal, observer):
+    probleme = NavigationProblem(start, goal, graph)
+    if method in ("a_star", "ida_star"):
+        return getattr(SearchStrategy, method)(probleme, scaled_heuristics(graph, goal, 1),
+                                               observer=observer)
+    return getattr(SearchStrategy, method)(probleme, observer=observer)
+
+
+def test_stats_are_filled():
+    graph = random_graph(40, 2.5, 0)
+    resultat = SearchStrategy.ucs(NavigationProblem(0, 39, graph))
+    assert resultat.stats is not None
+    assert resultat.stats.expanded == resultat.nodes_expanded
+    assert "search" in resultat.stats.phases
+
+
+@pytest.mark.parametrize("method", ("dfs", "bfs", "ucs", "a_star"))
+def test_hooks_match_stats(method):
+    graph = random_graph(40, 2.5, 0)
+    developpes, empiles = [], []
+    crochets = SearchHooks(on_expand=developpes.append, on_push=lambda etat, f: empiles.append(f))
+    resultat = _run(method, graph, 0, 39, crochets)
+    stats = resultat.stats
+    assert len(developpes) == resultat.nodes_expanded == stats.expanded
+    assert len(empiles) == resultat.nodes_generated - 1 == stats.generated - 1
+    assert stats.peak_frontier > 0 and stats.peak_memory > 0
+    assert {"search", "reconstruct"} <= set(stats.phases)
+    assert ("heuristics" in stats.phases) == (method == "a_star")
+    assert bool(stats.frontier) == (method in ("ucs", "a_star"))
@@ -0,0 +1,22 @@
+"""Arbre des plus courts chemins comparé au Dijkstra de référence"""
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+
+from conftest import INF, assert_optimal, dijkstra, random_graph
+from shortest_path_tree import ShortestPathTree
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_shortest_path_tree(seed):
+    graph = random_graph(60, 2.5, seed, integer=False)
+    source = seed
+    arbre = ShortestPathTree.build(graph, source)
+    attendu = dijkstra(graph, source)
+    for goal in graph:
+        assert_optimal(arbre.path_to(goal), graph, source, goal, attendu.get(goal, INF))
+    buts = random.Random(seed).sample(list(graph), 5)
+    plus_proche = arbre.nearest(buts)
+    assert plus_proche.cost == min(attendu.get(b, INF) for b in buts)